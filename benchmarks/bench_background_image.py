@@ -0,0 +1,120 @@
+# benchmarks/bench_background_image.py
+"""UI thread time, frame time and pixel memory of a large picker background image.
+
+Compares decoding the whole image on the UI thread and scaling it every
+paint with the tile pyramid of ui/background_image.py. Without an image
+argument an 8k character sheet stand-in is generated first.
+Runs on an offscreen Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_background_image.py [image]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets, QtCore, QtGui
+
+from core.model import PickerModel
+
+FRAMES = 20
+ZOOMS = (1.0, 0.25, 1 / 16)
+
+def make_sheet(path, size=8192):
+    image = QtGui.QImage(size, size, QtGui.QImage.Format_RGB32)
+    painter = QtGui.QPainter(image)
+    gradient = QtGui.QLinearGradient(0, 0, size, size)
+    gradient.setColorAt(0, QtGui.QColor(30, 60, 120))
+    gradient.setColorAt(1, QtGui.QColor(200, 120, 40))
+    painter.fillRect(0, 0, size, size, gradient)
+    painter.setPen(QtGui.QPen(QtCore.Qt.white, 6))
+    for i in range(0, size, 256):
+        painter.drawLine(i, 0, i, size)
+        painter.drawLine(0, i, size, i)
+    painter.end()
+    image.save(path, "JPG", 90)
+
+def frame_time(view, zoom):
+    """Average time of a full viewport paint at a view scale, centred on the image"""
+    view.resetTransform()
+    view.scale(zoom, zoom)
+    view.centerOn(QtCore.QPointF(4096, 4096))
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        view.viewport().repaint()
+    return (time.perf_counter() - start) / FRAMES
+
+class FullImageView(QtWidgets.QGraphicsView):
+    """The naive way: one pixmap of the whole image, scaled by every paint"""
+    def __init__(self, path):
+        super().__init__()
+        self.setScene(QtWidgets.QGraphicsScene(0, 0, 8192, 8192))
+        start = time.perf_counter()
+        self.pixmap = QtGui.QPixmap(path)
+        self.load_time = time.perf_counter() - start
+
+    def drawBackground(self, painter, rect):
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        painter.drawPixmap(QtCore.QRectF(self.pixmap.rect()), self.pixmap, QtCore.QRectF(self.pixmap.rect()))
+
+def wait_for(app, condition, timeout=120):
+    deadline = time.perf_counter() + timeout
+    while not condition() and time.perf_counter() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+def main():
+    from ui.canvas import PickerCanvas
+
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    work_dir = tempfile.mkdtemp(prefix="picker_bg_")
+    try:
+        path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(work_dir, "sheet.jpg")
+        if len(sys.argv) <= 1:
+            make_sheet(path)
+
+        full = FullImageView(path)
+        full.resize(1200, 800)
+        full.show()
+        app.processEvents()
+        print(f"full image   UI thread decode {full.load_time * 1000:7.1f} ms, "
+              f"{full.pixmap.width() * full.pixmap.height() * 4 / 2 ** 20:6.1f} MB of pixels")
+        for zoom in ZOOMS:
+            print(f"full image   zoom {zoom:6.4f} frame {frame_time(full, zoom) * 1000:7.2f} ms")
+        full.close()
+
+        model = PickerModel()
+        model.current_picker = model.add_picker("bench")
+        model.current_picker.background_image = path
+        canvas = PickerCanvas(types.SimpleNamespace(model=model, debug_overlay=None, symmetry_enabled=False))
+        canvas.background_image.cache_dir = os.path.join(work_dir, "tiles")
+        canvas.resize(1200, 800)
+        canvas.show()
+        app.processEvents()
+
+        start = time.perf_counter()
+        canvas.update_from_model()
+        ui_time = time.perf_counter() - start
+        wait_for(app, lambda: canvas.background_image.manifest is not None)
+        build_time = time.perf_counter() - start
+        print(f"tile pyramid UI thread {ui_time * 1000:7.1f} ms, pyramid built off-thread in {build_time:.2f} s")
+
+        tiles = canvas.background_image
+        for zoom in ZOOMS:
+            frame_time(canvas, zoom)  # Request the visible tiles
+            wait_for(app, lambda: not tiles.pending)
+            frame = frame_time(canvas, zoom)
+            pixels = sum(pixmap.width() * pixmap.height() for pixmap in tiles.tiles.values())
+            pixels += tiles.preview.width() * tiles.preview.height()
+            print(f"tile pyramid zoom {zoom:6.4f} frame {frame * 1000:7.2f} ms, level {tiles.level_for_scale(zoom)}, "
+                  f"{len(tiles.tiles)} tiles, {pixels * 4 / 2 ** 20:6.1f} MB of pixels")
+        canvas.close()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+# benchmarks/bench_canvas_items.py
+"""Scene item count and pan frame time of a large picker, by item cache and label mode.
+
+Runs on an offscreen Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_canvas_items.py [button count]
+"""
+import os
+import sys
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets, QtCore, QtGui
+
+from core.model import PickerModel, SelectButton, Vector2, Color, ShapeType
+
+SHAPES = [ShapeType.RECTANGLE, ShapeType.ROUND_RECTANGLE, ShapeType.CIRCLE, ShapeType.HEXAGON]
+FRAME_COUNT = 60
+
+def build_model(count):
+    model = PickerModel()
+    picker = model.add_picker("bench")
+    model.current_picker = picker
+    columns = 100
+    for i in range(count):
+        picker.buttons.append(SelectButton(
+            id=f"button_{i}",
+            position=Vector2((i % columns) * 30, (i // columns) * 30),
+            size=Vector2(24, 24),
+            color=Color(0.2 + 0.6 * (i % 3) / 2, 0.4, 0.6),
+            shape=SHAPES[i % len(SHAPES)],
+            label=f"c{i % 10}",
+        ))
+    return model
+
+def pan_frames(canvas):
+    """Average time to render one frame while panning across the picker"""
+    image = QtGui.QImage(canvas.viewport().size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    start = time.perf_counter()
+    for frame in range(FRAME_COUNT):
+        canvas.centerOn(QtCore.QPointF(frame * 25, frame * 10))
+        painter = QtGui.QPainter(image)
+        canvas.render(painter)
+        painter.end()
+    return (time.perf_counter() - start) / FRAME_COUNT
+
+def main():
+    from ui.canvas import PickerCanvas
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    controller = types.SimpleNamespace(model=build_model(count), debug_overlay=None, symmetry_enabled=False)
+    canvas = PickerCanvas(controller)
+    canvas.resize(1200, 800)
+    canvas.use_layers = False  # Measure item painting, not the cached button layer
+
+    label_renderer = canvas.label_renderer
+    modes = (("no cache, drawText labels", QtWidgets.QGraphicsItem.NoCache, None),
+             ("no cache, static labels", QtWidgets.QGraphicsItem.NoCache, label_renderer),
+             ("device cache", QtWidgets.QGraphicsItem.DeviceCoordinateCache, label_renderer))
+    for name, mode, renderer in modes:
+        canvas.item_cache_mode = mode
+        canvas.label_renderer = renderer
+        canvas.update_from_model()
+        pan_frames(canvas)  # Warm up item caches
+        frame_time = pan_frames(canvas)
+        print(f"{name:26} {count} buttons, {len(canvas.scene.items())} scene items, "
+              f"pan frame {frame_time * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_canvas_layers.py
+"""Repaint cost of selection changes, slider drags, zooming and panning, with and without the button layer.
+
+Frames are painted through the real viewport; the repainted area is taken
+from the paint events. Runs on an offscreen Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_canvas_layers.py [button count]
+"""
+import os
+import sys
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets, QtCore
+
+from core.model import PickerModel, SelectButton, Slider, Vector2, Color, ShapeType
+
+SHAPES = [ShapeType.RECTANGLE, ShapeType.ROUND_RECTANGLE, ShapeType.CIRCLE, ShapeType.HEXAGON]
+STEPS = 60
+
+class PaintedArea(QtCore.QObject):
+    """Sums the area of the paint events a widget receives"""
+    def __init__(self):
+        super().__init__()
+        self.pixels = 0
+
+    def eventFilter(self, obj, event):
+        if event.type() == QtCore.QEvent.Paint:
+            self.pixels += sum(rect.width() * rect.height() for rect in event.region())
+        return False
+
+def build_model(count):
+    model = PickerModel()
+    picker = model.add_picker("bench")
+    model.current_picker = picker
+    columns = 100
+    for i in range(count):
+        button_class = Slider if i % 10 == 0 else SelectButton
+        picker.buttons.append(button_class(
+            id=f"button_{i}",
+            position=Vector2((i % columns) * 30, (i // columns) * 30),
+            size=Vector2(24, 24),
+            color=Color(0.2 + 0.6 * (i % 3) / 2, 0.4, 0.6),
+            shape=SHAPES[i % len(SHAPES)],
+            label=f"c{i % 10}",
+        ))
+    return model
+
+def timed(app, area, steps, step):
+    """Average time and repainted pixels of one step followed by its repaint"""
+    area.pixels = 0
+    start = time.perf_counter()
+    for i in range(steps):
+        step(i)
+        # Scene changes reach the viewport as a queued update, flush both
+        app.processEvents()
+        app.processEvents()
+    return (time.perf_counter() - start) / steps, area.pixels / steps
+
+def measure(app, model, use_layers):
+    from ui.canvas import PickerCanvas
+
+    buttons = {button.id: button for button in model.current_picker.buttons}
+    controller = types.SimpleNamespace(model=model, debug_overlay=None, symmetry_enabled=False,
+                                       get_button_by_id=buttons.get)
+    canvas = PickerCanvas(controller)
+    canvas.use_layers = use_layers
+    canvas.resize(1200, 800)
+    canvas.show()
+    canvas.update_from_model()
+    canvas.centerOn(QtCore.QPointF(600, 400))
+    area = PaintedArea()
+    canvas.viewport().installEventFilter(area)
+    app.processEvents()
+
+    def pan(i):
+        canvas.centerOn(QtCore.QPointF(600 + (i % 30) * 20, 400 + (i % 30) * 8))
+    def select(i):
+        canvas.scene.clearSelection()
+        canvas.button_items[f"button_{(i % 30) + 1}"].setSelected(True)
+    slider = buttons["button_0"]
+    def drag(i):
+        slider.current_value = (i % 20) * 5
+        canvas.refresh_buttons([slider.id])
+
+    def repaint(i):
+        canvas.viewport().update()
+    def zoom(i):
+        canvas.zoom(i % 2 == 1)
+
+    timed(app, area, 30, pan)  # Warm up caches over the panned area
+    canvas.centerOn(QtCore.QPointF(600, 400))
+    app.processEvents()
+    # Panning last, the selected buttons and slider sit in the first view
+    results = [timed(app, area, STEPS, step) for step in (select, drag, repaint, zoom, pan)]
+    canvas.scene.clearSelection()
+    canvas.close()
+    canvas.deleteLater()
+    app.processEvents()
+    return results
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    model = build_model(count)
+    for name, use_layers in (("items paint art", False), ("button layer", True)):
+        for action, (frame_time, pixels) in zip(("select", "slider drag", "full repaint", "zoom", "pan"), measure(app, model, use_layers)):
+            print(f"{name:16} {count} buttons {action:12} {frame_time * 1000:6.2f} ms/step, "
+                  f"{pixels:8.0f} px repainted")
+
+if __name__ == "__main__":
+    main()
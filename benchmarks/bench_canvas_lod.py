@@ -0,0 +1,80 @@
+# benchmarks/bench_canvas_lod.py
+"""Frame time of a large picker at each zoom level, with and without level of detail.
+
+Runs on an offscreen Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_canvas_lod.py [button count]
+"""
+import os
+import sys
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets, QtCore, QtGui
+
+from core.model import PickerModel, SelectButton, Slider, Vector2, Color, ShapeType
+from ui.level_of_detail import LevelOfDetail
+
+SHAPES = [ShapeType.RECTANGLE, ShapeType.ROUND_RECTANGLE, ShapeType.CIRCLE, ShapeType.HEXAGON]
+FRAME_COUNT = 20
+ZOOM_LEVELS = (0, -4, -8, -20, -50)
+
+def build_model(count):
+    model = PickerModel()
+    picker = model.add_picker("bench")
+    model.current_picker = picker
+    columns = 100
+    for i in range(count):
+        button_class = Slider if i % 10 == 0 else SelectButton
+        picker.buttons.append(button_class(
+            id=f"button_{i}",
+            position=Vector2((i % columns) * 30, (i // columns) * 30),
+            size=Vector2(24, 24),
+            color=Color(0.2 + 0.6 * (i % 3) / 2, 0.4, 0.6),
+            shape=SHAPES[i % len(SHAPES)],
+            label=f"c{i % 10}",
+        ))
+    return model
+
+def frame_time(canvas):
+    """Average time to render the whole view"""
+    image = QtGui.QImage(canvas.viewport().size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+    start = time.perf_counter()
+    for _ in range(FRAME_COUNT):
+        painter = QtGui.QPainter(image)
+        canvas.render(painter)
+        painter.end()
+    return (time.perf_counter() - start) / FRAME_COUNT
+
+def zoom_to(canvas, level):
+    canvas.reset_zoom()
+    for _ in range(abs(level)):
+        canvas.zoom(level > 0)
+
+def main():
+    from ui.canvas import PickerCanvas
+
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    controller = types.SimpleNamespace(model=build_model(count), debug_overlay=None, symmetry_enabled=False)
+    canvas = PickerCanvas(controller)
+    canvas.resize(1200, 800)
+    canvas.item_cache_mode = QtWidgets.QGraphicsItem.NoCache
+    canvas.use_layers = False  # Measure item painting, not the cached button layer
+
+    # Thresholds of 0 keep every zoom level at full detail
+    modes = (("full detail", LevelOfDetail(0, 0, 0)), ("level of detail", LevelOfDetail()))
+    for name, lod in modes:
+        canvas.lod = lod
+        canvas.update_from_model()
+        canvas.centerOn(QtCore.QPointF(1500, 1500))
+        for level in ZOOM_LEVELS:
+            zoom_to(canvas, level)
+            frame_time(canvas)  # Warm up shape and label caches
+            print(f"{name:16} {count} buttons, zoom {level:4} ({canvas.lod.name:8}): "
+                  f"frame {frame_time(canvas) * 1000:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+# benchmarks/bench_canvas_profiles.py
+"""Build, pan and zoom frame times of large pickers under each canvas render profile.
+
+Frames are painted through the real viewport, so viewport update modes,
+background caching and the scene index all take part. Runs on an offscreen
+Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_canvas_profiles.py [button count ...]
+"""
+import gc
+import os
+import sys
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets, QtCore
+
+from core.model import PickerModel, SelectButton, Vector2, Color, ShapeType
+from ui.render_profile import PROFILES, profile_for_count
+
+SHAPES = [ShapeType.RECTANGLE, ShapeType.ROUND_RECTANGLE, ShapeType.CIRCLE, ShapeType.HEXAGON]
+PAN_FRAMES = 60
+ZOOM_STEPS = 12
+
+def build_model(count):
+    model = PickerModel()
+    picker = model.add_picker("bench")
+    model.current_picker = picker
+    columns = 200
+    for i in range(count):
+        picker.buttons.append(SelectButton(
+            id=f"button_{i}",
+            position=Vector2((i % columns) * 30, (i // columns) * 30),
+            size=Vector2(24, 24),
+            color=Color(0.2 + 0.6 * (i % 3) / 2, 0.4, 0.6),
+            shape=SHAPES[i % len(SHAPES)],
+            label=f"c{i % 10}",
+        ))
+    return model
+
+def pan(canvas):
+    """Average time of one painted frame while panning"""
+    start = time.perf_counter()
+    for frame in range(PAN_FRAMES):
+        canvas.centerOn(QtCore.QPointF(600 + frame * 40, 400 + frame * 16))
+        canvas.viewport().repaint()
+    return (time.perf_counter() - start) / PAN_FRAMES
+
+def zoom(canvas):
+    """Average time of one painted frame while zooming out and back in"""
+    start = time.perf_counter()
+    for step in range(ZOOM_STEPS * 2):
+        canvas.zoom(step >= ZOOM_STEPS)
+        canvas.viewport().repaint()
+    return (time.perf_counter() - start) / (ZOOM_STEPS * 2)
+
+def measure(app, model, profile):
+    from ui.canvas import PickerCanvas
+
+    controller = types.SimpleNamespace(model=model, debug_overlay=None, symmetry_enabled=False)
+    canvas = PickerCanvas(controller)
+    canvas.resize(1200, 800)
+    canvas.show()
+    app.processEvents()
+
+    start = time.perf_counter()
+    canvas.set_render_profile(profile)
+    build_time = time.perf_counter() - start
+    canvas.centerOn(QtCore.QPointF(600, 400))
+    pan(canvas)  # Warm up item caches
+    result = build_time, pan(canvas), zoom(canvas)
+
+    canvas.close()
+    canvas.deleteLater()
+    app.processEvents()
+    gc.collect()
+    return result
+
+def main():
+    counts = [int(arg) for arg in sys.argv[1:]] or [500, 10000, 50000]
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    for count in counts:
+        model = build_model(count)
+        auto = profile_for_count(count).name
+        for profile in PROFILES:
+            build_time, pan_time, zoom_time = measure(app, model, profile)
+            marker = "*" if profile.name == auto else " "
+            print(f"{count:6} buttons {profile.name:6}{marker} build {build_time * 1000:7.1f} ms, "
+                  f"pan frame {pan_time * 1000:6.2f} ms, zoom frame {zoom_time * 1000:6.2f} ms")
+    print("* profile picked automatically for that count")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# benchmarks/bench_canvas_styles.py
+"""Qt style object allocations and redraw time of the canvas, with and without pooling.
+
+Runs on an offscreen Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_canvas_styles.py [button count]
+"""
+import os
+import sys
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets
+
+from core.model import PickerModel, SelectButton, Vector2, Color, ShapeType
+from ui.canvas import PickerCanvas
+from ui.style_pool import StylePool
+
+PALETTE = [Color(0.8, 0.2, 0.2), Color(0.2, 0.4, 0.9), Color(0.9, 0.8, 0.1), Color(0.5, 0.5, 0.5)]
+SHAPES = [ShapeType.RECTANGLE, ShapeType.CIRCLE, ShapeType.DIAMOND, ShapeType.HEXAGON]
+
+class UnpooledStyles(StylePool):
+    """Builds a fresh object on every request, like the canvas used to"""
+    def _get(self, key, factory):
+        self.created += 1
+        return factory()
+
+def build_model(count):
+    model = PickerModel()
+    picker = model.add_picker("bench")
+    model.current_picker = picker
+    columns = 100
+    for i in range(count):
+        picker.buttons.append(SelectButton(
+            id=f"button_{i}",
+            position=Vector2((i % columns) * 30, (i // columns) * 30),
+            size=Vector2(24, 24),
+            color=PALETTE[i % len(PALETTE)],
+            shape=SHAPES[i % len(SHAPES)],
+            label=f"c{i % 10}",
+        ))
+    return model
+
+def measure(canvas, styles, repeats=3):
+    canvas.styles = styles
+    best = None
+    for _ in range(repeats):
+        styles.clear()
+        styles.created = 0
+        start = time.perf_counter()
+        canvas.update_from_model()
+        canvas.viewport().grab()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return styles.created, best
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    controller = types.SimpleNamespace(model=build_model(count), debug_overlay=None, symmetry_enabled=False)
+    canvas = PickerCanvas(controller)
+    canvas.resize(1200, 800)
+
+    for name, styles in (("before (unpooled)", UnpooledStyles()), ("after (pooled)", StylePool())):
+        created, elapsed = measure(canvas, styles)
+        print(f"{name:18} {count} buttons: {created:6} style objects, redraw {elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/bench_mirror_names.py
+"""Throughput of MirrorTools name mirroring on 100k synthetic names.
+
+Run from the tool directory: python benchmarks/bench_mirror_names.py
+"""
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from utils.mirror_tools import MirrorTools, DEFAULT_MIRROR_PATTERNS
+
+NAME_COUNT = 100000
+
+def synthetic_names(count, seed=0):
+    """Rig-like control names with a mix of prefixes, suffixes and words"""
+    rng = random.Random(seed)
+    parts = ["arm", "leg", "hand", "foot", "finger", "toe", "eye", "brow", "spine", "neck"]
+    names = []
+    for i in range(count):
+        base = f"{rng.choice(parts)}{i % 997}_ctrl"
+        style = rng.randrange(5)
+        if style == 0:
+            names.append(f"{rng.choice('LR')}_{base}")
+        elif style == 1:
+            names.append(f"{base}_{rng.choice('LR')}")
+        elif style == 2:
+            names.append(f"{rng.choice(['Left', 'Right'])}{base.capitalize()}")
+        elif style == 3:
+            names.append(f"{rng.choice(['left', 'right'])}_{base}")
+        else:
+            names.append(base)
+    return names
+
+def legacy_mirror_node_name(node_name):
+    """The previous implementation, one re.search/re.sub per pattern"""
+    for pattern, replacement in DEFAULT_MIRROR_PATTERNS:
+        if re.search(pattern, node_name):
+            return re.sub(pattern, replacement, node_name)
+    return node_name
+
+def timed(label, func, names):
+    start = time.perf_counter()
+    func(names)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28}{elapsed * 1000:9.1f} ms {len(names) / elapsed / 1e6:8.2f} M names/s")
+
+def main():
+    names = synthetic_names(NAME_COUNT)
+    unique_names = list(dict.fromkeys(names))
+    print(f"{len(names)} names, {len(unique_names)} unique")
+
+    timed("legacy per-pattern", lambda n: [legacy_mirror_node_name(x) for x in n], names)
+
+    tools = MirrorTools(cache_size=0)
+    timed("compiled, no memo", tools.mirror_names, names)
+
+    tools = MirrorTools()
+    timed("compiled, cold memo", tools.mirror_names, names)
+    timed("compiled, warm memo", tools.mirror_names, names)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# benchmarks/bench_pose_blend.py
+"""Time of a PoseBlender.apply tick on a 1,000 attribute pose blend, against a 5 ms budget.
+
+A drag is simulated as a slider sweep where the later ticks barely move,
+so both the full-write ticks and the epsilon-filtered ones are timed.
+"per attribute" blends and writes every attribute from the pose dicts on
+every tick, like a blend without the shared index or the epsilon filter.
+Runs outside Maya against a counting stand-in for maya.cmds, so the
+times cover the blend itself and the Python side of each setAttr call.
+Run from the tool directory: python benchmarks/bench_pose_blend.py [attribute count]
+"""
+import os
+import random
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+POSE_COUNT = 3
+ATTRS_PER_NODE = 10
+TICKS = 200
+BUDGET_MS = 5.0
+
+class CountingCmds(types.ModuleType):
+    """getAttr, setAttr and objExists over an in-memory attribute dict"""
+    def __init__(self, values):
+        super().__init__("maya.cmds")
+        self.values = dict(values)
+        self.set_count = 0
+
+    def objExists(self, name):
+        return name in self.values
+
+    def getAttr(self, attr_path):
+        return self.values[attr_path]
+
+    def setAttr(self, attr_path, value):
+        self.set_count += 1
+        self.values[attr_path] = value
+
+    def undoInfo(self, **kwargs):
+        return True
+
+    def warning(self, message):
+        pass
+
+def build_poses(rng, attr_count):
+    """Poses over attr_count attributes, the first drives all of them and the rest most"""
+    attrs = [f"attr{i}" for i in range(ATTRS_PER_NODE)]
+    nodes = [f"ctrl_{i}" for i in range(attr_count // ATTRS_PER_NODE)]
+    poses = []
+    for index in range(POSE_COUNT):
+        poses.append({node: {attr: rng.uniform(-45, 45) for attr in attrs if index == 0 or rng.random() < 0.8}
+                      for node in nodes})
+    values = {f"{node}.{attr}": 0.0 for node in nodes for attr in attrs}
+    return poses, values
+
+def sweep():
+    """Slider values of a drag, easing in so the last ticks move very little"""
+    return [1.0 - (1.0 - tick / (TICKS - 1)) ** 6 for tick in range(TICKS)]
+
+def per_attribute_blend(cmds, poses, base, value):
+    """Blend every attribute from the pose dicts and write them all"""
+    weight = value / len(poses)
+    for attr_path, base_value in base.items():
+        node, attr = attr_path.split(".", 1)
+        blended = base_value
+        for pose in poses:
+            pose_value = pose.get(node, {}).get(attr)
+            if pose_value is not None:
+                blended += weight * (pose_value - base_value)
+        cmds.setAttr(attr_path, blended)
+
+def main():
+    attr_count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    rng = random.Random(0)
+    poses, values = build_poses(rng, attr_count)
+    cmds = CountingCmds(values)
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+    sys.modules["maya"] = maya
+    sys.modules["maya.cmds"] = cmds
+
+    import numpy as np
+    from core.pose_blend import PoseBlender
+
+    blender = PoseBlender(poses)
+    blender.capture_base()
+    ticks = []
+    for value in sweep():
+        weights = np.full(POSE_COUNT, value / POSE_COUNT)
+        start = time.perf_counter()
+        blender.apply(weights)
+        ticks.append((time.perf_counter() - start) * 1000)
+    writes = cmds.set_count
+
+    cmds.set_count = 0
+    base = dict(values)
+    start = time.perf_counter()
+    for value in sweep():
+        per_attribute_blend(cmds, poses, base, value)
+    legacy_ms = (time.perf_counter() - start) * 1000 / TICKS
+
+    ticks.sort()
+    mean = sum(ticks) / len(ticks)
+    print(f"{len(blender.attr_paths)} attributes, {POSE_COUNT} poses, {TICKS} ticks")
+    print(f"PoseBlender:   mean {mean:.3f} ms, p95 {ticks[int(TICKS * 0.95)]:.3f} ms, "
+          f"max {ticks[-1]:.3f} ms, {writes / TICKS:.0f} writes/tick")
+    print(f"per attribute: mean {legacy_ms:.3f} ms, {cmds.set_count / TICKS:.0f} writes/tick")
+    print(f"budget {BUDGET_MS} ms per tick at p95: {'ok' if ticks[int(TICKS * 0.95)] < BUDGET_MS else 'over'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+# benchmarks/bench_selection_sets.py
+"""Maya command count of select button clicks, per node vs through an objectSet.
+
+Runs outside Maya against a counting stand-in for maya.cmds.
+Run from the tool directory: python benchmarks/bench_selection_sets.py
+"""
+import os
+import sys
+import types
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+TARGET_COUNT = 500
+CLICK_COUNT = 20
+
+class CountingCmds(types.ModuleType):
+    """Just enough of maya.cmds to run selection code, counting every call"""
+    def __init__(self, nodes):
+        super().__init__("maya.cmds")
+        self.nodes = set(nodes)
+        self.object_sets = {}
+        self.attributes = {}
+        self.selection = []
+        self.calls = Counter()
+
+    def objExists(self, name):
+        self.calls["objExists"] += 1
+        return name in self.nodes or name in self.object_sets or name in self.attributes
+
+    def addAttr(self, name, longName=None, dataType=None):
+        self.calls["addAttr"] += 1
+        self.attributes[f"{name}.{longName}"] = ""
+
+    def setAttr(self, attr_path, value, type=None):
+        self.calls["setAttr"] += 1
+        self.attributes[attr_path] = value
+
+    def getAttr(self, attr_path):
+        self.calls["getAttr"] += 1
+        return self.attributes[attr_path]
+
+    def ls(self, names, type=None):
+        self.calls["ls"] += 1
+        if isinstance(names, str):
+            prefix = names.rstrip("*")
+            return [name for name in self.object_sets if name.startswith(prefix)]
+        return [name for name in names if name in self.nodes]
+
+    def select(self, names=None, add=False, replace=False, clear=False):
+        self.calls["select"] += 1
+        if clear:
+            self.selection = []
+        elif names in self.object_sets:
+            self.selection = list(self.object_sets[names])
+        elif add:
+            self.selection.append(names)
+
+    def sets(self, nodes=None, name=None, add=None, clear=None, empty=False):
+        self.calls["sets"] += 1
+        if clear:
+            self.object_sets[clear] = []
+        elif add:
+            self.object_sets[add].extend(nodes)
+        else:
+            self.object_sets[name] = list(nodes or [])
+            return name
+
+    def delete(self, names):
+        self.calls["delete"] += 1
+        for name in names:
+            self.object_sets.pop(name, None)
+
+    def undoInfo(self, **kwargs):
+        return True
+
+    def warning(self, message):
+        pass
+
+def legacy_select(cmds, button):
+    """The per-node click, one objExists and one select per target"""
+    cmds.select(clear=True)
+    for node in button.target_nodes:
+        if cmds.objExists(node):
+            cmds.select(node, add=True)
+
+def main():
+    targets = [f"ctrl_{i}" for i in range(TARGET_COUNT)]
+    cmds = CountingCmds(targets)
+    maya = types.ModuleType("maya")
+    maya.cmds = cmds
+    sys.modules["maya"] = maya
+    sys.modules["maya.cmds"] = cmds
+
+    from core.model import SelectButton
+    from core.selection_sets import SelectionSetManager
+
+    button = SelectButton(id="body", target_nodes=targets, use_selection_set=True)
+
+    for _ in range(CLICK_COUNT):
+        legacy_select(cmds, button)
+    legacy_calls, legacy_selection = sum(cmds.calls.values()), list(cmds.selection)
+
+    cmds.calls.clear()
+    manager = SelectionSetManager()
+    for _ in range(CLICK_COUNT):
+        manager.select(button, "picker")
+    set_calls = sum(cmds.calls.values())
+
+    assert cmds.selection == legacy_selection
+    print(f"{CLICK_COUNT} clicks on a {TARGET_COUNT} target select button")
+    print(f"per node:    {legacy_calls} commands")
+    print(f"objectSet:   {set_calls} commands {dict(cmds.calls)}")
+
+if __name__ == "__main__":
+    main()
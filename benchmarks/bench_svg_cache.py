@@ -0,0 +1,154 @@
+# benchmarks/bench_svg_cache.py
+"""Cost of painting SVG-skinned buttons with and without the SVGUtils render cache.
+
+"uncached" parses and renders the SVG on every paint, like SVGUtils did
+before it cached anything. Frames are painted through the real viewport
+with the default canvas setup, where skins are rendered on the first
+frame and again at every zoom step; "repaint" turns off the button layer
+and item caching so every frame paints every item.
+Runs on an offscreen Qt platform, no Maya needed.
+Run from the tool directory: python benchmarks/bench_svg_cache.py [button count]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import types
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from PySide2 import QtWidgets, QtCore, QtGui, QtSvg
+
+from core.model import PickerModel, SelectButton, Vector2, Color
+from utils.svg_utils import SVGUtils
+
+FRAMES = 20
+SKINS = 8
+
+def make_svg(index):
+    """A skin with a gradient and a few dozen curves, like a drawn control icon"""
+    paths = "".join(
+        f'<path d="M{10 + i * 3} {50 + (i * 7 + index) % 30} C 30 {i * 4}, 70 {100 - i * 4}, {90 - i} {50}" '
+        f'stroke="#{(i * 40 + index * 30) % 256:02x}8040" stroke-width="2" fill="none"/>'
+        for i in range(30)
+    )
+    return (
+        '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100" viewBox="0 0 100 100">'
+        '<defs><radialGradient id="g"><stop offset="0" stop-color="#fff"/><stop offset="1" stop-color="#246"/></radialGradient></defs>'
+        f'<circle cx="50" cy="50" r="48" fill="url(#g)"/>{paths}</svg>'
+    )
+
+class UncachedSVG(SVGUtils):
+    """The old render path: load and render on every call"""
+    def render_svg(self, file_path, size, device_pixel_ratio=1.0):
+        renderer = QtSvg.QSvgRenderer()
+        if not renderer.load(file_path):
+            return None
+        pixmap = QtGui.QPixmap(int(size.width() * device_pixel_ratio), int(size.height() * device_pixel_ratio))
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        renderer.render(painter)
+        painter.end()
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+        return pixmap
+
+def build_model(count, paths):
+    model = PickerModel()
+    picker = model.add_picker("bench")
+    model.current_picker = picker
+    columns = 40
+    for i in range(count):
+        button = SelectButton(
+            id=f"button_{i}",
+            position=Vector2((i % columns) * 44, (i // columns) * 44),
+            size=Vector2(40, 40),
+            color=Color(0.4, 0.4, 0.6),
+        )
+        button.svg_path = paths[i % len(paths)]
+        picker.buttons.append(button)
+    return model
+
+def frame_time(app, canvas, step=None):
+    start = time.perf_counter()
+    for i in range(FRAMES):
+        if step:
+            step(i)
+        canvas.viewport().repaint()
+    app.processEvents()
+    return (time.perf_counter() - start) / FRAMES
+
+def zoom_step(canvas):
+    def step(i):
+        factor = 1.25 if i % 4 < 2 else 0.8
+        canvas.scale(factor, factor)
+        canvas.lod.update(canvas.transform().m11())
+    return step
+
+def run(app, count, paths, svg_utils):
+    """First frame, zoom step and plain repaint times"""
+    canvas = make_canvas(app, count, paths, svg_utils)
+    start = time.perf_counter()
+    canvas.viewport().repaint()
+    first = time.perf_counter() - start
+    zoom = frame_time(app, canvas, zoom_step(canvas))
+    canvas.close()
+
+    canvas = make_canvas(app, count, paths, svg_utils, cached=False)
+    canvas.viewport().repaint()
+    repaint = frame_time(app, canvas)
+    canvas.close()
+    return first, zoom, repaint
+
+def make_canvas(app, count, paths, svg_utils, cached=True):
+    controller = types.SimpleNamespace(model=build_model(count, paths), debug_overlay=None,
+                                       symmetry_enabled=False, svg_utils=svg_utils)
+    from ui.canvas import PickerCanvas
+    canvas = PickerCanvas(controller)
+    if not cached:
+        canvas.use_layers = False
+        canvas.item_cache_mode = QtWidgets.QGraphicsItem.NoCache
+    canvas.resize(1200, 800)
+    canvas.show()
+    app.processEvents()
+    canvas.update_from_model()
+    canvas.fitInView(canvas.scene.itemsBoundingRect(), QtCore.Qt.KeepAspectRatio)
+    canvas.lod.update(canvas.transform().m11())
+    return canvas
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 400
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication(sys.argv)
+    work = tempfile.mkdtemp()
+    try:
+        paths = []
+        for i in range(SKINS):
+            path = os.path.join(work, f"skin_{i}.svg")
+            with open(path, "w") as f:
+                f.write(make_svg(i))
+            paths.append(path)
+        cache_dir = os.path.join(work, "png_cache")
+
+        print(f"{count} SVG buttons, {SKINS} distinct skins, {FRAMES} frames")
+        print(f"{'mode':<22}{'first frame ms':>16}{'zoom step ms':>14}{'repaint ms':>12}")
+        for name, svg_utils in (
+            ("uncached", UncachedSVG()),
+            ("memory cache", SVGUtils()),
+            ("disk cache, cold", SVGUtils(cache_dir=cache_dir)),
+            ("disk cache, warm", SVGUtils(cache_dir=cache_dir)),
+        ):
+            first, zoom, repaint = run(app, count, paths, svg_utils)
+            print(f"{name:<22}{first * 1000:>16.1f}{zoom * 1000:>14.2f}{repaint * 1000:>12.2f}")
+
+        # Embedded payloads: every button carries its own copy of the same skin
+        svg_utils = SVGUtils()
+        start = time.perf_counter()
+        keys = {svg_utils.add_svg_data(make_svg(i % SKINS)) for i in range(count)}
+        elapsed = time.perf_counter() - start
+        print(f"embedded: {count} payloads -> {len(keys)} renderers in {elapsed * 1000:.1f} ms")
+    finally:
+        shutil.rmtree(work, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
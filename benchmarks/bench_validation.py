@@ -0,0 +1,76 @@
+# benchmarks/bench_validation.py
+"""Time of a missing-target validation over 10k targets against a stand-in scene.
+
+Runs outside Maya with a minimal maya.cmds replacement.
+Run from the tool directory: python benchmarks/bench_validation.py
+"""
+import os
+import random
+import sys
+import time
+import types
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+TARGET_COUNT = 10000
+MISSING_RATIO = 0.02
+
+class SceneCmds(types.ModuleType):
+    """ls and objExists over an in-memory set of nodes and attributes"""
+    def __init__(self, names):
+        super().__init__("maya.cmds")
+        self.names = set(names)
+        self.call_count = 0
+
+    def ls(self, names, long=False):
+        self.call_count += 1
+        found = [name for name in names if name in self.names]
+        return [f"|rig|{name}" for name in found] if long else found
+
+    def objExists(self, name):
+        self.call_count += 1
+        return name in self.names
+
+def build_picker(rng):
+    """A picker of select, pose and multi-target attribute buttons"""
+    from core.model import Picker, SelectButton, PoseButton, AttributeButton
+
+    picker = Picker(name="stress")
+    nodes = [f"ctrl_{i}" for i in range(TARGET_COUNT)]
+    for i in range(0, TARGET_COUNT, 10):
+        picker.buttons.append(SelectButton(id=f"select_{i}", target_nodes=nodes[i:i + 10]))
+    for i in range(0, TARGET_COUNT, 20):
+        pose_data = {node: {"translateX": 0.0, "rotateY": 0.0} for node in nodes[i:i + 20]}
+        picker.buttons.append(PoseButton(id=f"pose_{i}", pose_data=pose_data))
+    for i in range(0, TARGET_COUNT, 50):
+        picker.buttons.append(AttributeButton(
+            id=f"attr_{i}", target_node=nodes[i], target_nodes=nodes[i + 1:i + 50], attribute="ikFk"
+        ))
+
+    scene = set()
+    for node in nodes:
+        if rng.random() > MISSING_RATIO:
+            scene.update((node, f"{node}.translateX", f"{node}.rotateY", f"{node}.ikFk"))
+    return picker, scene
+
+def main():
+    rng = random.Random(0)
+    sys.modules["maya"] = types.ModuleType("maya")
+    sys.modules["maya.cmds"] = SceneCmds(())
+
+    picker, scene = build_picker(rng)
+    cmds = SceneCmds(scene)
+    sys.modules["maya"].cmds = cmds
+    sys.modules["maya.cmds"] = cmds
+
+    from core.validation import validate_pickers
+
+    start = time.perf_counter()
+    report = validate_pickers([picker])
+    elapsed = time.perf_counter() - start
+
+    print(f"{report.node_count} nodes, {report.attribute_count} attributes, {len(report.buttons)} buttons")
+    print(f"{len(report.broken)} broken buttons found with {cmds.call_count} scene queries in {elapsed * 1000:.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# core/attribute_burst.py
+import time
+import maya.cmds as cmds
+from utils.undo import MayaUndoChunk, MayaUndoSuspended
+
+class AttributeBurst:
+    """Merge rapid nudges and toggles into one read-modify-write per attribute.
+
+    Each attribute is read once when a burst starts, and the operations are
+    accumulated in memory. While events keep arriving the latest values are
+    written at most once per `window` with undo suspended. Once `quiet_time`
+    passes without events the burst is committed as one undo chunk. It is
+    longer than the OS key-repeat delay (250-500 ms), so the gap between
+    the first press of a held hotkey and its repeats stays in one burst.
+    """
+    def __init__(self, schedule=None, window: float = 0.05, quiet_time: float = 0.6, clock=time.perf_counter):
+        self.schedule = schedule or self._schedule_timer
+        self.window = window
+        self.quiet_time = quiet_time
+        self.clock = clock
+        self.last_event = None
+        self.start_values = {}  # attr path: value when the burst started
+        self.values = {}  # attr path: accumulated value
+        self.dirty = set()  # attr paths changed since the last write
+        self.event_count = 0
+        self._pending = False
+
+    def _schedule_timer(self, func, delay):
+        from PySide2 import QtCore
+        QtCore.QTimer.singleShot(int(delay * 1000), func)
+
+    def nudge(self, attr_paths, amount: float):
+        """Add amount to each attribute"""
+        for attr_path in attr_paths:
+            self.values[attr_path] = self._value(attr_path) + amount
+        self._changed(attr_paths)
+
+    def toggle(self, attr_paths):
+        """Flip each attribute"""
+        for attr_path in attr_paths:
+            self.values[attr_path] = not self._value(attr_path)
+        self._changed(attr_paths)
+
+    def _value(self, attr_path):
+        if attr_path not in self.values:
+            value = cmds.getAttr(attr_path)
+            self.start_values[attr_path] = value
+            self.values[attr_path] = value
+        return self.values[attr_path]
+
+    def _changed(self, attr_paths):
+        self.dirty.update(attr_paths)
+        self.event_count += 1
+        self.last_event = self.clock()
+        if not self._pending:
+            self._pending = True
+            self.schedule(self.flush, self.window)
+
+    def flush(self):
+        """Show the latest values, or commit once the burst went quiet"""
+        self._pending = False
+        if self.dirty:
+            with MayaUndoSuspended():
+                self._write(self.dirty)
+            self.dirty = set()
+        elif not self.values:
+            # Already committed
+            return
+        else:
+            quiet = self.clock() - self.last_event
+            if quiet >= self.quiet_time:
+                self.commit()
+                return
+
+        self._pending = True
+        self.schedule(self.flush, self.window)
+
+    def commit(self):
+        """Write the accumulated values as one undo step and end the burst"""
+        if self.dirty:
+            with MayaUndoSuspended():
+                self._write(self.dirty)
+
+        changed = [p for p in self.values if self.values[p] != self.start_values[p]]
+        if changed:
+            with MayaUndoSuspended():
+                for attr_path in changed:
+                    cmds.setAttr(attr_path, self.start_values[attr_path])
+            with MayaUndoChunk():
+                self._write(changed)
+            print(f"Applied {self.event_count} attribute operations to {len(changed)} attributes")
+
+        self.start_values.clear()
+        self.values.clear()
+        self.dirty = set()
+        self.event_count = 0
+
+    def _write(self, attr_paths):
+        for attr_path in attr_paths:
+            try:
+                cmds.setAttr(attr_path, self.values[attr_path])
+            except Exception as e:
+                cmds.warning(f"Could not set {attr_path}: {str(e)}")
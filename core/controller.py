@@ -1,7 +1,17 @@
 # core/controller.py
 import maya.cmds as cmds
-from .model import PickerModel, SelectButton, ScriptButton, PoseButton, AttributeButton, Slider, Checkbox, RadiusButton, TextButton, Vector2, Color, ButtonType, ShapeType
-from utils.undo import UndoRedoManager  # Add this import
+from .model import PickerModel, SelectButton, ScriptButton, PoseButton, AttributeButton, Slider, Checkbox, RadiusButton, TextButton, PoseBlendSlider, Vector2, Color, ButtonType, ShapeType, attribute_targets
+from .pose_blend import PoseBlender, blend_weights
+from .pose_capture import PoseCapture
+from .pose_library import PoseLibrary
+from .pose_mirror import PoseMirror, split_namespace
+from .node_index import NodeButtonIndex, short_name, renamed_references
+from .slider_drag import SliderDragSession
+from .attribute_burst import AttributeBurst
+from .selection_sets import SelectionSetManager, picker_owner
+from .hierarchy_cache import DescendantCache
+from .validation import validate_pickers
+from utils.undo import UndoRedoManager, MayaUndoChunk, MayaUndoSuspended  # Add this import
 
 class PickerController:
     def __init__(self):
@@ -12,6 +22,24 @@ class PickerController:
         self.svg_utils = None
         self.hotkey_manager = None
         self.organizer = None
+        self.pose_blenders = {}  # button_id: PoseBlender for blends in progress
+        self.pose_capture = PoseCapture()
+        self.pose_libraries = {}  # library path: open PoseLibrary
+        self.pose_mirror = None
+        self.symmetry_enabled = False
+        self.symmetry = None  # SymmetryPairs for the current picker
+        self._symmetry_dirty = True
+        self.node_index = NodeButtonIndex()  # node: ids of buttons targeting it
+        self._node_index_dirty = True
+        self.picker_node_indexes = {}  # picker name: NodeButtonIndex of pickers not shown
+        self.selection_sync = None
+        self.attribute_sync = None  # Keeps widget buttons in sync with the scene
+        self.rename_tracker = None
+        self.slider_drags = {}  # button_id: SliderDragSession for drags in progress
+        self.debug_overlay = None
+        self.attribute_burst = AttributeBurst()  # Merges held nudge/toggle hotkeys
+        self.selection_sets = SelectionSetManager()  # objectSets backing select buttons
+        self.descendant_cache = DescendantCache()  # Controls below hierarchical select targets
         
     def create_new_picker(self, name: str):
         return self.model.add_picker(name)
@@ -19,6 +47,7 @@ class PickerController:
     def set_current_picker(self, name: str):
         if name in self.model.pickers:
             self.model.current_picker = self.model.pickers[name]
+            self._invalidate_button_indexes()
             if self.view:
                 self.view.update_from_model()
     
@@ -72,10 +101,14 @@ class PickerController:
             button = RadiusButton(**kwargs)
         elif button_type == "text":
             button = TextButton(**kwargs)
+        elif button_type == "pose_blend":
+            button = PoseBlendSlider(**kwargs)
         else:
             return None
             
         self.model.current_picker.buttons.append(button)
+        self._symmetry_dirty = True
+        self._reindex_button(button)
         
         # Store new state for redo
         new_buttons = copy.deepcopy(self.model.current_picker.buttons)
@@ -91,13 +124,214 @@ class PickerController:
         
         return button
 
+    def replace_buttons(self, buttons, action_name: str = "Edit Buttons"):
+        """Replace the current picker's buttons list as one undoable edit"""
+        if not self.model.current_picker:
+            return
+            
+        import copy
+        old_buttons = copy.deepcopy(self.model.current_picker.buttons)
+        new_buttons = copy.deepcopy(buttons)
+        self._set_buttons(buttons)
+        
+        if self.undo_manager:
+            self.undo_manager.begin_action(action_name)
+            self.undo_manager.add_operation(
+                lambda b=old_buttons: self._set_buttons(copy.deepcopy(b)),
+                lambda b=new_buttons: self._set_buttons(copy.deepcopy(b))
+            )
+            self.undo_manager.end_action()
+
     def _set_buttons(self, buttons):
         """Set the current picker's buttons list"""
         if self.model.current_picker:
             self.model.current_picker.buttons = buttons
+            self._invalidate_button_indexes()
             if self.view:
                 self.view.update_from_model()
     
+    def _invalidate_button_indexes(self):
+        """Mark indexes over the current picker's buttons for a rebuild"""
+        self._symmetry_dirty = True
+        self._node_index_dirty = True
+        self.picker_node_indexes.clear()
+        if self.attribute_sync:
+            self.attribute_sync.set_buttons(self.model.current_picker.buttons if self.model.current_picker else [])
+
+    def _reindex_button(self, button):
+        """Update the node index for one added or retargeted button"""
+        if not self._node_index_dirty:
+            self.node_index.update_button(button)
+        if self.attribute_sync:
+            self.attribute_sync.update_button(button)
+
+    def get_node_index(self):
+        """Get the node to button index of the current picker"""
+        if self._node_index_dirty:
+            self.node_index.build(self.model.current_picker.buttons if self.model.current_picker else [])
+            self._node_index_dirty = False
+        return self.node_index
+
+    def _picker_node_index(self, picker):
+        """Get the node to button index of any picker"""
+        if picker is self.model.current_picker:
+            return self.get_node_index()
+        index = self.picker_node_indexes.get(picker.name)
+        if index is None:
+            index = NodeButtonIndex()
+            index.build(picker.buttons)
+            self.picker_node_indexes[picker.name] = index
+        return index
+
+    def apply_rename_map(self, rename_map, action_name: str = "Rename Targets"):
+        """Rewrite references to renamed nodes in every picker as one undoable edit.
+        
+        rename_map maps old node names to new ones. Only the buttons the node
+        indexes list for the old names are touched. Returns the ids of the
+        changed buttons.
+        """
+        import copy
+        rename_map = {short_name(old): short_name(new) for old, new in rename_map.items() if old != new}
+        if not rename_map:
+            return set()
+            
+        edits = []  # (picker name, button, attribute, old value, new value)
+        for picker in self.model.pickers.values():
+            index = self._picker_node_index(picker)
+            for button_id in index.buttons_for_nodes(rename_map):
+                button = index.buttons[button_id]
+                for attr, value in renamed_references(button, rename_map).items():
+                    edits.append((picker.name, button, attr, copy.deepcopy(getattr(button, attr)), copy.deepcopy(value)))
+                    setattr(button, attr, value)
+                if picker is self.model.current_picker:
+                    self._reindex_button(button)
+                else:
+                    index.update_button(button)
+                    
+        if edits:
+            self._symmetry_dirty = True
+        if edits and self.undo_manager:
+            self.undo_manager.begin_action(action_name)
+            self.undo_manager.add_operation(
+                lambda v=[(p, b.id, a, old) for p, b, a, old, _ in reversed(edits)]: self._apply_button_values(v),
+                lambda v=[(p, b.id, a, new) for p, b, a, _, new in edits]: self._apply_button_values(v)
+            )
+            self.undo_manager.end_action()
+            
+        return {button.id for _, button, _, _, _ in edits}
+
+    def set_symmetry(self, enabled: bool, axis: str = "X", center=None):
+        """Turn symmetric editing on or off for the current picker"""
+        self.symmetry_enabled = enabled
+        if not enabled:
+            return
+            
+        from utils.mirror_tools import MirrorTools, SymmetryPairs
+        if center is None:
+            center = self._picker_center()
+        self.symmetry = SymmetryPairs(self.mirror_tools or MirrorTools(), axis, center)
+        self._symmetry_dirty = True
+
+    def _picker_center(self):
+        """Center of the bounding box of all buttons in the current picker"""
+        buttons = self.model.current_picker.buttons if self.model.current_picker else []
+        if not buttons:
+            return (0.0, 0.0)
+            
+        min_x = min(button.position.x for button in buttons)
+        max_x = max(button.position.x + button.size.x for button in buttons)
+        min_y = min(button.position.y for button in buttons)
+        max_y = max(button.position.y + button.size.y for button in buttons)
+        return ((min_x + max_x) / 2, (min_y + max_y) / 2)
+
+    def get_counterpart(self, button_id: str):
+        """Get the mirror counterpart of a button while symmetry is enabled"""
+        if not self.symmetry_enabled or not self.symmetry or not self.model.current_picker:
+            return None
+            
+        if self._symmetry_dirty:
+            self.symmetry.build(self.model.current_picker.buttons)
+            self._symmetry_dirty = False
+            
+        return self.symmetry.counterpart(button_id)
+
+    def edit_buttons(self, changes, action_name: str = "Edit Button"):
+        """Apply {button_id: {attribute: value}} changes as one undoable edit.
+        
+        With symmetry enabled, geometry and style changes are mirrored onto
+        each edited button's counterpart in the same transaction. Returns the
+        ids of every button that changed.
+        """
+        import copy
+        buttons = {button.id: button for button in self.model.current_picker.buttons} if self.model.current_picker else {}
+        
+        edits = []  # (button, attribute, old value, new value)
+        for button_id, attrs in changes.items():
+            button = buttons.get(button_id)
+            if not button:
+                continue
+                
+            attrs = {attr: value for attr, value in attrs.items() if getattr(button, attr) != value}
+            for attr, value in attrs.items():
+                edits.append((button, attr, copy.deepcopy(getattr(button, attr)), copy.deepcopy(value)))
+                setattr(button, attr, value)
+                
+            counterpart = self.get_counterpart(button_id)
+            if attrs and counterpart and counterpart.id not in changes:
+                for attr, value in self._symmetric_changes(button, attrs).items():
+                    edits.append((counterpart, attr, copy.deepcopy(getattr(counterpart, attr)), copy.deepcopy(value)))
+                    setattr(counterpart, attr, value)
+                    
+        # Only target changes move buttons in the node index or change their pairing
+        retargeted = {button.id: button for button, attr, _, _ in edits if attr in ("target_nodes", "target_node", "pose_data")}
+        if retargeted:
+            self._symmetry_dirty = True
+            for button in retargeted.values():
+                self._reindex_button(button)
+            
+        # Add to undo stack
+        if edits and self.undo_manager:
+            picker_name = self.model.current_picker.name
+            self.undo_manager.begin_action(action_name)
+            self.undo_manager.add_operation(
+                lambda v=[(picker_name, b.id, a, old) for b, a, old, _ in reversed(edits)]: self._apply_button_values(v),
+                lambda v=[(picker_name, b.id, a, new) for b, a, _, new in edits]: self._apply_button_values(v)
+            )
+            self.undo_manager.end_action()
+            
+        return {button.id for button, _, _, _ in edits}
+
+    def _symmetric_changes(self, button, attrs):
+        """Changes to apply to a button's counterpart for the given edit"""
+        import copy
+        changes = {}
+        for attr in ("size", "color", "shape", "corner_radius", "sides"):
+            if attr in attrs:
+                changes[attr] = copy.deepcopy(getattr(button, attr))
+        if "position" in attrs or "size" in attrs:
+            changes["position"] = self.symmetry.mirrored_position(button)
+        return changes
+
+    def _apply_button_values(self, values):
+        """Set (picker name, button id, attribute, value) entries, used by undo and redo.
+        
+        Buttons are looked up by id when this runs: undoing an add, delete
+        or mirror swaps in copies of the buttons, so the objects an edit
+        touched may no longer be in the picker.
+        """
+        import copy
+        buttons = {}  # picker name: {button id: button}
+        for picker_name, button_id, attr, value in values:
+            if picker_name not in buttons:
+                picker = self.model.pickers.get(picker_name)
+                buttons[picker_name] = {button.id: button for button in picker.buttons} if picker else {}
+            button = buttons[picker_name].get(button_id)
+            if button:
+                setattr(button, attr, copy.deepcopy(value))
+        self._invalidate_button_indexes()
+        if self.view:
+            self.view.update_from_model()
+
     def execute_button(self, button_id: str):
         if not self.model.current_picker:
             return
@@ -120,6 +354,8 @@ class PickerController:
             self._execute_checkbox(button)
         elif isinstance(button, RadiusButton):
             self._execute_radius_button(button)
+        elif isinstance(button, PoseBlendSlider):
+            self._execute_pose_blend_slider(button)
         # Text buttons don't need execution
     
     def _execute_select_button(self, button: SelectButton):
@@ -127,6 +363,14 @@ class PickerController:
             cmds.warning(f"Select button '{button.label}' has no target nodes")
             return
             
+        if button.hierarchical:
+            self._select_hierarchy(button)
+            return
+            
+        if button.use_selection_set:
+            self.selection_sets.select(button, self._selection_set_owner(self.model.current_picker))
+            return
+            
         # Clear selection first
         cmds.select(clear=True)
         
@@ -140,6 +384,18 @@ class PickerController:
         if not selected_any:
             cmds.warning(f"No valid target nodes found for button '{button.label}'")
 
+    def _select_hierarchy(self, button: SelectButton):
+        """Select the targets of a button and the controls below them"""
+        roots = cmds.ls(button.target_nodes) or []
+        if not roots:
+            cmds.warning(f"No valid target nodes found for button '{button.label}'")
+            return
+            
+        nodes = list(roots)
+        for root in roots:
+            nodes.extend(self.descendant_cache.descendants(root))
+        cmds.select(list(dict.fromkeys(nodes)), replace=True)
+
     def _execute_script_button(self, button: ScriptButton):
         if not button.script:
             cmds.warning(f"Script button '{button.label}' has no script")
@@ -156,14 +412,24 @@ class PickerController:
             cmds.warning(f"Script execution error in button '{button.label}': {str(e)}")
 
     def _execute_pose_button(self, button: PoseButton):
-        if not button.target_nodes:
+        pose_data = self._pose_values(button)
+        # Library poses drive every node they store
+        target_nodes = button.target_nodes or list(pose_data)
+        if not target_nodes:
             cmds.warning(f"Pose button '{button.label}' has no target nodes")
             return
             
+        if self._apply_pose_data(pose_data, target_nodes):
+            print(f"Applied pose from button '{button.label}'")
+        else:
+            cmds.warning(f"Could not apply pose from button '{button.label}'")
+
+    def _apply_pose_data(self, pose_data, target_nodes):
+        """Set pose values on the target nodes, returns True if anything was set"""
         applied_any = False
-        for node in button.target_nodes:
-            if cmds.objExists(node) and node in button.pose_data:
-                for attr, value in button.pose_data[node].items():
+        for node in target_nodes:
+            if cmds.objExists(node) and node in pose_data:
+                for attr, value in pose_data[node].items():
                     attr_path = f"{node}.{attr}"
                     if cmds.objExists(attr_path):
                         try:
@@ -171,38 +437,49 @@ class PickerController:
                             applied_any = True
                         except Exception as e:
                             cmds.warning(f"Could not set {attr_path}: {str(e)}")
-        
-        if applied_any:
-            print(f"Applied pose from button '{button.label}'")
-        else:
-            cmds.warning(f"Could not apply pose from button '{button.label}'")
+        return applied_any
 
     def _execute_attribute_button(self, button: AttributeButton):
-        if not button.target_node or not button.attribute:
-            cmds.warning(f"Attribute button '{button.label}' is missing target or attribute")
-            return
-            
-        attr_path = f"{button.target_node}.{button.attribute}"
-        if not cmds.objExists(attr_path):
-            cmds.warning(f"Attribute button '{button.label}': {attr_path} does not exist")
+        attr_paths = self._batch_attr_paths(button, "Attribute")
+        if not attr_paths:
             return
             
         try:
             if button.operation == "set":
-                cmds.setAttr(attr_path, button.value)
-                print(f"Set {attr_path} to {button.value}")
+                # Finish pending nudges first so they cannot overwrite the set value
+                if any(attr_path in self.attribute_burst.values for attr_path in attr_paths):
+                    self.attribute_burst.commit()
+                self._set_attr_batch(attr_paths, button.value)
+                print(f"Set {button.attribute} on {len(attr_paths)} nodes to {button.value}")
             elif button.operation == "toggle":
-                current = cmds.getAttr(attr_path)
-                cmds.setAttr(attr_path, not current)
-                print(f"Toggled {attr_path} from {current} to {not current}")
+                self.attribute_burst.toggle(attr_paths)
             elif button.operation == "nudge":
-                current = cmds.getAttr(attr_path)
-                new_value = current + button.nudge_amount
-                cmds.setAttr(attr_path, new_value)
-                print(f"Nudged {attr_path} from {current} to {new_value}")
+                self.attribute_burst.nudge(attr_paths, button.nudge_amount)
         except Exception as e:
             cmds.warning(f"Attribute operation failed for button '{button.label}': {str(e)}")
 
+    def _batch_attr_paths(self, button, kind: str):
+        """Attribute paths of every existing target, checked in one pass"""
+        targets = attribute_targets(button)
+        if not targets or not button.attribute:
+            cmds.warning(f"{kind} button '{button.label}' is missing target or attribute")
+            return []
+            
+        existing = {short_name(node) for node in cmds.ls(targets) or []}
+        missing = [node for node in targets if short_name(node) not in existing]
+        if missing:
+            cmds.warning(f"{kind} button '{button.label}': {', '.join(missing)} not found")
+        return [f"{node}.{button.attribute}" for node in targets if short_name(node) in existing]
+
+    def _set_attr_batch(self, attr_paths, value):
+        """Set one value on many attributes as a single undo step"""
+        with MayaUndoChunk():
+            for attr_path in attr_paths:
+                try:
+                    cmds.setAttr(attr_path, value)
+                except Exception as e:
+                    cmds.warning(f"Could not set {attr_path}: {str(e)}")
+
     def _execute_slider(self, button: Slider):
         # Sliders are typically controlled through UI, but we can set values if needed
         if button.target_node and button.attribute:
@@ -222,45 +499,334 @@ class PickerController:
                     cmds.warning(f"Slider operation failed: {str(e)}")
 
     def _execute_checkbox(self, button: Checkbox):
-        if not button.target_node or not button.attribute:
-            cmds.warning(f"Checkbox button '{button.label}' is missing target or attribute")
-            return
-            
-        attr_path = f"{button.target_node}.{button.attribute}"
-        if not cmds.objExists(attr_path):
-            cmds.warning(f"Checkbox button '{button.label}': {attr_path} does not exist")
+        attr_paths = self._batch_attr_paths(button, "Checkbox")
+        if not attr_paths:
             return
             
         try:
             # Toggle the checkbox state
             new_value = button.unchecked_value if button.is_checked else button.checked_value
-            cmds.setAttr(attr_path, new_value)
+            self._set_attr_batch(attr_paths, new_value)
             button.is_checked = not button.is_checked
-            print(f"Checkbox {attr_path} set to {new_value}")
+            print(f"Checkbox {button.attribute} on {len(attr_paths)} nodes set to {new_value}")
         except Exception as e:
             cmds.warning(f"Checkbox operation failed for button '{button.label}': {str(e)}")
     
     def _execute_radius_button(self, button: RadiusButton):
-        if not button.target_node or not button.attribute:
-            cmds.warning(f"Radius button '{button.label}' is missing target or attribute")
-            return
-            
-        attr_path = f"{button.target_node}.{button.attribute}"
-        if not cmds.objExists(attr_path):
-            cmds.warning(f"Radius button '{button.label}': {attr_path} does not exist")
+        attr_paths = self._batch_attr_paths(button, "Radius")
+        if not attr_paths:
             return
             
         try:
-            cmds.setAttr(attr_path, button.current_value)
-            print(f"Radius {attr_path} set to {button.current_value}")
+            self._set_attr_batch(attr_paths, button.current_value)
+            print(f"Radius {button.attribute} on {len(attr_paths)} nodes set to {button.current_value}")
         except Exception as e:
             cmds.warning(f"Radius operation failed for button '{button.label}': {str(e)}")
     
+    def _execute_pose_blend_slider(self, button: PoseBlendSlider):
+        # Apply the stored blend value in one go
+        if self.begin_pose_blend(button.id):
+            self.end_pose_blend(button.id)
+
+    def _resolve_pose_data(self, button: PoseButton):
+        """Get the pose data of a pose button, fetching library poses on demand"""
+        if button.pose_key and button.library_path:
+            library = self.get_pose_library(button.library_path)
+            pose_data = library.get_pose(button.pose_key) if library else None
+            if pose_data is None:
+                cmds.warning(f"Pose '{button.pose_key}' not found in {button.library_path}")
+                return {}
+            return pose_data
+        return button.pose_data
+
+    def _pose_values(self, button: PoseButton, seen=()):
+        """Get the values a pose button sets, filling in what a sparse capture left out.
+        
+        Captured poses only store values that differ from the attribute
+        defaults, or from the pose of their reference button, so every other
+        keyable attribute of the target nodes is set back to that value.
+        """
+        pose_data = self._resolve_pose_data(button)
+        if not button.sparse_pose or not button.target_nodes:
+            return pose_data
+            
+        values = self.pose_capture.defaults(button.target_nodes)
+        seen = seen + (button.id,)
+        if button.reference_id and button.reference_id not in seen:
+            reference = self.get_button_by_id(button.reference_id)
+            if isinstance(reference, PoseButton):
+                for node, attrs in self._pose_values(reference, seen).items():
+                    if node in values:
+                        values[node].update(attrs)
+            else:
+                cmds.warning(f"Reference pose '{button.reference_id}' of '{button.label}' not found, using defaults")
+        for node, attrs in pose_data.items():
+            values.setdefault(node, {}).update(attrs)
+        return values
+
+    def get_pose_library(self, path: str):
+        """Get an open pose library, opening it on first use"""
+        if path not in self.pose_libraries:
+            try:
+                self.pose_libraries[path] = PoseLibrary(path)
+            except Exception as e:
+                cmds.warning(f"Could not open pose library {path}: {str(e)}")
+                return None
+        return self.pose_libraries[path]
+
+    def get_pose_thumbnail(self, button_id: str):
+        """Get the thumbnail of a library pose for previews"""
+        button = self.get_button_by_id(button_id)
+        if not isinstance(button, PoseButton) or not button.pose_key:
+            return None
+            
+        library = self.get_pose_library(button.library_path)
+        return library.get_thumbnail(button.pose_key) if library else None
+
+    def store_pose_in_library(self, button_id: str, library_path: str, key=None, tags=(), thumbnail=None):
+        """Move a pose button's pose into a library and link it by key"""
+        button = self.get_button_by_id(button_id)
+        if not isinstance(button, PoseButton):
+            return None
+            
+        library = self.get_pose_library(library_path)
+        if not library:
+            return None
+            
+        key = key or button.id
+        library.add_pose(key, button.label or key, self._resolve_pose_data(button), tags, thumbnail)
+        
+        self.edit_buttons({button.id: {"library_path": library_path, "pose_key": key, "pose_data": {}}},
+                          "Store Pose in Library")
+        return key
+
+    def capture_pose(self, button_id: str, nodes=None, reference_id=None):
+        """Fill a pose button from the current rig state.
+        
+        Only values that differ from the attribute defaults, or from the pose
+        of the reference pose button when given, are stored. Applying the pose
+        sets the left out attributes back to those values. A button linked to
+        a library pose is unlinked, so it keeps the captured pose.
+        """
+        button = self.get_button_by_id(button_id)
+        if not isinstance(button, PoseButton):
+            return None
+            
+        nodes = nodes or button.target_nodes or cmds.ls(selection=True)
+        if not nodes:
+            cmds.warning(f"Pose button '{button.label}' has no nodes to capture")
+            return None
+            
+        reference = None
+        reference_button = self.get_button_by_id(reference_id) if reference_id else None
+        if isinstance(reference_button, PoseButton):
+            reference = self._pose_values(reference_button)
+            
+        changes = {
+            "pose_data": self.pose_capture.capture(nodes, reference),
+            "target_nodes": list(nodes),
+            "sparse_pose": True,
+            "reference_id": reference_button.id if reference is not None else ""
+        }
+        if button.pose_key:
+            changes["pose_key"] = ""
+        self.edit_buttons({button.id: changes}, "Capture Pose")
+        return button.pose_data
+
+    def capture_frame_poses(self, nodes, frames, reference_id=None):
+        """Capture one sparse pose per frame in a single pass"""
+        reference = None
+        reference_button = self.get_button_by_id(reference_id) if reference_id else None
+        if isinstance(reference_button, PoseButton):
+            reference = self._pose_values(reference_button)
+            
+        return self.pose_capture.capture_frames(nodes, frames, reference)
+
+    def apply_mirrored_pose(self, button_id: str, mode: str = "mirror", axis: str = "X", source_nodes=None):
+        """Apply a pose button's pose mirrored ("mirror") or side-swapped ("flip").
+        
+        Mirroring copies one side of the pose onto the other. The side is
+        source_nodes when given, else the selected controls, else the
+        button's targets, and has to hold nodes of one side only.
+        """
+        button = self.get_button_by_id(button_id)
+        if not isinstance(button, PoseButton):
+            return None
+            
+        pose_data = self._pose_values(button)
+        if not pose_data:
+            cmds.warning(f"Pose button '{button.label}' has no pose to mirror")
+            return None
+            
+        table = self.get_mirror_table(pose_data, axis)
+        if any((node, attr) not in table.attr_index for node in pose_data for attr in pose_data[node]):
+            # The rig changed since the table was built
+            self.pose_mirror.invalidate(self.model.current_picker.name)
+            table = self.get_mirror_table(pose_data, axis)
+            
+        if mode == "mirror" and source_nodes is None:
+            source_nodes = self._mirror_source_nodes(button, table)
+            if source_nodes is None:
+                cmds.warning(f"Select the controls of one side to mirror '{button.label}' from")
+                return None
+                
+        mirrored = self.pose_mirror.mirror_pose(table, pose_data, mode, source_nodes)
+        with MayaUndoChunk():
+            self._apply_pose_data(mirrored, list(mirrored))
+        return mirrored
+
+    def _mirror_source_nodes(self, button: PoseButton, table):
+        """Nodes of the side to mirror from: the selection, else the button's targets"""
+        for nodes in (cmds.ls(selection=True) or [], button.target_nodes):
+            nodes = [node for node in nodes if node in table.node_mirrors]
+            if table.is_one_side(nodes):
+                return nodes
+        return None
+
+    def get_mirror_table(self, pose_data, axis: str = "X"):
+        """Get the cached mirror table for the current picker's rig"""
+        if self.pose_mirror is None:
+            from utils.mirror_tools import MirrorTools
+            self.pose_mirror = PoseMirror(self.mirror_tools or MirrorTools())
+            
+        namespace = split_namespace(next(iter(pose_data)))[0]
+        return self.pose_mirror.get_table(
+            self.model.current_picker.name, namespace,
+            lambda: self._collect_rig_attributes(pose_data), axis
+        )
+
+    def _collect_rig_attributes(self, pose_data):
+        """Gather keyable attributes of every node the picker drives and their mirrors"""
+        nodes = set(pose_data)
+        for button in self.model.current_picker.buttons:
+            nodes.update(getattr(button, 'target_nodes', []))
+            if isinstance(button, PoseButton):
+                nodes.update(button.pose_data)
+                
+        mirror_tools = self.pose_mirror.mirror_tools
+        for node in list(nodes):
+            namespace, short_name = split_namespace(node)
+            mirrored = mirror_tools.mirror_node_name(short_name)
+            nodes.add(f"{namespace}:{mirrored}" if namespace else mirrored)
+            
+        node_attrs = {}
+        for node in cmds.ls(list(nodes)) or []:
+            node_attrs[node] = set(cmds.listAttr(node, keyable=True, scalar=True) or [])
+        # Keep attributes stored in poses even if they are no longer keyable
+        for node, attrs in pose_data.items():
+            node_attrs.setdefault(node, set()).update(attrs)
+        return node_attrs
+
+    def begin_pose_blend(self, button_id: str):
+        """Start an interactive blend from the current rig state"""
+        button = self.get_button_by_id(button_id)
+        if not isinstance(button, PoseBlendSlider):
+            return None
+            
+        poses = []
+        for pose_id in button.pose_button_ids:
+            pose_button = self.get_button_by_id(pose_id)
+            if isinstance(pose_button, PoseButton):
+                poses.append(self._pose_values(pose_button))
+                
+        if not poses:
+            cmds.warning(f"Pose blend slider '{button.label}' has no poses")
+            return None
+            
+        blender = PoseBlender(poses, button.epsilon)
+        blender.capture_base()
+        self.pose_blenders[button_id] = blender
+        return blender
+
+    def update_pose_blend(self, button_id: str, value: float):
+        """Blend to a new slider value, called on each drag tick"""
+        blender = self.pose_blenders.get(button_id)
+        button = self.get_button_by_id(button_id)
+        if not blender or not button:
+            return 0
+            
+        button.blend_value = min(max(value, 0.0), 1.0)
+        # Intermediate ticks stay out of the undo queue, end_pose_blend commits
+        with MayaUndoSuspended():
+            return blender.apply(blend_weights(button, len(blender.pose_matrix)))
+
+    def end_pose_blend(self, button_id: str):
+        """Finish a blend and commit it as one undo step"""
+        blender = self.pose_blenders.pop(button_id, None)
+        button = self.get_button_by_id(button_id)
+        if not blender or not button:
+            return
+            
+        blender.commit(blend_weights(button, len(blender.pose_matrix)))
+
+    def begin_slider_drag(self, button_id: str):
+        """Start an interactive slider drag"""
+        button = self.get_button_by_id(button_id)
+        if not isinstance(button, Slider):
+            return None
+            
+        session = SliderDragSession(button)
+        self.slider_drags[button_id] = session
+        return session
+
+    def drag_slider(self, button_id: str, value: float, second_value: float = None):
+        """Move a dragged slider, called on each mouse move"""
+        session = self.slider_drags.get(button_id)
+        if not session:
+            return
+            
+        button = session.button
+        value = min(max(value, button.range_min), button.range_max)
+        if second_value is not None:
+            second_value = min(max(second_value, button.second_range_min), button.second_range_max)
+        session.update(value, second_value)
+
+    def end_slider_drag(self, button_id: str):
+        """Finish a slider drag and commit it as one undo step"""
+        session = self.slider_drags.pop(button_id, None)
+        if not session:
+            return None
+            
+        stats = session.finish()
+        if self.debug_overlay:
+            self.debug_overlay.report_drag_stats(session.button.label or button_id, stats)
+        return stats
+    
     def save_picker(self, file_path: str):
         return self.model.save_to_file(file_path)
     
+    def validate_targets(self):
+        """Report the buttons of all pickers whose nodes or attributes are missing or ambiguous"""
+        report = validate_pickers(self.model.pickers.values())
+        for button_report in report.broken:
+            name = f"{button_report.picker}/{button_report.label or button_report.button_id}"
+            missing = button_report.missing_nodes + button_report.missing_attributes
+            if missing:
+                print(f"{name}: missing {', '.join(missing)}")
+            if button_report.ambiguous_nodes:
+                print(f"{name}: more than one node named {', '.join(button_report.ambiguous_nodes)}")
+        return report
+    
+    def collect_selection_sets(self):
+        """Delete objectSets created for the loaded pickers that none of their select buttons links to"""
+        linked = [
+            button.selection_set
+            for picker in self.model.pickers.values()
+            for button in picker.buttons
+            if isinstance(button, SelectButton) and button.use_selection_set and button.selection_set
+        ]
+        owners = [self._selection_set_owner(picker) for picker in self.model.pickers.values()]
+        return self.selection_sets.collect_garbage(owners, linked)
+
+    def _selection_set_owner(self, picker):
+        """Owner tag of a picker's objectSets, unique to the picker file"""
+        return picker_owner(picker.name, self.model.file_path)
+    
     def load_picker(self, file_path: str):
-        return self.model.load_from_file(file_path)
+        result = self.model.load_from_file(file_path)
+        self._invalidate_button_indexes()
+        self.selection_sets.invalidate()
+        return result
     
     def get_button_by_id(self, button_id: str):
         """Get a button by its ID"""
@@ -0,0 +1,101 @@
+# core/hierarchy_cache.py
+import re
+import maya.cmds as cmds
+from .node_index import short_name
+from .pose_mirror import split_namespace
+
+def node_namespace(node: str) -> str:
+    """Namespace of a node name or DAG path"""
+    return split_namespace(short_name(node))[0]
+
+class DescendantCache:
+    """Descendant controls of hierarchy roots, cached per namespace.
+
+    Each root costs one listRelatives(allDescendents=True) query. Controls
+    are found by shape type (the parents of nurbsCurve shapes by default)
+    and/or by a name pattern. DAG changes, node additions, removals and
+    renames drop the cached roots of the affected namespace only.
+    """
+    def __init__(self, control_type: str = "nurbsCurve", pattern: str = None):
+        self.control_type = control_type
+        self.pattern = re.compile(pattern) if pattern else None
+        self.namespaces = {}  # namespace: {root: descendant controls}
+        self.callback_ids = []
+        self.started = False
+        self.watching = False
+
+    def descendants(self, root: str):
+        """Controls below a root, queried once until the hierarchy changes"""
+        if not self.started:
+            self.start()
+        if not self.watching:
+            # Without change notifications a cached list could go stale
+            return self._query(root)
+
+        roots = self.namespaces.setdefault(node_namespace(root), {})
+        if root not in roots:
+            roots[root] = self._query(root)
+        return roots[root]
+
+    def _query(self, root: str):
+        if self.control_type:
+            shapes = cmds.listRelatives(root, allDescendents=True, type=self.control_type, fullPath=True) or []
+            # Controls are the transforms owning the shapes, parent paths need no extra query
+            nodes = list(dict.fromkeys(shape.rsplit("|", 1)[0] for shape in shapes))
+        else:
+            nodes = cmds.listRelatives(root, allDescendents=True, type="transform", fullPath=True) or []
+            nodes.reverse()  # listRelatives returns deepest first
+
+        if self.pattern:
+            nodes = [node for node in nodes if self.pattern.search(short_name(node))]
+        return nodes
+
+    def invalidate(self, node: str = None):
+        """Drop the cache of a node's namespace, or everything"""
+        if node is None:
+            self.namespaces.clear()
+        else:
+            self.namespaces.pop(node_namespace(node), None)
+
+    def start(self):
+        """Listen to DAG changes"""
+        self.started = True
+        try:
+            import maya.api.OpenMaya as om
+        except ImportError:
+            return
+
+        def dag_changed(message, child, parent, client_data):
+            self.invalidate(child.partialPathName())
+
+        def node_changed(node, client_data):
+            self.invalidate(om.MFnDependencyNode(node).name())
+
+        def name_changed(node, previous_name, client_data):
+            self.invalidate(previous_name)
+            self.invalidate(om.MFnDependencyNode(node).name())
+
+        try:
+            add = self.callback_ids.append
+            add(om.MDagMessage.addAllDagChangesCallback(dag_changed))
+            add(om.MDGMessage.addNodeAddedCallback(node_changed, "dagNode"))
+            add(om.MDGMessage.addNodeRemovedCallback(node_changed, "dagNode"))
+            add(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, name_changed))
+            add(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterOpen, lambda *args: self.invalidate()))
+            add(om.MSceneMessage.addCallback(om.MSceneMessage.kAfterNew, lambda *args: self.invalidate()))
+            self.watching = True
+        except Exception as e:
+            print(f"Hierarchy callbacks unavailable, descendant lists will not be cached: {e}")
+            self.stop()
+            self.started = True  # Do not retry on every click
+
+    def stop(self):
+        """Remove all callbacks and clear the cache"""
+        self.started = False
+        if self.callback_ids:
+            import maya.api.OpenMaya as om
+            for callback_id in self.callback_ids:
+                om.MMessage.removeCallback(callback_id)
+        self.callback_ids = []
+        self.watching = False
+        self.namespaces.clear()
@@ -14,6 +14,7 @@ class ButtonType(Enum):
     CHECKBOX = "checkbox"
     RADIUS = "radius"
     TEXT = "text"
+    POSE_BLEND = "pose_blend"
 
 class ShapeType(Enum):
     RECTANGLE = "rectangle"
@@ -59,6 +60,8 @@ class SelectButton(BaseButton):
         self.hierarchical = kwargs.pop('hierarchical', False)
         self.mirror = kwargs.pop('mirror', False)
         self.mirror_axis = kwargs.pop('mirror_axis', "X")
+        self.use_selection_set = kwargs.pop('use_selection_set', False)  # Select through a Maya objectSet
+        self.selection_set = kwargs.pop('selection_set', '')  # Name of the linked objectSet
         
         # Set the type and call parent constructor with remaining kwargs
         kwargs['type'] = ButtonType.SELECT
@@ -79,6 +82,11 @@ class PoseButton(BaseButton):
         # Extract subclass-specific arguments
         self.target_nodes = kwargs.pop('target_nodes', [])
         self.pose_data = kwargs.pop('pose_data', {})
+        self.library_path = kwargs.pop('library_path', '')  # Pose library linked by key
+        self.pose_key = kwargs.pop('pose_key', '')
+        # Captured poses leave out values at their default, or at the reference button's pose
+        self.sparse_pose = kwargs.pop('sparse_pose', False)
+        self.reference_id = kwargs.pop('reference_id', '')
         
         # Set the type and call parent constructor with remaining kwargs
         kwargs['type'] = ButtonType.POSE
@@ -88,6 +96,7 @@ class AttributeButton(BaseButton):
     def __init__(self, **kwargs):
         # Extract subclass-specific arguments
         self.target_node = kwargs.pop('target_node', '')
+        self.target_nodes = kwargs.pop('target_nodes', [])  # Extra targets driven together with target_node
         self.attribute = kwargs.pop('attribute', '')
         self.operation = kwargs.pop('operation', 'set')
         self.value = kwargs.pop('value', 0.0)
@@ -120,6 +129,7 @@ class Checkbox(BaseButton):
     def __init__(self, **kwargs):
         # Extract subclass-specific arguments
         self.target_node = kwargs.pop('target_node', '')
+        self.target_nodes = kwargs.pop('target_nodes', [])  # Extra targets driven together with target_node
         self.attribute = kwargs.pop('attribute', '')
         self.checked_value = kwargs.pop('checked_value', 1.0)
         self.unchecked_value = kwargs.pop('unchecked_value', 0.0)
@@ -133,6 +143,7 @@ class RadiusButton(BaseButton):
     def __init__(self, **kwargs):
         # Extract subclass-specific arguments
         self.target_node = kwargs.pop('target_node', '')
+        self.target_nodes = kwargs.pop('target_nodes', [])  # Extra targets driven together with target_node
         self.attribute = kwargs.pop('attribute', '')
         self.min_value = kwargs.pop('min_value', 0.0)
         self.max_value = kwargs.pop('max_value', 10.0)
@@ -142,6 +153,18 @@ class RadiusButton(BaseButton):
         kwargs['type'] = ButtonType.RADIUS
         super().__init__(**kwargs)
 
+class PoseBlendSlider(BaseButton):
+    def __init__(self, **kwargs):
+        # Extract subclass-specific arguments
+        self.pose_button_ids = kwargs.pop('pose_button_ids', [])
+        self.pose_weights = kwargs.pop('pose_weights', [])  # Empty means equal weights
+        self.blend_value = kwargs.pop('blend_value', 0.0)  # 0 = current rig, 1 = full pose
+        self.epsilon = kwargs.pop('epsilon', 1e-4)  # Smallest change sent to Maya
+        
+        # Set the type and call parent constructor with remaining kwargs
+        kwargs['type'] = ButtonType.POSE_BLEND
+        super().__init__(**kwargs)
+
 class TextButton(BaseButton):
     def __init__(self, **kwargs):
         # Extract subclass-specific arguments
@@ -154,6 +177,14 @@ class TextButton(BaseButton):
         kwargs['type'] = ButtonType.TEXT
         super().__init__(**kwargs)
 
+def attribute_targets(button) -> List[str]:
+    """Nodes an attribute, checkbox or radius button drives, target_node first"""
+    targets = [button.target_node] if button.target_node else []
+    for node in button.target_nodes:
+        if node and node not in targets:
+            targets.append(node)
+    return targets
+
 @dataclass
 class Picker:
     name: str = "New Picker"
@@ -167,6 +198,7 @@ class PickerModel:
     def __init__(self):
         self.pickers: Dict[str, Picker] = {}
         self.current_picker: Optional[Picker] = None
+        self.file_path: Optional[str] = None  # File last saved to or loaded from
         
     def add_picker(self, name: str) -> Picker:
         picker = Picker(name=name)
@@ -213,7 +245,9 @@ class PickerModel:
                 "target_nodes": button.target_nodes,
                 "hierarchical": button.hierarchical,
                 "mirror": button.mirror,
-                "mirror_axis": button.mirror_axis
+                "mirror_axis": button.mirror_axis,
+                "use_selection_set": button.use_selection_set,
+                "selection_set": button.selection_set
             })
         elif isinstance(button, ScriptButton):
             base_data.update({
@@ -223,11 +257,18 @@ class PickerModel:
         elif isinstance(button, PoseButton):
             base_data.update({
                 "target_nodes": button.target_nodes,
-                "pose_data": button.pose_data
+                "library_path": button.library_path,
+                "pose_key": button.pose_key,
+                "sparse_pose": button.sparse_pose,
+                "reference_id": button.reference_id
             })
+            # Library poses are fetched on demand, not embedded in the picker
+            if not button.pose_key:
+                base_data["pose_data"] = button.pose_data
         elif isinstance(button, AttributeButton):
             base_data.update({
                 "target_node": button.target_node,
+                "target_nodes": button.target_nodes,
                 "attribute": button.attribute,
                 "operation": button.operation,
                 "value": button.value,
@@ -246,6 +287,31 @@ class PickerModel:
                 "second_range_max": button.second_range_max,
                 "second_current_value": button.second_current_value
             })
+        elif isinstance(button, Checkbox):
+            base_data.update({
+                "target_node": button.target_node,
+                "target_nodes": button.target_nodes,
+                "attribute": button.attribute,
+                "checked_value": button.checked_value,
+                "unchecked_value": button.unchecked_value,
+                "is_checked": button.is_checked
+            })
+        elif isinstance(button, RadiusButton):
+            base_data.update({
+                "target_node": button.target_node,
+                "target_nodes": button.target_nodes,
+                "attribute": button.attribute,
+                "min_value": button.min_value,
+                "max_value": button.max_value,
+                "current_value": button.current_value
+            })
+        elif isinstance(button, PoseBlendSlider):
+            base_data.update({
+                "pose_button_ids": button.pose_button_ids,
+                "pose_weights": button.pose_weights,
+                "blend_value": button.blend_value,
+                "epsilon": button.epsilon
+            })
         elif isinstance(button, TextButton):
             base_data.update({
                 "font_size": button.font_size,
@@ -266,6 +332,7 @@ class PickerModel:
         
             with open(file_path, 'w') as f:
                 json.dump(self.to_dict(), f, indent=4)
+            self.file_path = file_path
             print(f"Picker saved successfully to: {file_path}")
             return True
         except Exception as e:
@@ -310,6 +377,7 @@ class PickerModel:
                 first_picker_name = list(self.pickers.keys())[0]
                 self.current_picker = self.pickers[first_picker_name]
         
+            self.file_path = file_path
             print(f"Picker loaded successfully from: {file_path}")
             return True
         except Exception as e:
@@ -342,7 +410,9 @@ class PickerModel:
                 target_nodes=button_data.get("target_nodes", []),
                 hierarchical=button_data.get("hierarchical", False),
                 mirror=button_data.get("mirror", False),
-                mirror_axis=button_data.get("mirror_axis", "X")
+                mirror_axis=button_data.get("mirror_axis", "X"),
+                use_selection_set=button_data.get("use_selection_set", False),
+                selection_set=button_data.get("selection_set", "")
             )
         elif button_type == ButtonType.SCRIPT:
             button = ScriptButton(
@@ -355,6 +425,98 @@ class PickerModel:
                 script=button_data.get("script", ""),
                 language=button_data.get("language", "python")
             )
+        elif button_type == ButtonType.POSE:
+            button = PoseButton(
+                id=button_data.get("id", ""),
+                position=position,
+                size=size,
+                color=color,
+                label=button_data.get("label", ""),
+                tooltip=button_data.get("tooltip", ""),
+                target_nodes=button_data.get("target_nodes", []),
+                pose_data=button_data.get("pose_data", {}),
+                library_path=button_data.get("library_path", ""),
+                pose_key=button_data.get("pose_key", ""),
+                sparse_pose=button_data.get("sparse_pose", False),
+                reference_id=button_data.get("reference_id", "")
+            )
+        elif button_type == ButtonType.ATTRIBUTE:
+            button = AttributeButton(
+                id=button_data.get("id", ""),
+                position=position,
+                size=size,
+                color=color,
+                label=button_data.get("label", ""),
+                tooltip=button_data.get("tooltip", ""),
+                target_node=button_data.get("target_node", ""),
+                target_nodes=button_data.get("target_nodes", []),  # Missing in older pickers
+                attribute=button_data.get("attribute", ""),
+                operation=button_data.get("operation", "set"),
+                value=button_data.get("value", 0.0),
+                nudge_amount=button_data.get("nudge_amount", 1.0)
+            )
+        elif button_type == ButtonType.SLIDER:
+            button = Slider(
+                id=button_data.get("id", ""),
+                position=position,
+                size=size,
+                color=color,
+                label=button_data.get("label", ""),
+                tooltip=button_data.get("tooltip", ""),
+                target_node=button_data.get("target_node", ""),
+                attribute=button_data.get("attribute", ""),
+                range_min=button_data.get("range_min", 0.0),
+                range_max=button_data.get("range_max", 100.0),
+                current_value=button_data.get("current_value", 0.0),
+                is_2d=button_data.get("is_2d", False),
+                second_attribute=button_data.get("second_attribute", ""),
+                second_range_min=button_data.get("second_range_min", 0.0),
+                second_range_max=button_data.get("second_range_max", 100.0),
+                second_current_value=button_data.get("second_current_value", 0.0)
+            )
+        elif button_type == ButtonType.CHECKBOX:
+            button = Checkbox(
+                id=button_data.get("id", ""),
+                position=position,
+                size=size,
+                color=color,
+                label=button_data.get("label", ""),
+                tooltip=button_data.get("tooltip", ""),
+                target_node=button_data.get("target_node", ""),
+                target_nodes=button_data.get("target_nodes", []),
+                attribute=button_data.get("attribute", ""),
+                checked_value=button_data.get("checked_value", 1.0),
+                unchecked_value=button_data.get("unchecked_value", 0.0),
+                is_checked=button_data.get("is_checked", False)
+            )
+        elif button_type == ButtonType.RADIUS:
+            button = RadiusButton(
+                id=button_data.get("id", ""),
+                position=position,
+                size=size,
+                color=color,
+                label=button_data.get("label", ""),
+                tooltip=button_data.get("tooltip", ""),
+                target_node=button_data.get("target_node", ""),
+                target_nodes=button_data.get("target_nodes", []),
+                attribute=button_data.get("attribute", ""),
+                min_value=button_data.get("min_value", 0.0),
+                max_value=button_data.get("max_value", 10.0),
+                current_value=button_data.get("current_value", 1.0)
+            )
+        elif button_type == ButtonType.POSE_BLEND:
+            button = PoseBlendSlider(
+                id=button_data.get("id", ""),
+                position=position,
+                size=size,
+                color=color,
+                label=button_data.get("label", ""),
+                tooltip=button_data.get("tooltip", ""),
+                pose_button_ids=button_data.get("pose_button_ids", []),
+                pose_weights=button_data.get("pose_weights", []),
+                blend_value=button_data.get("blend_value", 0.0),
+                epsilon=button_data.get("epsilon", 1e-4)
+            )
         elif button_type == ButtonType.TEXT:
             button = TextButton(
                 id=button_data.get("id", ""),
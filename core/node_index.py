@@ -0,0 +1,96 @@
+# core/node_index.py
+from typing import Dict, Set, Iterable
+
+def short_name(node: str) -> str:
+    """Strip the DAG path from a node name"""
+    return node.rsplit("|", 1)[-1]
+
+def button_nodes(button) -> Set[str]:
+    """All scene nodes a button references"""
+    nodes = set(getattr(button, 'target_nodes', None) or [])
+    target_node = getattr(button, 'target_node', None)
+    if target_node:
+        nodes.add(target_node)
+    nodes.update(getattr(button, 'pose_data', None) or {})
+    nodes.discard("")
+    return nodes
+
+def rename_node(node: str, rename_map: Dict[str, str]) -> str:
+    """Apply a short name rename map to a node name, keeping any DAG path"""
+    short = short_name(node)
+    new_name = rename_map.get(short)
+    if new_name is None:
+        return node
+    return node[:len(node) - len(short)] + short_name(new_name)
+
+def renamed_references(button, rename_map: Dict[str, str]) -> Dict[str, object]:
+    """{attribute: new value} for the node references of a button a rename map changes"""
+    changes = {}
+    target_nodes = getattr(button, 'target_nodes', None)
+    if target_nodes:
+        renamed = [rename_node(node, rename_map) for node in target_nodes]
+        if renamed != target_nodes:
+            changes['target_nodes'] = renamed
+    target_node = getattr(button, 'target_node', None)
+    if target_node and rename_node(target_node, rename_map) != target_node:
+        changes['target_node'] = rename_node(target_node, rename_map)
+    pose_data = getattr(button, 'pose_data', None)
+    if pose_data and any(short_name(node) in rename_map for node in pose_data):
+        changes['pose_data'] = {rename_node(node, rename_map): attrs for node, attrs in pose_data.items()}
+    return changes
+
+class NodeButtonIndex:
+    """Inverted index from scene node to the ids of the buttons targeting it"""
+    def __init__(self):
+        self.node_buttons: Dict[str, Set[str]] = {}
+        self.button_nodes: Dict[str, Set[str]] = {}
+        self.buttons = {}  # button id: button
+
+    def build(self, buttons: Iterable):
+        """Index every button of a picker"""
+        self.node_buttons.clear()
+        self.button_nodes.clear()
+        self.buttons.clear()
+        for button in buttons:
+            self.update_button(button)
+
+    def update_button(self, button):
+        """Re-index one button after its targets changed"""
+        nodes = {short_name(node) for node in button_nodes(button)}
+        old_nodes = self.button_nodes.get(button.id, set())
+
+        for node in old_nodes - nodes:
+            button_ids = self.node_buttons.get(node)
+            if button_ids:
+                button_ids.discard(button.id)
+                if not button_ids:
+                    del self.node_buttons[node]
+        for node in nodes - old_nodes:
+            self.node_buttons.setdefault(node, set()).add(button.id)
+
+        self.button_nodes[button.id] = nodes
+        self.buttons[button.id] = button
+
+    def remove_button(self, button_id: str):
+        """Drop a button from the index"""
+        self.buttons.pop(button_id, None)
+        for node in self.button_nodes.pop(button_id, set()):
+            button_ids = self.node_buttons.get(node)
+            if button_ids:
+                button_ids.discard(button_id)
+                if not button_ids:
+                    del self.node_buttons[node]
+
+    def buttons_for(self, node: str) -> Set[str]:
+        """Ids of the buttons targeting a node"""
+        return self.node_buttons.get(short_name(node), set())
+
+    def buttons_for_nodes(self, nodes: Iterable[str]) -> Set[str]:
+        """Ids of the buttons targeting any of the nodes"""
+        node_buttons = self.node_buttons
+        button_ids = set()
+        for node in nodes:
+            found = node_buttons.get(short_name(node))
+            if found:
+                button_ids |= found
+        return button_ids
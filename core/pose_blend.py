@@ -0,0 +1,101 @@
+# core/pose_blend.py
+import maya.cmds as cmds
+import numpy as np
+from typing import List, Dict, Any, Optional
+from utils.undo import MayaUndoChunk, MayaUndoSuspended
+
+class PoseBlender:
+    """Blend the current rig state towards one or more poses.
+
+    All poses are aligned on a single attribute index so that a blend tick is
+    one matrix-vector product, and only values that moved by more than
+    `epsilon` since the last tick are sent to Maya.
+    """
+    def __init__(self, poses: List[Dict[str, Dict[str, float]]], epsilon: float = 1e-4):
+        self.epsilon = epsilon
+        self.attr_paths: List[str] = []
+        self.attr_index: Dict[str, int] = {}
+
+        # Build the shared attribute index
+        for pose in poses:
+            for node, attrs in pose.items():
+                for attr in attrs:
+                    attr_path = f"{node}.{attr}"
+                    if attr_path not in self.attr_index:
+                        self.attr_index[attr_path] = len(self.attr_paths)
+                        self.attr_paths.append(attr_path)
+
+        # Pose values, NaN where a pose does not drive an attribute
+        self.pose_matrix = np.full((len(poses), len(self.attr_paths)), np.nan)
+        for row, pose in enumerate(poses):
+            for node, attrs in pose.items():
+                for attr, value in attrs.items():
+                    self.pose_matrix[row, self.attr_index[f"{node}.{attr}"]] = value
+
+        self.base_values: Optional[np.ndarray] = None
+        self.deltas: Optional[np.ndarray] = None
+        self.sent_values: Optional[np.ndarray] = None
+        self.valid = np.zeros(len(self.attr_paths), dtype=bool)
+
+    def capture_base(self):
+        """Read the current rig state that blends start from"""
+        base = np.zeros(len(self.attr_paths))
+        for i, attr_path in enumerate(self.attr_paths):
+            if not cmds.objExists(attr_path):
+                continue
+            try:
+                base[i] = float(cmds.getAttr(attr_path))
+                self.valid[i] = True
+            except Exception as e:
+                cmds.warning(f"Could not read {attr_path}: {str(e)}")
+        self.set_base(base)
+
+    def set_base(self, base_values):
+        """Set the values blends start from and precompute pose deltas"""
+        self.base_values = np.asarray(base_values, dtype=float)
+        # Attributes a pose does not drive stay at the base value
+        self.deltas = np.where(np.isnan(self.pose_matrix), 0.0, self.pose_matrix - self.base_values)
+        self.sent_values = self.base_values.copy()
+
+    def compute(self, weights) -> np.ndarray:
+        """Return blended values for the given per-pose weights"""
+        return self.base_values + np.asarray(weights, dtype=float) @ self.deltas
+
+    def changed_indices(self, values: np.ndarray) -> np.ndarray:
+        """Indices whose value moved by more than epsilon since the last write"""
+        changed = np.abs(values - self.sent_values) > self.epsilon
+        return np.flatnonzero(changed & self.valid)
+
+    def apply(self, weights) -> int:
+        """Blend and send changed values to Maya, returns the number of writes"""
+        values = self.compute(weights)
+        indices = self.changed_indices(values)
+
+        for i in indices:
+            try:
+                cmds.setAttr(self.attr_paths[i], float(values[i]))
+            except Exception as e:
+                cmds.warning(f"Could not set {self.attr_paths[i]}: {str(e)}")
+        self.sent_values[indices] = values[indices]
+
+        return len(indices)
+
+    def commit(self, weights) -> int:
+        """Write the final blend as a single Maya undo step"""
+        # Put the rig back to its starting state without touching the undo queue
+        with MayaUndoSuspended():
+            restore = np.flatnonzero(self.valid & (self.sent_values != self.base_values))
+            for i in restore:
+                cmds.setAttr(self.attr_paths[i], float(self.base_values[i]))
+            self.sent_values[restore] = self.base_values[restore]
+
+        with MayaUndoChunk():
+            return self.apply(weights)
+
+def blend_weights(button, pose_count: int) -> np.ndarray:
+    """Per-pose weights for a pose blend slider at its current value"""
+    if button.pose_weights and len(button.pose_weights) == pose_count:
+        weights = np.asarray(button.pose_weights, dtype=float)
+    else:
+        weights = np.full(pose_count, 1.0 / pose_count if pose_count else 0.0)
+    return weights * button.blend_value
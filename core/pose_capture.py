@@ -0,0 +1,166 @@
+# core/pose_capture.py
+import maya.cmds as cmds
+import maya.api.OpenMaya as om
+from typing import List, Dict, Optional, Iterable
+from .node_index import short_name
+
+class PoseCapture:
+    """Capture rig poses in bulk as sparse {node: {attr: value}} dicts.
+
+    The keyable attribute layout of each node (plugs, readers and defaults)
+    is resolved once and cached, so a capture is one plug read per attribute
+    with no Maya commands, and a frame range reuses the same plugs through a
+    DG context instead of moving the timeline. Node removals, renames, DAG
+    changes and scene or reference loads drop the affected layouts.
+    """
+    def __init__(self, tolerance: float = 1e-5):
+        self.tolerance = tolerance
+        self._layouts: Dict[str, List[tuple]] = {}  # node: [(attr, plug, reader, default)]
+        self._names: Dict[str, set] = {}  # name in the DAG path of a cached node: cached nodes
+        self.callback_ids = []
+        self.started = False
+        self.watching = False
+
+    def invalidate(self, node: str = None):
+        """Forget the layouts of a node and the nodes below it, or every layout"""
+        if node is None:
+            self._layouts.clear()
+            self._names.clear()
+            return
+        for cached in self._names.pop(short_name(node), ()):
+            self._layouts.pop(cached, None)
+
+    def start(self):
+        """Listen to the scene changes that leave cached plugs stale"""
+        self.started = True
+
+        def node_removed(node, client_data):
+            self.invalidate(om.MFnDependencyNode(node).name())
+
+        def name_changed(node, previous_name, client_data):
+            self.invalidate(previous_name)
+            self.invalidate(om.MFnDependencyNode(node).name())
+
+        def dag_changed(message, child, parent, client_data):
+            self.invalidate(child.partialPathName())
+
+        try:
+            add = self.callback_ids.append
+            add(om.MDGMessage.addNodeRemovedCallback(node_removed, "dependNode"))
+            add(om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, name_changed))
+            add(om.MDagMessage.addAllDagChangesCallback(dag_changed))
+            for message in (om.MSceneMessage.kAfterOpen, om.MSceneMessage.kAfterNew,
+                            om.MSceneMessage.kAfterLoadReference, om.MSceneMessage.kAfterUnloadReference):
+                add(om.MSceneMessage.addCallback(message, lambda *args: self.invalidate()))
+            self.watching = True
+        except Exception as e:
+            print(f"Scene callbacks unavailable, attribute layouts will not be cached: {e}")
+            self.stop()
+            self.started = True  # Do not retry on every capture
+
+    def stop(self):
+        """Remove all callbacks and clear the cache"""
+        self.started = False
+        for callback_id in self.callback_ids:
+            om.MMessage.removeCallback(callback_id)
+        self.callback_ids = []
+        self.watching = False
+        self.invalidate()
+
+    def _reader(self, plug):
+        """Return a function reading a plug in UI units for a context"""
+        attr = plug.attribute()
+        if attr.hasFn(om.MFn.kUnitAttribute):
+            unit_type = om.MFnUnitAttribute(attr).unitType()
+            if unit_type == om.MFnUnitAttribute.kAngle:
+                return lambda p, ctx: p.asMAngle(ctx).asUnits(om.MAngle.uiUnit())
+            if unit_type == om.MFnUnitAttribute.kDistance:
+                return lambda p, ctx: p.asMDistance(ctx).asUnits(om.MDistance.uiUnit())
+        return lambda p, ctx: p.asDouble(ctx)
+
+    def _default(self, plug):
+        """Return the default value of a plug's attribute in UI units"""
+        attr = plug.attribute()
+        try:
+            if attr.hasFn(om.MFn.kUnitAttribute):
+                default = om.MFnUnitAttribute(attr).default
+                if isinstance(default, om.MAngle):
+                    return default.asUnits(om.MAngle.uiUnit())
+                if isinstance(default, om.MDistance):
+                    return default.asUnits(om.MDistance.uiUnit())
+                return float(default.value)
+            if attr.hasFn(om.MFn.kNumericAttribute):
+                return float(om.MFnNumericAttribute(attr).default)
+            if attr.hasFn(om.MFn.kEnumAttribute):
+                return float(om.MFnEnumAttribute(attr).default)
+        except Exception:
+            pass
+        return 0.0
+
+    def _layout(self, node: str) -> List[tuple]:
+        """Get the keyable attribute layout of a node, cached while the scene is watched"""
+        if node in self._layouts:
+            return self._layouts[node]
+
+        layout = []
+        selection = om.MSelectionList()
+        selection.add(node)
+        fn_node = om.MFnDependencyNode(selection.getDependNode(0))
+
+        for attr in cmds.listAttr(node, keyable=True, scalar=True) or []:
+            try:
+                plug = fn_node.findPlug(attr, False)
+            except RuntimeError:
+                continue
+            layout.append((attr, plug, self._reader(plug), self._default(plug)))
+
+        if self.watching:
+            self._layouts[node] = layout
+            for name in filter(None, node.split("|")):
+                self._names.setdefault(name, set()).add(node)
+        return layout
+
+    def _read(self, layouts: Dict[str, List[tuple]], context, reference: Optional[Dict] = None) -> Dict[str, Dict[str, float]]:
+        """Read one sparse pose for the given DG context"""
+        reference = reference or {}
+        pose = {}
+
+        for node, layout in layouts.items():
+            node_reference = reference.get(node, {})
+            values = {}
+            for attr, plug, reader, default in layout:
+                value = reader(plug, context)
+                # Only keep values that differ from the reference or default
+                if abs(value - node_reference.get(attr, default)) > self.tolerance:
+                    values[attr] = value
+            if values:
+                pose[node] = values
+
+        return pose
+
+    def _valid_layouts(self, nodes: Iterable[str]) -> Dict[str, List[tuple]]:
+        """Resolve layouts for all existing nodes in one existence query"""
+        if not self.started:
+            self.start()
+        return {node: self._layout(node) for node in cmds.ls(list(nodes)) or []}
+
+    def defaults(self, nodes: Iterable[str]) -> Dict[str, Dict[str, float]]:
+        """Default values of the keyable attributes of the existing nodes"""
+        return {node: {attr: default for attr, _, _, default in layout}
+                for node, layout in self._valid_layouts(nodes).items()}
+
+    def capture(self, nodes: Iterable[str], reference: Optional[Dict] = None) -> Dict[str, Dict[str, float]]:
+        """Capture the current pose of the nodes"""
+        valid = self._valid_layouts(nodes)
+        return self._read(valid, om.MDGContext.kNormal, reference)
+
+    def capture_frames(self, nodes: Iterable[str], frames: Iterable[float], reference: Optional[Dict] = None) -> List[Dict[str, Dict[str, float]]]:
+        """Capture one pose per frame without changing the current time"""
+        valid = self._valid_layouts(nodes)
+        poses = []
+
+        for frame in frames:
+            context = om.MDGContext(om.MTime(frame, om.MTime.uiUnit()))
+            poses.append(self._read(valid, context, reference))
+
+        return poses
@@ -0,0 +1,137 @@
+# core/pose_library.py
+import json
+import os
+import sqlite3
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterable
+
+class PoseLibrary:
+    """On-disk pose library backed by sqlite3.
+
+    Opening a library only connects to the database, poses are fetched by
+    key when they are applied or previewed and kept in a small in-memory
+    LRU. Names and tags are indexed, thumbnails live in their own table so
+    searches never read image data.
+    """
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS poses (
+            key TEXT PRIMARY KEY,
+            name TEXT NOT NULL,
+            data TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS poses_name ON poses (name);
+        CREATE TABLE IF NOT EXISTS pose_tags (
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (tag, key)
+        ) WITHOUT ROWID;
+        CREATE TABLE IF NOT EXISTS thumbnails (
+            key TEXT PRIMARY KEY,
+            image BLOB NOT NULL
+        );
+    """
+
+    def __init__(self, path: str, cache_size: int = 64):
+        self.path = path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Dict[str, float]]]" = OrderedDict()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(self.SCHEMA)
+
+    def close(self):
+        """Close the database connection"""
+        self.connection.close()
+        self._cache.clear()
+
+    def add_pose(self, key: str, name: str, pose_data: Dict[str, Dict[str, float]],
+                 tags: Iterable[str] = (), thumbnail: Optional[bytes] = None):
+        """Add or replace a pose in the library"""
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO poses (key, name, data) VALUES (?, ?, ?)",
+                (key, name, json.dumps(pose_data))
+            )
+            self.connection.execute("DELETE FROM pose_tags WHERE key = ?", (key,))
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO pose_tags (tag, key) VALUES (?, ?)",
+                [(tag, key) for tag in tags]
+            )
+            if thumbnail is not None:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO thumbnails (key, image) VALUES (?, ?)",
+                    (key, sqlite3.Binary(thumbnail))
+                )
+
+        self._cache.pop(key, None)
+
+    def remove_pose(self, key: str):
+        """Remove a pose, its tags and its thumbnail"""
+        with self.connection:
+            self.connection.execute("DELETE FROM poses WHERE key = ?", (key,))
+            self.connection.execute("DELETE FROM pose_tags WHERE key = ?", (key,))
+            self.connection.execute("DELETE FROM thumbnails WHERE key = ?", (key,))
+
+        self._cache.pop(key, None)
+
+    def get_pose(self, key: str) -> Optional[Dict[str, Dict[str, float]]]:
+        """Get pose data by key, loading it from disk on a cache miss"""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        row = self.connection.execute("SELECT data FROM poses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        pose_data = json.loads(row[0])
+        self._cache[key] = pose_data
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+        return pose_data
+
+    def get_thumbnail(self, key: str) -> Optional[bytes]:
+        """Get the thumbnail image bytes stored with a pose"""
+        row = self.connection.execute("SELECT image FROM thumbnails WHERE key = ?", (key,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def get_name(self, key: str) -> Optional[str]:
+        """Get the display name of a pose"""
+        row = self.connection.execute("SELECT name FROM poses WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def find(self, name: Optional[str] = None, tag: Optional[str] = None, limit: int = 100) -> List[str]:
+        """Find pose keys by name prefix and/or tag"""
+        query = "SELECT poses.key FROM poses"
+        conditions = []
+        params: List[Any] = []
+
+        if tag:
+            query += " JOIN pose_tags ON pose_tags.key = poses.key"
+            conditions.append("pose_tags.tag = ?")
+            params.append(tag)
+        if name:
+            # Range scan on the name index instead of LIKE
+            conditions.append("poses.name >= ? AND poses.name < ?")
+            params.extend([name, name + "\uffff"])
+
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        query += " ORDER BY poses.name LIMIT ?"
+        params.append(limit)
+
+        return [row[0] for row in self.connection.execute(query, params)]
+
+    def get_tags(self, key: str) -> List[str]:
+        """Get the tags of a pose"""
+        rows = self.connection.execute("SELECT tag FROM pose_tags WHERE key = ?", (key,))
+        return [row[0] for row in rows]
+
+    def list_tags(self) -> List[str]:
+        """List every tag used in the library"""
+        return [row[0] for row in self.connection.execute("SELECT DISTINCT tag FROM pose_tags")]
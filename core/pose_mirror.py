@@ -0,0 +1,143 @@
+# core/pose_mirror.py
+import numpy as np
+from typing import List, Dict, Callable, Iterable, Optional, Tuple
+
+# Attributes whose sign flips when mirroring across each world axis
+DEFAULT_FLIP_ATTRIBUTES = {
+    "X": {"translateX", "rotateY", "rotateZ"},
+    "Y": {"translateY", "rotateX", "rotateZ"},
+    "Z": {"translateZ", "rotateX", "rotateY"},
+}
+
+def split_namespace(node: str) -> Tuple[str, str]:
+    """Split a node name into (namespace, short name)"""
+    namespace, _, short_name = node.rpartition(":")
+    return namespace, short_name
+
+class MirrorTable:
+    """Precomputed mapping from each node.attribute to its mirror counterpart.
+
+    Every attribute of the rig gets an index; `counterparts[i]` is the index
+    of the mirrored attribute and `signs[i]` the sign flip for the mirror
+    axis, so mirroring a pose is one gather and one multiply over an array.
+    """
+    def __init__(self, node_attrs: Dict[str, Iterable[str]], mirror_name: Callable[[str], str],
+                 axis: str = "X", flip_attributes: Optional[Dict[str, set]] = None):
+        self.axis = axis
+        flip = (flip_attributes or DEFAULT_FLIP_ATTRIBUTES).get(axis, set())
+
+        # Mirror the short name so namespaces are kept as they are
+        self.node_mirrors: Dict[str, str] = {}
+        for node in node_attrs:
+            namespace, short_name = split_namespace(node)
+            mirrored = mirror_name(short_name)
+            self.node_mirrors[node] = f"{namespace}:{mirrored}" if namespace else mirrored
+
+        self.attr_paths: List[Tuple[str, str]] = []
+        self.attr_index: Dict[Tuple[str, str], int] = {}
+        for node, attrs in node_attrs.items():
+            for attr in attrs:
+                self.attr_index[(node, attr)] = len(self.attr_paths)
+                self.attr_paths.append((node, attr))
+
+        # Node of each attribute, used to build side masks without a Python loop
+        self.node_names = list(node_attrs)
+        node_ids = {node: i for i, node in enumerate(self.node_names)}
+        self.attr_nodes = np.array([node_ids[node] for node, _ in self.attr_paths], dtype=int)
+
+        count = len(self.attr_paths)
+        self.counterparts = np.arange(count)
+        self.signs = np.ones(count)
+        for i, (node, attr) in enumerate(self.attr_paths):
+            # Attributes without a counterpart in the rig mirror onto themselves
+            self.counterparts[i] = self.attr_index.get((self.node_mirrors[node], attr), i)
+            if attr in flip:
+                self.signs[i] = -1.0
+
+        # Attributes on nodes that have no separate mirror node (spine, root...)
+        self.is_center = self.counterparts == np.arange(count)
+
+    def to_array(self, pose_data: Dict[str, Dict[str, float]]) -> np.ndarray:
+        """Convert sparse pose data to an array, NaN where the pose has no value"""
+        values = np.full(len(self.attr_paths), np.nan)
+        for node, attrs in pose_data.items():
+            for attr, value in attrs.items():
+                index = self.attr_index.get((node, attr))
+                if index is not None:
+                    values[index] = value
+        return values
+
+    def to_pose(self, values: np.ndarray) -> Dict[str, Dict[str, float]]:
+        """Convert an array back to sparse pose data"""
+        pose_data: Dict[str, Dict[str, float]] = {}
+        for i in np.flatnonzero(~np.isnan(values)):
+            node, attr = self.attr_paths[i]
+            pose_data.setdefault(node, {})[attr] = float(values[i])
+        return pose_data
+
+    def flip(self, values: np.ndarray) -> np.ndarray:
+        """Swap both sides of a pose, center attributes are negated in place"""
+        return values[self.counterparts] * self.signs
+
+    def mirror(self, values: np.ndarray, source_mask: np.ndarray) -> np.ndarray:
+        """Copy the source side of a pose onto the opposite side, replacing what was there"""
+        source = np.flatnonzero(source_mask & ~self.is_center & ~np.isnan(values))
+
+        result = values.copy()
+        result[self.counterparts[source]] = values[source] * self.signs[source]
+        return result
+
+    def source_mask(self, nodes: Iterable[str]) -> np.ndarray:
+        """Boolean mask of all attributes that belong to the given nodes"""
+        nodes = set(nodes)
+        node_ids = [i for i, node in enumerate(self.node_names) if node in nodes]
+        return np.isin(self.attr_nodes, node_ids)
+
+    def is_one_side(self, nodes: Iterable[str]) -> bool:
+        """True if the nodes include side nodes and none of their mirrors"""
+        nodes = set(nodes)
+        sided = [node for node in nodes if self.node_mirrors.get(node, node) != node]
+        return bool(sided) and not any(self.node_mirrors[node] in nodes for node in sided)
+
+class PoseMirror:
+    """Build mirror tables once per rig and namespace and mirror poses with them"""
+    def __init__(self, mirror_tools, flip_attributes: Optional[Dict[str, set]] = None):
+        self.mirror_tools = mirror_tools
+        self.flip_attributes = flip_attributes
+        self._tables: Dict[Tuple[str, str, str], MirrorTable] = {}
+
+    def get_table(self, rig: str, namespace: str, node_attrs: Callable[[], Dict[str, Iterable[str]]],
+                  axis: str = "X") -> MirrorTable:
+        """Get the cached table for a rig, building it with node_attrs() on a miss"""
+        key = (rig, namespace, axis)
+        if key not in self._tables:
+            self._tables[key] = MirrorTable(
+                node_attrs(), self.mirror_tools.mirror_node_name, axis, self.flip_attributes
+            )
+        return self._tables[key]
+
+    def invalidate(self, rig: Optional[str] = None):
+        """Drop cached tables for one rig, or all of them"""
+        if rig is None:
+            self._tables.clear()
+        else:
+            for key in [key for key in self._tables if key[0] == rig]:
+                del self._tables[key]
+
+    def mirror_pose(self, table: MirrorTable, pose_data: Dict[str, Dict[str, float]],
+                    mode: str = "mirror", source_nodes: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, float]]:
+        """Return a mirrored ("mirror") or side-swapped ("flip") copy of a pose.
+        
+        Mirroring copies the side of source_nodes onto the other side, so it
+        needs them: a pose with values on both sides has no side of its own.
+        """
+        values = table.to_array(pose_data)
+
+        if mode == "flip":
+            result = table.flip(values)
+        else:
+            if source_nodes is None:
+                raise ValueError("Mirroring a pose needs the nodes of the side to mirror from")
+            result = table.mirror(values, table.source_mask(source_nodes))
+
+        return table.to_pose(result)
@@ -0,0 +1,94 @@
+# core/selection_sets.py
+import hashlib
+import os
+import re
+import maya.cmds as cmds
+from utils.undo import MayaUndoSuspended
+
+SET_PREFIX = "pickerSelect_"
+OWNER_ATTR = "pickerOwner"  # String attribute naming the picker a set was made for
+
+def picker_owner(picker_name: str, file_path: str = None) -> str:
+    """Owner tag of a picker's sets, unique per picker file once the file is saved"""
+    if not file_path:
+        return picker_name
+    digest = hashlib.sha1(os.path.normcase(os.path.abspath(file_path)).encode("utf-8")).hexdigest()[:8]
+    return f"{picker_name}_{digest}"
+
+def selection_set_name(owner: str, button_id: str) -> str:
+    """Scene name of the objectSet backing a select button"""
+    return re.sub(r"\W", "_", f"{SET_PREFIX}{owner}_{button_id}")
+
+class SelectionSetManager:
+    """Back select buttons with Maya objectSets.
+
+    A set is (re)built from the button's target nodes only when the targets
+    differ from the ones it was last built from, so a click is a single
+    select command with no per-node name resolution. Sets are scene helpers,
+    building or deleting them never adds undo entries. Sets are named and
+    tagged by their owner, the picker and the file it was loaded from (see
+    picker_owner), so two files never share a set and cleaning up only
+    touches sets of the given owners.
+    """
+    def __init__(self):
+        self.signatures = {}  # set name: target nodes the set was built from
+
+    def invalidate(self):
+        """Rebuild every set on next use, e.g. after the scene changed"""
+        self.signatures.clear()
+
+    def ensure(self, button, owner: str) -> str:
+        """Name of the up to date set of a button, building it if needed"""
+        name = selection_set_name(owner, button.id)
+        targets = tuple(button.target_nodes)
+        if self.signatures.get(name) == targets:
+            return name
+
+        nodes = cmds.ls(list(targets)) or []
+        with MayaUndoSuspended():
+            if cmds.objExists(name):
+                cmds.sets(clear=name)
+                if nodes:
+                    cmds.sets(nodes, add=name)
+            else:
+                name = cmds.sets(nodes, name=name) if nodes else cmds.sets(empty=True, name=name)
+            if not cmds.objExists(f"{name}.{OWNER_ATTR}"):
+                cmds.addAttr(name, longName=OWNER_ATTR, dataType="string")
+            cmds.setAttr(f"{name}.{OWNER_ATTR}", owner, type="string")
+
+        if not nodes:
+            cmds.warning(f"No valid target nodes found for button '{button.label}'")
+        button.selection_set = name
+        self.signatures[name] = targets
+        return name
+
+    def select(self, button, owner: str):
+        """Select the targets of a button through its set"""
+        name = self.ensure(button, owner)
+        try:
+            cmds.select(name, replace=True)
+        except ValueError:
+            # The set was deleted behind our back, rebuild it once
+            self.signatures.pop(name, None)
+            cmds.select(self.ensure(button, owner), replace=True)
+
+    def owner(self, name: str):
+        """Owner a set was created for, or None for sets this tool did not tag"""
+        if not cmds.objExists(f"{name}.{OWNER_ATTR}"):
+            return None
+        return cmds.getAttr(f"{name}.{OWNER_ATTR}")
+
+    def collect_garbage(self, owners, linked_names) -> list:
+        """Delete sets created for the given owners that none of their buttons links to anymore"""
+        owners = set(owners)
+        linked_names = set(linked_names)
+        stale = [
+            name for name in cmds.ls(f"{SET_PREFIX}*", type="objectSet") or []
+            if name not in linked_names and self.owner(name) in owners
+        ]
+        if stale:
+            with MayaUndoSuspended():
+                cmds.delete(stale)
+            for name in stale:
+                self.signatures.pop(name, None)
+        return stale
@@ -0,0 +1,90 @@
+# core/slider_drag.py
+import time
+import maya.cmds as cmds
+from utils.undo import MayaUndoChunk, MayaUndoSuspended
+
+class SliderDragSession:
+    """Interactive drag of a Slider (1D or 2D).
+
+    Mouse moves update the button at event rate, but values are written to
+    Maya at most once per `min_interval` and outside the undo queue. A
+    throttled move schedules one trailing write, so the rig catches up when
+    the mouse stops. On release the attributes are put back to their start
+    values and the final value is written once inside a single undo chunk.
+    """
+    def __init__(self, button, min_interval: float = 1.0 / 60.0, clock=time.perf_counter, schedule=None):
+        self.button = button
+        self.min_interval = min_interval
+        self.clock = clock
+        self.schedule = schedule or self._schedule_timer
+
+        self.attr_paths = []
+        if button.target_node and button.attribute:
+            self.attr_paths.append((f"{button.target_node}.{button.attribute}", "current_value"))
+        if button.is_2d and button.target_node and button.second_attribute:
+            self.attr_paths.append((f"{button.target_node}.{button.second_attribute}", "second_current_value"))
+        self.attr_paths = [(path, field) for path, field in self.attr_paths if cmds.objExists(path)]
+
+        self.start_values = {path: cmds.getAttr(path) for path, _ in self.attr_paths}
+        self.started = clock()
+        self.last_write = None
+        self.written_update = 0  # update_count when values were last written
+        self.trailing_scheduled = False
+        self.finished = False
+        self.update_count = 0
+        self.write_count = 0
+
+    def update(self, value: float, second_value: float = None):
+        """Move the slider, writing to Maya only if a frame has passed"""
+        self.update_count += 1
+        self.button.current_value = value
+        if second_value is not None:
+            self.button.second_current_value = second_value
+
+        now = self.clock()
+        if self.last_write is None or now - self.last_write >= self.min_interval:
+            self.flush(now)
+        elif not self.trailing_scheduled:
+            self.trailing_scheduled = True
+            self.schedule(self._trailing_flush, self.min_interval - (now - self.last_write))
+
+    def _schedule_timer(self, func, delay):
+        from PySide2 import QtCore
+        QtCore.QTimer.singleShot(max(0, int(delay * 1000)), func)
+
+    def _trailing_flush(self):
+        """Write the value of moves that arrived inside the throttle window"""
+        self.trailing_scheduled = False
+        if not self.finished and self.update_count > self.written_update:
+            self.flush()
+
+    def flush(self, now=None):
+        """Write the latest value without recording undo"""
+        with MayaUndoSuspended():
+            self._write()
+        self.last_write = self.clock() if now is None else now
+        self.written_update = self.update_count
+
+    def _write(self):
+        for path, field in self.attr_paths:
+            try:
+                cmds.setAttr(path, getattr(self.button, field))
+            except Exception as e:
+                cmds.warning(f"Slider operation failed: {str(e)}")
+        self.write_count += 1
+
+    def finish(self):
+        """Commit the final value as one undo step and return drag statistics"""
+        self.finished = True
+        with MayaUndoSuspended():
+            for path, value in self.start_values.items():
+                cmds.setAttr(path, value)
+
+        with MayaUndoChunk():
+            self._write()
+
+        return {
+            "updates": self.update_count,
+            "writes": self.write_count,
+            "duration": self.clock() - self.started,
+        }
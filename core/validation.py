@@ -0,0 +1,124 @@
+# core/validation.py
+import maya.cmds as cmds
+from dataclasses import dataclass, field
+from typing import Dict, List, Iterable
+from .model import AttributeButton, Slider, Checkbox, RadiusButton, attribute_targets
+from .node_index import button_nodes, short_name
+
+@dataclass
+class ButtonReport:
+    picker: str
+    button_id: str
+    label: str
+    missing_nodes: List[str] = field(default_factory=list)
+    missing_attributes: List[str] = field(default_factory=list)
+    ambiguous_nodes: List[str] = field(default_factory=list)  # Names that match more than one node
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing_nodes and not self.missing_attributes and not self.ambiguous_nodes
+
+@dataclass
+class ValidationReport:
+    buttons: List[ButtonReport] = field(default_factory=list)
+    node_count: int = 0
+    attribute_count: int = 0
+
+    @property
+    def broken(self) -> List[ButtonReport]:
+        return [report for report in self.buttons if not report.ok]
+
+    def broken_ids(self, picker_name: str) -> List[str]:
+        """Ids of the broken buttons of one picker"""
+        return [report.button_id for report in self.broken if report.picker == picker_name]
+
+    def to_dict(self) -> Dict:
+        """Broken buttons as plain data, for logs and pipeline checks"""
+        return {
+            "checked_nodes": self.node_count,
+            "checked_attributes": self.attribute_count,
+            "broken": [
+                {
+                    "picker": report.picker,
+                    "id": report.button_id,
+                    "label": report.label,
+                    "missing_nodes": report.missing_nodes,
+                    "missing_attributes": report.missing_attributes,
+                    "ambiguous_nodes": report.ambiguous_nodes,
+                }
+                for report in self.broken
+            ],
+        }
+
+def button_attributes(button) -> List[str]:
+    """node.attribute paths a button reads or writes"""
+    attr_paths = []
+    if isinstance(button, (AttributeButton, Checkbox, RadiusButton)) and button.attribute:
+        attr_paths.extend(f"{node}.{button.attribute}" for node in attribute_targets(button))
+    elif isinstance(button, Slider) and button.target_node:
+        for attribute in (button.attribute, button.second_attribute if button.is_2d else ""):
+            if attribute:
+                attr_paths.append(f"{button.target_node}.{attribute}")
+    for node, attrs in (getattr(button, 'pose_data', None) or {}).items():
+        attr_paths.extend(f"{node}.{attr}" for attr in attrs)
+    return attr_paths
+
+def node_matches(node: str, long_names: Dict[str, List[str]]) -> List[str]:
+    """Long names of the scene nodes a name or DAG path refers to.
+
+    long_names maps short names to the long names of every node with that
+    short name. A DAG path has to match the end of the long name, from the
+    root when it starts with "|".
+    """
+    candidates = long_names.get(short_name(node), [])
+    if "|" not in node:
+        return candidates
+    if node.startswith("|"):
+        return [long_name for long_name in candidates if long_name == node]
+    return [long_name for long_name in candidates if long_name.endswith("|" + node)]
+
+def validate_pickers(pickers: Iterable) -> ValidationReport:
+    """Check every node and attribute referenced by the buttons of all pickers.
+
+    References are gathered first, then checked with one cmds.ls for nodes and
+    one for attributes. Nodes are matched on the long names ls returns, so a
+    DAG path only counts as found when that path exists, and a name matching
+    several nodes is reported as ambiguous. Only attributes ls did not echo
+    back verbatim (aliases, DAG paths) are confirmed one by one with objExists.
+    """
+    references = []
+    all_nodes = set()
+    all_attributes = set()
+    for picker in pickers:
+        for button in picker.buttons:
+            nodes = sorted(button_nodes(button))
+            attr_paths = button_attributes(button)
+            references.append((picker.name, button, nodes, attr_paths))
+            all_nodes.update(nodes)
+            all_attributes.update(attr_paths)
+
+    # ls lists every match of a name, with long=True as full DAG paths
+    long_names = {}  # short name: long names
+    for long_name in (cmds.ls(list(all_nodes), long=True) or [] if all_nodes else []):
+        long_names.setdefault(short_name(long_name), []).append(long_name)
+    match_counts = {node: len(set(node_matches(node, long_names))) for node in all_nodes}
+    existing_nodes = {node for node, count in match_counts.items() if count == 1}
+    # Attributes on missing or ambiguous nodes are already reported through the node
+    attr_paths = [p for p in all_attributes if p.split(".", 1)[0] in existing_nodes]
+    existing_attributes = set(cmds.ls(attr_paths) or []) if attr_paths else set()
+    for attr_path in attr_paths:
+        if attr_path not in existing_attributes and cmds.objExists(attr_path):
+            existing_attributes.add(attr_path)
+
+    report = ValidationReport(node_count=len(all_nodes), attribute_count=len(all_attributes))
+    for picker_name, button, nodes, button_attr_paths in references:
+        missing_nodes = [node for node in nodes if match_counts[node] == 0]
+        ambiguous_nodes = [node for node in nodes if match_counts[node] > 1]
+        missing_attributes = [
+            p for p in button_attr_paths
+            if p.split(".", 1)[0] in existing_nodes and p not in existing_attributes
+        ]
+        report.buttons.append(ButtonReport(
+            picker_name, button.id, button.label, missing_nodes, missing_attributes, ambiguous_nodes
+        ))
+    return report
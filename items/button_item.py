@@ -0,0 +1,218 @@
+# items/button_item.py
+from PySide2 import QtWidgets, QtCore, QtGui
+from core.model import Slider, PoseBlendSlider
+from ui.level_of_detail import LOD_FAR, LOD_MID, LOD_FULL
+
+SELECTION_PEN = QtGui.QPen(QtCore.Qt.white, 0, QtCore.Qt.DashLine)
+HOVER_PEN = QtGui.QPen(QtGui.QColor(255, 255, 255, 140), 0)
+TRACK_BRUSH = QtGui.QBrush(QtGui.QColor(160, 160, 164))
+THUMB_BRUSH = QtGui.QBrush(QtGui.QColor(255, 0, 0))
+
+class ButtonGraphicsItem(QtWidgets.QGraphicsItem):
+    """Picker button drawn as one item: shape and label in a single paint().
+
+    The shape path is shared through the canvas shape cache and positioned
+    with setPos. Bounds and hit shape are computed once and only recomputed
+    when the pen width changes.
+
+    With a shared LevelOfDetail the item paints less as the view zooms out:
+    simplified shapes and a slider value bar at mid zoom, and only a flat
+    fill far out, where outlines are kept for highlighted or selected buttons.
+
+    Painting is split into static art (shape and label) and dynamic
+    decorations (highlight, hover, selection, slider internals). When the
+    item belongs to a ButtonLayer the layer draws its art from cached tiles
+    and the item only paints decorations, or nothing at all, until it is
+    lifted out of the layer by a drag.
+
+    Buttons with an `svg_path` are skinned with a pixmap from the shared
+    SVGUtils render cache instead of their shape fill.
+    """
+    def __init__(self, button, path, brush, pen, label_pen=None, label_font=None, label_renderer=None,
+                 simple_path=None, lod=None, layer=None, svg_utils=None, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.simple_path = simple_path or path
+        self.lod = lod
+        self.layer = layer
+        self.lifted = False
+        self.hovered = False
+        self.brush = brush
+        self.pen = pen
+        self.base_pen = pen
+        self.slider = button if isinstance(button, (Slider, PoseBlendSlider)) else None
+        self.label = button.label
+        self.label_pen = label_pen
+        self.label_font = label_font
+        self.label_renderer = label_renderer
+        self.svg_path = getattr(button, "svg_path", None)
+        self.svg_utils = svg_utils
+        self._label_text = None
+        self._label_pos = None
+        self._label_bucket = None  # Zoom bucket the label layout was made for
+        self._bounds = None
+
+        self.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
+        self.setAcceptHoverEvents(True)
+        self.setData(0, button.id)
+        self.update_contents_flag()
+
+    def setPen(self, pen):
+        """Change the outline, e.g. for highlights"""
+        if pen.widthF() != self.pen.widthF():
+            self.prepareGeometryChange()
+            self._bounds = None
+        self.pen = pen
+        self.update_contents_flag()
+        self.update()
+
+    def has_decorations(self) -> bool:
+        return bool(self.slider or self.hovered or self.isSelected() or self.pen is not self.base_pen)
+
+    def update_contents_flag(self):
+        """Let Qt skip paint() while the layer draws everything this item shows"""
+        self.setFlag(QtWidgets.QGraphicsItem.ItemHasNoContents,
+                     bool(self.layer) and not self.lifted and not self.has_decorations())
+
+    def itemChange(self, change, value):
+        # Positioning before the item is added to the scene is not a drag
+        if change == QtWidgets.QGraphicsItem.ItemPositionChange and self.layer and not self.lifted and self.scene():
+            self.layer.lift(self)
+        elif change == QtWidgets.QGraphicsItem.ItemSelectedHasChanged:
+            self.update_contents_flag()
+        return super().itemChange(change, value)
+
+    def hoverEnterEvent(self, event):
+        self.hovered = True
+        self.update_contents_flag()
+        self.update()
+        super().hoverEnterEvent(event)
+
+    def hoverLeaveEvent(self, event):
+        self.hovered = False
+        self.update_contents_flag()
+        self.update()
+        super().hoverLeaveEvent(event)
+
+    def boundingRect(self):
+        if self._bounds is None:
+            margin = max(self.pen.widthF(), 1.0) / 2
+            self._bounds = self.path.boundingRect().adjusted(-margin, -margin, margin, margin)
+        return self._bounds
+
+    def shape(self):
+        return self.path
+
+    def paint(self, painter, option, widget=None):
+        # The large render profiles turn on DontSavePainterState, so the
+        # hints, pen, brush and font set below must not leak to the next item
+        tier = self.lod.tier if self.lod else LOD_FULL
+        painter.save()
+        if not self.layer or self.lifted:
+            self.paint_art(painter, tier)
+        self.paint_decorations(painter, tier, option.state & QtWidgets.QStyle.State_Selected)
+        painter.restore()
+
+    def paint_art(self, painter, tier):
+        """Shape and label, the part a ButtonLayer caches"""
+        if tier == LOD_FAR:
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+            painter.fillRect(self.path.boundingRect(), self.brush)
+            return
+
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, tier == LOD_FULL)
+        if not (self.svg_path and self._paint_svg(painter)):
+            painter.setPen(self.base_pen)
+            painter.setBrush(self.brush)
+            painter.drawPath(self.path if tier == LOD_FULL else self.simple_path)
+
+        if self.label and self.label_pen:
+            self._paint_label(painter)
+
+    def _paint_svg(self, painter) -> bool:
+        """Blit the SVG skin rendered for the current scale, False if it cannot be drawn"""
+        if not self.svg_utils:
+            return False
+        rect = self.path.boundingRect()
+        scale = painter.worldTransform().m11() * painter.device().devicePixelRatioF()
+        pixmap = self.svg_utils.render_svg(self.svg_path, rect.size(), self.svg_utils.pixel_ratio(scale))
+        if pixmap is None:
+            return False
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        painter.drawPixmap(rect, pixmap, QtCore.QRectF(pixmap.rect()))
+        return True
+
+    def paint_decorations(self, painter, tier, selected):
+        """Slider internals and state outlines, repainted on their own"""
+        if self.slider and tier != LOD_FAR:
+            self._paint_slider(painter, tier)
+
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, tier == LOD_FULL)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        outline = self.path if tier == LOD_FULL else self.simple_path
+        if self.pen is not self.base_pen:
+            painter.setPen(self.pen)
+            if tier == LOD_FAR:
+                painter.drawRect(self.path.boundingRect())
+            else:
+                painter.drawPath(outline)
+        if self.hovered:
+            painter.setPen(HOVER_PEN)
+            painter.drawPath(outline)
+        if selected:
+            painter.setPen(SELECTION_PEN)
+            painter.drawRect(self.path.boundingRect())
+
+    def _slider_fractions(self):
+        """Slider values as fractions of their ranges, second is None for 1D"""
+        slider = self.slider
+        if isinstance(slider, PoseBlendSlider):
+            return slider.blend_value, None
+        span = (slider.range_max - slider.range_min) or 1.0
+        value_x = (slider.current_value - slider.range_min) / span
+        if not slider.is_2d:
+            return value_x, None
+        second_span = (slider.second_range_max - slider.second_range_min) or 1.0
+        return value_x, (slider.second_current_value - slider.second_range_min) / second_span
+
+    def _paint_slider(self, painter, tier):
+        """Track and thumb at full detail, a value bar at mid zoom"""
+        rect = self.path.boundingRect()
+        fraction_x, fraction_y = self._slider_fractions()
+        track_width = rect.width() - 10
+        track = QtCore.QRectF(rect.left() + 5, rect.center().y() - 2, track_width, 4)
+        if tier == LOD_MID:
+            painter.fillRect(QtCore.QRectF(track.left(), track.top(), track_width * fraction_x, 4), THUMB_BRUSH)
+            return
+
+        painter.fillRect(track, TRACK_BRUSH)
+        painter.setPen(self.base_pen)
+        painter.setBrush(THUMB_BRUSH)
+        thumb_x = track.left() + fraction_x * track_width
+        if fraction_y is None:
+            painter.drawRect(QtCore.QRectF(thumb_x - 5, rect.top() + 5, 10, rect.height() - 10))
+        else:
+            thumb_y = rect.top() + 5 + fraction_y * (rect.height() - 10)
+            painter.drawEllipse(QtCore.QRectF(thumb_x - 5, thumb_y - 5, 10, 10))
+
+    def _paint_label(self, painter):
+        rect = self.path.boundingRect()
+        if not self.label_renderer:
+            painter.setPen(self.label_pen)
+            if self.label_font:
+                painter.setFont(self.label_font)
+            painter.drawText(rect, QtCore.Qt.AlignCenter, self.label)
+            return
+
+        # Lay the label out again only when the zoom bucket changes
+        bucket = self.label_renderer.zoom_bucket(painter)
+        if bucket != self._label_bucket:
+            layout = self.label_renderer.layout(self.label, self.label_font, rect.width(), bucket)
+            self._label_bucket = bucket
+            self._label_text = layout[0]
+            self._label_pos = self.label_renderer.position(rect, layout)
+        painter.setPen(self.label_pen)
+        painter.setFont(self.label_font)
+        painter.drawStaticText(self._label_pos, self._label_text)
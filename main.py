@@ -94,6 +94,32 @@ def show_picker_tool():
         # Create main window
         window = PickerMainWindow(controller, main_window)
         
+        # Highlight buttons whose targets are selected in the viewport
+        try:
+            from utils.selection_sync import SelectionSync
+            controller.selection_sync = SelectionSync(controller, window.canvas.highlight_buttons)
+            controller.selection_sync.start()
+        except Exception as e:
+            print(f"Could not start selection sync: {e}")
+        
+        # Keep slider, checkbox and radius values live
+        try:
+            from utils.attribute_sync import AttributeSyncService, MayaAttributeSource
+            controller.attribute_sync = AttributeSyncService(MayaAttributeSource(), window.canvas.refresh_buttons)
+            # The first picker is already loaded, later switches rebind through the controller
+            if controller.model.current_picker:
+                controller.attribute_sync.set_buttons(controller.model.current_picker.buttons)
+        except Exception as e:
+            print(f"Could not start attribute sync: {e}")
+        
+        # Keep button targets pointing at renamed nodes
+        try:
+            from utils.rename_tracker import RenameTracker
+            controller.rename_tracker = RenameTracker(controller, window.canvas.refresh_buttons)
+            controller.rename_tracker.start()
+        except Exception as e:
+            print(f"Could not start rename tracking: {e}")
+        
         # Try to add optional panels (removed search tool)
         try:
             from ui.mirror_panel import MirrorPanel
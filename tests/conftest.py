@@ -0,0 +1,39 @@
+# tests/conftest.py
+"""Headless test setup: the tool's modules on sys.path and empty stand-ins for Maya.
+
+Modules bind maya.cmds at import time, so the stand-in modules live for
+the whole session and tests fill in the functions they need with
+monkeypatch.
+"""
+import os
+import sys
+import types
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+def _install_maya_stubs():
+    maya = types.ModuleType("maya")
+    cmds = types.ModuleType("maya.cmds")
+    api = types.ModuleType("maya.api")
+    open_maya = types.ModuleType("maya.api.OpenMaya")
+    cmds.warning = lambda message: None
+    cmds.undoInfo = lambda **kwargs: True
+    maya.cmds, maya.api, api.OpenMaya = cmds, api, open_maya
+    sys.modules.update({"maya": maya, "maya.cmds": cmds, "maya.api": api, "maya.api.OpenMaya": open_maya})
+
+try:
+    import maya.cmds  # noqa: F401
+except ImportError:
+    _install_maya_stubs()
+
+@pytest.fixture
+def cmds():
+    """The maya.cmds module, patch functions onto it with monkeypatch"""
+    return sys.modules["maya.cmds"]
+
+@pytest.fixture
+def open_maya():
+    """The maya.api.OpenMaya module, patch classes onto it with monkeypatch"""
+    return sys.modules["maya.api.OpenMaya"]
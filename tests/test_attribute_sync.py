@@ -0,0 +1,225 @@
+# tests/test_attribute_sync.py
+import math
+import types
+
+import pytest
+
+from core.model import Slider, Checkbox
+from utils.attribute_sync import AttributeSyncService, MayaAttributeSource, LocalAttributeSource
+
+ATTRIBUTE_SET = 1 << 11  # MNodeMessage.kAttributeSet
+
+class FakeAttribute:
+    def __init__(self, unit=None):
+        self.unit = unit
+
+    def hasFn(self, kind):
+        return self.unit is not None
+
+class FakeValue:
+    """MAngle/MDistance stand-in holding a value in internal units"""
+    def __init__(self, value, to_ui):
+        self.value = value
+        self.to_ui = to_ui
+
+    def asUnits(self, unit):
+        return self.to_ui(self.value)
+
+class FakePlug:
+    def __init__(self, long_name, short_name, value=0.0, unit=None, children=()):
+        self.long_name = long_name
+        self.short_name = short_name
+        self.value = value
+        self.unit = unit
+        self.children = list(children)
+
+    def partialName(self, useLongNames=False):
+        return self.long_name if useLongNames else self.short_name
+
+    @property
+    def isCompound(self):
+        return bool(self.children)
+
+    def numChildren(self):
+        return len(self.children)
+
+    def child(self, index):
+        return self.children[index]
+
+    def attribute(self):
+        return FakeAttribute(self.unit)
+
+    def asDouble(self):
+        return self.value
+
+    def asMAngle(self):
+        return FakeValue(self.value, math.degrees)
+
+class FakeScene:
+    """Nodes with plugs and the callbacks registered on them"""
+    def __init__(self):
+        self.plugs = {}  # (node, long or short name): plug
+        self.callbacks = {}  # id: (node, function)
+        self.lookups = 0
+
+    def add(self, node, plug):
+        self.plugs[(node, plug.long_name)] = self.plugs[(node, plug.short_name)] = plug
+        for child in plug.children:
+            self.add(node, child)
+
+    def set_attr(self, node, name, value=None):
+        """Set a plug and notify like Maya; compound plugs notify once for the parent"""
+        plug = self.plugs[(node, name)]
+        if value is not None:
+            for child, child_value in zip(plug.children, value) if plug.children else [(plug, value)]:
+                child.value = child_value
+        for callback_node, function in list(self.callbacks.values()):
+            if callback_node == node:
+                function(ATTRIBUTE_SET, plug, None, None)
+
+    def open_maya(self):
+        scene = self
+
+        class MSelectionList:
+            def __init__(self):
+                self.items = []
+
+            def add(self, path):
+                scene.lookups += 1
+                node, _, name = path.partition(".")
+                if name and (node, name) not in scene.plugs:
+                    raise RuntimeError(path)
+                if not name and not any(key[0] == node for key in scene.plugs):
+                    raise RuntimeError(path)
+                self.items.append((node, name))
+
+            def getPlug(self, index):
+                return scene.plugs[self.items[index]]
+
+            def getDependNode(self, index):
+                return self.items[index][0]
+
+        class MNodeMessage:
+            kAttributeSet = ATTRIBUTE_SET
+
+            @staticmethod
+            def addAttributeChangedCallback(node, function):
+                callback_id = len(scene.callbacks) + 1
+                scene.callbacks[callback_id] = (node, function)
+                return callback_id
+
+        class MEventMessage:
+            @staticmethod
+            def addEventCallback(name, function):
+                return -1
+
+        class MMessage:
+            @staticmethod
+            def removeCallback(callback_id):
+                scene.callbacks.pop(callback_id, None)
+
+        class MFnUnitAttribute:
+            kAngle, kDistance, kTime = 1, 2, 3
+
+            def __init__(self, attribute):
+                self.attribute = attribute
+
+            def unitType(self):
+                return self.attribute.unit
+
+        return types.SimpleNamespace(
+            MSelectionList=MSelectionList, MNodeMessage=MNodeMessage, MEventMessage=MEventMessage,
+            MMessage=MMessage, MFnUnitAttribute=MFnUnitAttribute, MFn=types.SimpleNamespace(kUnitAttribute=1),
+            MAngle=types.SimpleNamespace(uiUnit=lambda: "degrees"),
+        )
+
+@pytest.fixture
+def scene(monkeypatch, open_maya):
+    scene = FakeScene()
+    translate = FakePlug("translate", "t", children=[
+        FakePlug("translateX", "tx"), FakePlug("translateY", "ty"), FakePlug("translateZ", "tz"),
+    ])
+    scene.add("ctrl", translate)
+    scene.add("ctrl", FakePlug("rotateY", "ry", unit=1))
+    scene.add("ctrl", FakePlug("visibility", "v", value=1.0))
+    for name, value in vars(scene.open_maya()).items():
+        monkeypatch.setattr(open_maya, name, value, raising=False)
+    return scene
+
+def make_service(source):
+    refreshed = []
+    scheduled = []
+    service = AttributeSyncService(source, refreshed.append, schedule=lambda func, delay: scheduled.append(func))
+    return service, refreshed, scheduled
+
+def flush(scheduled):
+    while scheduled:
+        scheduled.pop(0)()
+
+def test_short_names_refresh_when_compound_is_set(scene):
+    slider = Slider(id="tx", target_node="ctrl", attribute="tx", range_min=-10, range_max=10)
+    service, refreshed, scheduled = make_service(MayaAttributeSource())
+    service.set_buttons([slider])
+    assert set(service.bindings) == {"ctrl.translateX"}
+
+    # The move tool sets the compound, not its children
+    scene.set_attr("ctrl", "translate", (4.0, 1.0, 2.0))
+    flush(scheduled)
+    assert slider.current_value == 4.0
+    assert refreshed == [{"tx"}]
+
+def test_read_converts_angles_to_ui_units(scene):
+    slider = Slider(id="ry", target_node="ctrl", attribute="ry", range_min=-180, range_max=180)
+    service, refreshed, scheduled = make_service(MayaAttributeSource())
+    service.set_buttons([slider])
+
+    scene.set_attr("ctrl", "rotateY", math.pi / 2)
+    flush(scheduled)
+    assert slider.current_value == pytest.approx(90.0)
+
+def test_plugs_are_resolved_once(scene):
+    buttons = [
+        Slider(id="tx", target_node="ctrl", attribute="translateX"),
+        Checkbox(id="v", target_node="ctrl", attribute="v"),
+    ]
+    source = MayaAttributeSource()
+    service, refreshed, scheduled = make_service(source)
+    service.set_buttons(buttons)
+    lookups = scene.lookups
+
+    for value in range(5):
+        scene.set_attr("ctrl", "translateX", float(value))
+        scene.set_attr("ctrl", "visibility", 1.0)
+        flush(scheduled)
+    assert scene.lookups == lookups
+    assert buttons[0].current_value == 4.0
+    assert buttons[1].is_checked
+
+def test_unwatched_node_is_ignored(scene):
+    source = MayaAttributeSource()
+    service, refreshed, scheduled = make_service(source)
+    service.set_buttons([Slider(id="gone", target_node="missing", attribute="tx")])
+    assert source.node_callbacks == {}
+    assert source.read(["missing.tx"]) == {}
+
+def test_local_source_resolves_short_names():
+    source = LocalAttributeSource({"ctrl.translateX": 0.0}, long_names={"tx": "translateX"})
+    slider = Slider(id="tx", target_node="ctrl", attribute="tx")
+    service, refreshed, scheduled = make_service(source)
+    service.set_buttons([slider])
+
+    source.set_value("ctrl.translateX", 3.0)
+    source.set_value("ctrl.tx", 5.0)
+    flush(scheduled)
+    assert slider.current_value == 5.0
+    assert source.read_count == 1
+
+def test_new_buttons_show_scene_values(scene):
+    scene.plugs[("ctrl", "translateY")].value = 6.0
+    slider = Slider(id="ty", target_node="ctrl", attribute="ty", current_value=0.0)
+    service, refreshed, scheduled = make_service(MayaAttributeSource())
+    service.set_buttons([slider])
+
+    flush(scheduled)
+    assert slider.current_value == 6.0
+    assert refreshed == [{"ty"}]
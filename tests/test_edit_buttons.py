@@ -0,0 +1,45 @@
+# tests/test_edit_buttons.py
+import pytest
+
+from core.controller import PickerController
+from core.model import SelectButton, Vector2
+from utils.undo import UndoRedoManager
+
+@pytest.fixture
+def controller():
+    controller = PickerController()
+    controller.undo_manager = UndoRedoManager()
+    controller.create_new_picker("body")
+    controller.set_current_picker("body")
+    controller.model.current_picker.buttons = [SelectButton(id="arm", label="Arm", target_nodes=["ctrl_arm"])]
+    return controller
+
+def current_button(controller, button_id):
+    return controller.get_button_by_id(button_id)
+
+def test_edit_undo_after_snapshot_undo(controller):
+    controller.edit_buttons({"arm": {"label": "Left Arm", "position": Vector2(10, 20)}})
+    controller.add_button("select", id="leg")
+    controller.undo()  # Swaps in a copy of the buttons list
+    assert current_button(controller, "arm").label == "Left Arm"
+
+    controller.undo()
+    arm = current_button(controller, "arm")
+    assert arm.label == "Arm"
+    assert arm.position == Vector2(0, 0)
+
+    controller.redo()
+    assert current_button(controller, "arm").label == "Left Arm"
+
+def test_undo_retarget_updates_node_index(controller):
+    controller.edit_buttons({"arm": {"target_nodes": ["L_arm_ctrl"]}})
+    controller.add_button("select", id="leg")
+    controller.undo()
+    controller.undo()
+    assert current_button(controller, "arm").target_nodes == ["ctrl_arm"]
+    assert controller.get_node_index().buttons_for("ctrl_arm") == {"arm"}
+    assert controller.get_node_index().buttons_for("L_arm_ctrl") == set()
+
+def test_unchanged_values_are_not_undoable(controller):
+    assert controller.edit_buttons({"arm": {"label": "Arm"}}) == set()
+    assert controller.undo_manager.get_undo_label() == "Undo"
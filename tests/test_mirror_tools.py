@@ -0,0 +1,32 @@
+# tests/test_mirror_tools.py
+from core.model import PoseButton, SelectButton, Vector2
+from utils.mirror_tools import MirrorTools
+
+def test_mirrored_pose_button_keys_its_pose_by_the_mirrored_nodes():
+    pose = PoseButton(
+        id="wave", position=Vector2(10, 0), size=Vector2(20, 20),
+        target_nodes=["L_arm_ctrl", "spine_ctrl"],
+        pose_data={"L_arm_ctrl": {"translateX": 2.0, "translateY": 5.0, "rotateY": 30.0}, "spine_ctrl": {"rotateZ": 15.0}},
+    )
+    updates, created = MirrorTools().mirror_buttons([pose], [pose], center=(50, 0))
+    assert updates == []
+    (source, mirrored), = created
+
+    assert mirrored.target_nodes == ["R_arm_ctrl", "spine_ctrl"]
+    assert mirrored.pose_data == {
+        "R_arm_ctrl": {"translateX": -2.0, "translateY": 5.0, "rotateY": -30.0},
+        "spine_ctrl": {"rotateZ": -15.0},
+    }
+    assert set(mirrored.pose_data) <= set(mirrored.target_nodes)
+    # The source keeps its own pose
+    assert pose.pose_data["L_arm_ctrl"]["translateX"] == 2.0
+
+def test_mirror_pose_data_keeps_namespaces():
+    pose_data = {"rig:L_hand_ctrl": {"rotateZ": 20.0, "scaleX": 1.5}}
+    assert MirrorTools().mirror_pose_data(pose_data) == {"rig:R_hand_ctrl": {"rotateZ": -20.0, "scaleX": 1.5}}
+
+def test_select_buttons_are_unaffected():
+    button = SelectButton(id="arm", size=Vector2(20, 20), target_nodes=["L_arm_ctrl"])
+    updates, created = MirrorTools().mirror_buttons([button], [button])
+    assert created[0][1].target_nodes == ["R_arm_ctrl"]
+    assert not hasattr(created[0][1], "pose_data")
@@ -0,0 +1,42 @@
+# tests/test_pose_blend.py
+import numpy as np
+import pytest
+
+from core.pose_blend import PoseBlender
+
+@pytest.fixture
+def writes(monkeypatch, cmds):
+    writes = {}
+    monkeypatch.setattr(cmds, "setAttr", writes.__setitem__, raising=False)
+    return writes
+
+def make_blender(epsilon=0.01):
+    poses = [{"ctrl": {"tx": 10.0, "ty": 0.005, "tz": 1.0}}]
+    blender = PoseBlender(poses, epsilon)
+    blender.set_base([0.0, 0.0, 1.0])
+    blender.valid[:] = True
+    return blender
+
+def test_only_moved_values_are_written(writes):
+    blender = make_blender()
+    # ty moves less than epsilon and tz not at all
+    assert blender.apply([1.0]) == 1
+    assert writes == {"ctrl.tx": 10.0}
+    assert list(blender.sent_values) == [10.0, 0.0, 1.0]
+
+def test_changes_are_measured_from_the_last_write(writes):
+    blender = make_blender()
+    blender.apply([0.5])
+    writes.clear()
+
+    assert blender.apply([0.5005]) == 0  # tx moves by 0.005
+    assert blender.apply([0.502]) == 1  # 0.02 since the last write, not since the last tick
+    assert writes == {"ctrl.tx": pytest.approx(5.02)}
+
+def test_invalid_attributes_are_never_written(writes):
+    blender = make_blender()
+    blender.valid[0] = False
+    blender.epsilon = 0.001
+    assert blender.apply([1.0]) == 1
+    assert writes == {"ctrl.ty": 0.005}
+    assert np.isclose(blender.sent_values[0], 0.0)
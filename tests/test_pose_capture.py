@@ -0,0 +1,84 @@
+# tests/test_pose_capture.py
+import pytest
+
+from core.controller import PickerController
+from core.model import PoseButton
+from utils.undo import UndoRedoManager
+
+DEFAULTS = {"translateX": 0.0, "rotateZ": 0.0, "scaleX": 1.0}
+
+class FakeCapture:
+    """PoseCapture over an in-memory scene of keyable attributes"""
+    def __init__(self, scene):
+        self.scene = scene
+
+    def defaults(self, nodes):
+        return {node: dict(DEFAULTS) for node in nodes if node in self.scene}
+
+    def capture(self, nodes, reference=None):
+        reference = reference or {}
+        pose = {}
+        for node in nodes:
+            values = {attr: value for attr, value in self.scene[node].items()
+                      if value != reference.get(node, {}).get(attr, DEFAULTS[attr])}
+            if values:
+                pose[node] = values
+        return pose
+
+@pytest.fixture
+def scene(monkeypatch, cmds):
+    scene = {"ctrl_arm": dict(DEFAULTS), "ctrl_hand": dict(DEFAULTS)}
+
+    def set_attr(attr_path, value):
+        node, attr = attr_path.split(".")
+        scene[node][attr] = value
+
+    def obj_exists(name):
+        node, _, attr = name.partition(".")
+        return node in scene and (not attr or attr in scene[node])
+
+    monkeypatch.setattr(cmds, "objExists", obj_exists, raising=False)
+    monkeypatch.setattr(cmds, "setAttr", set_attr, raising=False)
+    return scene
+
+@pytest.fixture
+def controller(scene):
+    controller = PickerController()
+    controller.undo_manager = UndoRedoManager()
+    controller.pose_capture = FakeCapture(scene)
+    controller.create_new_picker("body")
+    controller.set_current_picker("body")
+    controller.model.current_picker.buttons = [
+        PoseButton(id="rest", target_nodes=["ctrl_arm", "ctrl_hand"]),
+        PoseButton(id="wave", target_nodes=["ctrl_arm", "ctrl_hand"]),
+    ]
+    return controller
+
+def test_applying_a_capture_resets_left_out_attributes(controller, scene):
+    scene["ctrl_arm"]["rotateZ"] = 45.0
+    pose = controller.capture_pose("wave")
+    assert pose == {"ctrl_arm": {"rotateZ": 45.0}}
+
+    scene["ctrl_arm"]["translateX"] = 3.0
+    scene["ctrl_hand"]["scaleX"] = 2.0
+    scene["ctrl_arm"]["rotateZ"] = 0.0
+    controller.execute_button("wave")
+    assert scene["ctrl_arm"] == {"translateX": 0.0, "rotateZ": 45.0, "scaleX": 1.0}
+    assert scene["ctrl_hand"] == DEFAULTS
+
+def test_reference_capture_resets_to_the_reference(controller, scene):
+    scene["ctrl_arm"]["translateX"] = 5.0
+    controller.capture_pose("rest")
+    scene["ctrl_arm"]["rotateZ"] = 30.0
+    assert controller.capture_pose("wave", reference_id="rest") == {"ctrl_arm": {"rotateZ": 30.0}}
+
+    scene["ctrl_arm"].update(translateX=0.0, rotateZ=0.0)
+    controller.execute_button("wave")
+    assert scene["ctrl_arm"] == {"translateX": 5.0, "rotateZ": 30.0, "scaleX": 1.0}
+
+def test_hand_made_poses_only_set_their_values(controller, scene):
+    button = controller.get_button_by_id("wave")
+    button.pose_data = {"ctrl_arm": {"rotateZ": 10.0}}
+    scene["ctrl_arm"]["translateX"] = 3.0
+    controller.execute_button("wave")
+    assert scene["ctrl_arm"] == {"translateX": 3.0, "rotateZ": 10.0, "scaleX": 1.0}
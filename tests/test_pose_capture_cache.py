@@ -0,0 +1,134 @@
+# tests/test_pose_capture_cache.py
+import types
+
+import pytest
+
+from core.pose_capture import PoseCapture
+
+class FakePlug:
+    def __init__(self, node, attr):
+        self.node = node
+        self.attr = attr
+
+    def attribute(self):
+        return types.SimpleNamespace(hasFn=lambda kind: False)
+
+    def asDouble(self, context=None):
+        return self.node.values[self.attr]
+
+class FakeNode:
+    def __init__(self, name, **values):
+        self.name = name
+        self.values = values
+
+class FakeScene:
+    """Named nodes, the plugs resolved on them and the registered callbacks"""
+    def __init__(self, *nodes):
+        self.nodes = {node.name: node for node in nodes}
+        self.lookups = 0
+        self.callbacks = {}  # kind: [function]
+        self.fail_callbacks = False
+
+    def rename(self, old_name, new_name):
+        node = self.nodes.pop(old_name)
+        node.name = new_name
+        self.nodes[new_name] = node
+        for function in self.callbacks.get("name", []):
+            function(node, old_name, None)
+
+    def delete(self, name):
+        node = self.nodes.pop(name)
+        for function in self.callbacks.get("removed", []):
+            function(node, None)
+
+    def open_maya(self):
+        scene = self
+
+        def register(kind):
+            def add(*args):
+                if scene.fail_callbacks:
+                    raise RuntimeError("No callbacks")
+                function = next(arg for arg in args if callable(arg))
+                scene.callbacks.setdefault(kind, []).append(function)
+                return len(scene.callbacks)
+            return add
+
+        class MSelectionList:
+            def add(self, name):
+                self.node = scene.nodes[name]
+
+            def getDependNode(self, index):
+                return self.node
+
+        class MFnDependencyNode:
+            def __init__(self, node):
+                self.node = node
+
+            def name(self):
+                return self.node.name
+
+            def findPlug(self, attr, want_networked):
+                scene.lookups += 1
+                return FakePlug(self.node, attr)
+
+        return types.SimpleNamespace(
+            MSelectionList=MSelectionList, MFnDependencyNode=MFnDependencyNode,
+            MDGContext=types.SimpleNamespace(kNormal=None), MObject=types.SimpleNamespace(kNullObj=None),
+            MFn=types.SimpleNamespace(kUnitAttribute=1, kNumericAttribute=2, kEnumAttribute=3),
+            MDGMessage=types.SimpleNamespace(addNodeRemovedCallback=register("removed")),
+            MNodeMessage=types.SimpleNamespace(addNameChangedCallback=register("name")),
+            MDagMessage=types.SimpleNamespace(addAllDagChangesCallback=register("dag")),
+            MSceneMessage=types.SimpleNamespace(addCallback=register("scene"), kAfterOpen=1, kAfterNew=2,
+                                                kAfterLoadReference=3, kAfterUnloadReference=4),
+            MMessage=types.SimpleNamespace(removeCallback=lambda callback_id: None),
+        )
+
+@pytest.fixture
+def scene(monkeypatch, cmds):
+    scene = FakeScene(FakeNode("ctrl_arm", translateX=1.0, rotateZ=0.0), FakeNode("ctrl_leg", translateX=0.0))
+    monkeypatch.setattr(cmds, "ls", lambda names: [name for name in names if name in scene.nodes], raising=False)
+    monkeypatch.setattr(cmds, "listAttr", lambda node, **kwargs: list(scene.nodes[node].values), raising=False)
+    monkeypatch.setattr("core.pose_capture.om", scene.open_maya())
+    return scene
+
+def test_layouts_are_resolved_once(scene):
+    capture = PoseCapture()
+    assert capture.capture(["ctrl_arm", "ctrl_leg"]) == {"ctrl_arm": {"translateX": 1.0}}
+    lookups = scene.lookups
+
+    scene.nodes["ctrl_leg"].values["translateX"] = 2.0
+    assert capture.capture(["ctrl_arm", "ctrl_leg"]) == {"ctrl_arm": {"translateX": 1.0}, "ctrl_leg": {"translateX": 2.0}}
+    assert scene.lookups == lookups
+
+def test_rename_drops_the_old_layout(scene):
+    capture = PoseCapture()
+    capture.capture(["ctrl_arm"])
+    scene.rename("ctrl_arm", "L_arm_ctrl")
+    scene.nodes["ctrl_arm"] = FakeNode("ctrl_arm", translateX=7.0)
+
+    assert capture.capture(["ctrl_arm"]) == {"ctrl_arm": {"translateX": 7.0}}
+
+def test_deleted_node_is_resolved_again(scene):
+    capture = PoseCapture()
+    capture.capture(["ctrl_leg"])
+    lookups = scene.lookups
+    scene.delete("ctrl_leg")
+    scene.nodes["ctrl_leg"] = FakeNode("ctrl_leg", translateX=3.0)
+
+    assert capture.capture(["ctrl_leg"]) == {"ctrl_leg": {"translateX": 3.0}}
+    assert scene.lookups == lookups + 1
+
+def test_scene_open_clears_every_layout(scene):
+    capture = PoseCapture()
+    capture.capture(["ctrl_arm", "ctrl_leg"])
+    for function in scene.callbacks["scene"]:
+        function()
+    assert capture._layouts == {}
+
+def test_nothing_is_cached_without_callbacks(scene):
+    scene.fail_callbacks = True
+    capture = PoseCapture()
+    capture.capture(["ctrl_arm"])
+    capture.capture(["ctrl_arm"])
+    assert scene.lookups == 4
+    assert capture._layouts == {}
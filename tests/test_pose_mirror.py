@@ -0,0 +1,88 @@
+# tests/test_pose_mirror.py
+import pytest
+
+from core.controller import PickerController
+from core.model import PoseButton
+from core.pose_mirror import MirrorTable, PoseMirror
+from utils.mirror_tools import MirrorTools
+
+ATTRS = ["translateX", "translateY", "rotateY"]
+NODES = ["L_arm_ctrl", "R_arm_ctrl", "spine_ctrl"]
+
+# Left arm raised, right arm bent, spine leaning
+TWO_SIDED_POSE = {
+    "L_arm_ctrl": {"translateX": 2.0, "translateY": 5.0, "rotateY": 30.0},
+    "R_arm_ctrl": {"translateX": -1.0, "translateY": 0.5, "rotateY": -10.0},
+    "spine_ctrl": {"rotateY": 15.0},
+}
+
+@pytest.fixture
+def table():
+    return MirrorTable({node: ATTRS for node in NODES}, MirrorTools().mirror_node_name)
+
+def test_mirror_copies_one_side_and_flip_swaps_both(table):
+    pose_mirror = PoseMirror(MirrorTools())
+    mirrored = pose_mirror.mirror_pose(table, TWO_SIDED_POSE, "mirror", ["L_arm_ctrl"])
+    flipped = pose_mirror.mirror_pose(table, TWO_SIDED_POSE, "flip")
+    assert mirrored != flipped
+
+    # The left side stays and is copied onto the right
+    assert mirrored["L_arm_ctrl"] == TWO_SIDED_POSE["L_arm_ctrl"]
+    assert mirrored["R_arm_ctrl"] == {"translateX": -2.0, "translateY": 5.0, "rotateY": -30.0}
+    assert mirrored["spine_ctrl"] == {"rotateY": 15.0}
+    # Flipping swaps the sides and negates the center
+    assert flipped["L_arm_ctrl"] == {"translateX": 1.0, "translateY": 0.5, "rotateY": 10.0}
+    assert flipped["R_arm_ctrl"] == {"translateX": -2.0, "translateY": 5.0, "rotateY": -30.0}
+    assert flipped["spine_ctrl"] == {"rotateY": -15.0}
+
+def test_mirror_needs_a_source_side(table):
+    with pytest.raises(ValueError):
+        PoseMirror(MirrorTools()).mirror_pose(table, TWO_SIDED_POSE, "mirror")
+
+def test_one_side(table):
+    assert table.is_one_side(["L_arm_ctrl", "spine_ctrl"])
+    assert not table.is_one_side(["L_arm_ctrl", "R_arm_ctrl"])
+    assert not table.is_one_side(["spine_ctrl"])
+
+@pytest.fixture
+def scene(monkeypatch, cmds):
+    scene = {"selection": [], "values": {}}
+
+    def ls(names=None, selection=False):
+        if selection:
+            return list(scene["selection"])
+        return [name for name in names if name in NODES]
+
+    def set_attr(attr_path, value):
+        scene["values"][attr_path] = value
+
+    monkeypatch.setattr(cmds, "ls", ls, raising=False)
+    monkeypatch.setattr(cmds, "listAttr", lambda node, **kwargs: list(ATTRS), raising=False)
+    monkeypatch.setattr(cmds, "objExists", lambda name: name.split(".")[0] in NODES, raising=False)
+    monkeypatch.setattr(cmds, "setAttr", set_attr, raising=False)
+    return scene
+
+@pytest.fixture
+def controller(scene):
+    controller = PickerController()
+    controller.create_new_picker("body")
+    controller.set_current_picker("body")
+    controller.model.current_picker.buttons = [
+        PoseButton(id="both", target_nodes=list(TWO_SIDED_POSE), pose_data=TWO_SIDED_POSE),
+        PoseButton(id="left", target_nodes=["L_arm_ctrl"], pose_data={"L_arm_ctrl": {"rotateY": 45.0}}),
+    ]
+    return controller
+
+def test_two_sided_pose_mirrors_from_the_selection(controller, scene):
+    assert controller.apply_mirrored_pose("both") is None  # No side to mirror from
+
+    scene["selection"] = ["R_arm_ctrl"]
+    mirrored = controller.apply_mirrored_pose("both")
+    assert mirrored["L_arm_ctrl"] == {"translateX": 1.0, "translateY": 0.5, "rotateY": 10.0}
+    assert mirrored["R_arm_ctrl"] == TWO_SIDED_POSE["R_arm_ctrl"]
+    assert scene["values"]["L_arm_ctrl.rotateY"] == 10.0
+
+def test_one_sided_targets_are_the_source(controller, scene):
+    mirrored = controller.apply_mirrored_pose("left")
+    assert mirrored["R_arm_ctrl"] == {"rotateY": -45.0}
+    assert mirrored["L_arm_ctrl"] == {"rotateY": 45.0}
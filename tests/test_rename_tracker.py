@@ -0,0 +1,78 @@
+# tests/test_rename_tracker.py
+import pytest
+
+from core.controller import PickerController
+from core.model import SelectButton, PoseButton
+from utils.rename_tracker import RenameTracker
+from utils.undo import UndoRedoManager
+
+@pytest.fixture
+def controller():
+    controller = PickerController()
+    controller.undo_manager = UndoRedoManager()
+    controller.create_new_picker("body")
+    controller.create_new_picker("face")
+    controller.set_current_picker("body")
+    controller.model.current_picker.buttons = [
+        SelectButton(id="arm", target_nodes=["|rig|ctrl_arm", "ctrl_hand"]),
+        SelectButton(id="leg", target_nodes=["ctrl_leg"]),
+        PoseButton(id="wave", pose_data={"ctrl_arm": {"rotateZ": 45.0}}),
+    ]
+    controller.model.pickers["face"].buttons = [SelectButton(id="jaw", target_nodes=["ctrl_arm"])]
+    return controller
+
+def make_tracker(controller):
+    scheduled = []
+    renamed = []
+    tracker = RenameTracker(controller, on_renamed=renamed.append, schedule=scheduled.append)
+    return tracker, scheduled, renamed
+
+def test_rename_retargets_buttons(controller):
+    tracker, scheduled, renamed = make_tracker(controller)
+    tracker.node_renamed("ctrl_arm", "temp")
+    tracker.node_renamed("temp", "L_arm_ctrl")
+    assert len(scheduled) == 1  # One flush for the whole burst
+
+    scheduled.pop()()
+    body = controller.model.pickers["body"].buttons
+    assert body[0].target_nodes == ["|rig|L_arm_ctrl", "ctrl_hand"]
+    assert body[1].target_nodes == ["ctrl_leg"]
+    assert body[2].pose_data == {"L_arm_ctrl": {"rotateZ": 45.0}}
+    assert controller.model.pickers["face"].buttons[0].target_nodes == ["L_arm_ctrl"]
+    assert renamed == [{"arm", "wave", "jaw"}]
+    assert controller.get_node_index().buttons_for("L_arm_ctrl") == {"arm", "wave"}
+    assert controller.get_node_index().buttons_for("ctrl_arm") == set()
+
+def test_undo_restores_targets(controller):
+    tracker, scheduled, renamed = make_tracker(controller)
+    tracker.node_renamed("ctrl_arm", "L_arm_ctrl")
+    scheduled.pop()()
+
+    controller.undo()
+    body = controller.model.pickers["body"].buttons
+    assert body[0].target_nodes == ["|rig|ctrl_arm", "ctrl_hand"]
+    assert body[2].pose_data == {"ctrl_arm": {"rotateZ": 45.0}}
+    assert controller.model.pickers["face"].buttons[0].target_nodes == ["ctrl_arm"]
+
+    controller.redo()
+    assert body[0].target_nodes == ["|rig|L_arm_ctrl", "ctrl_hand"]
+    assert controller.model.pickers["face"].buttons[0].target_nodes == ["L_arm_ctrl"]
+
+def test_unrelated_rename_is_not_undoable(controller):
+    tracker, scheduled, renamed = make_tracker(controller)
+    tracker.node_renamed("pCube1", "box")
+    scheduled.pop()()
+    assert renamed == []
+    assert controller.undo_manager.get_undo_label() == "Undo"
+
+def test_undo_after_buttons_list_was_replaced(controller):
+    tracker, scheduled, renamed = make_tracker(controller)
+    tracker.node_renamed("ctrl_arm", "L_arm_ctrl")
+    scheduled.pop()()
+    controller.add_button("select", id="extra")
+    controller.undo()  # Swaps in a copy of the buttons list
+
+    controller.undo()
+    arm = controller.get_button_by_id("arm")
+    assert arm.target_nodes == ["|rig|ctrl_arm", "ctrl_hand"]
+    assert controller.get_node_index().buttons_for("ctrl_arm") == {"arm", "wave"}
@@ -0,0 +1,121 @@
+# tests/test_selection_sets.py
+import pytest
+
+from core.model import SelectButton
+from core.selection_sets import SelectionSetManager, OWNER_ATTR, picker_owner
+
+class FakeSetCmds:
+    """The maya.cmds calls objectSet code makes, against an in-memory scene"""
+    def __init__(self, nodes):
+        self.nodes = set(nodes)
+        self.object_sets = {}
+        self.attributes = {}
+        self.selection = []
+        self.created = 0
+
+    def objExists(self, name):
+        return name in self.nodes or name in self.object_sets or name in self.attributes
+
+    def ls(self, names, type=None):
+        if isinstance(names, str):
+            prefix = names.rstrip("*")
+            return [name for name in self.object_sets if name.startswith(prefix)]
+        return [name for name in names if name in self.nodes]
+
+    def sets(self, nodes=None, name=None, add=None, clear=None, empty=False):
+        if clear:
+            self.object_sets[clear] = []
+        elif add:
+            self.object_sets[add].extend(nodes)
+        else:
+            self.created += 1
+            self.object_sets[name] = list(nodes or [])
+            return name
+
+    def select(self, name, replace=False):
+        if name not in self.object_sets:
+            raise ValueError(name)
+        self.selection = list(self.object_sets[name])
+
+    def addAttr(self, name, longName=None, dataType=None):
+        self.attributes[f"{name}.{longName}"] = ""
+
+    def setAttr(self, attr_path, value, type=None):
+        self.attributes[attr_path] = value
+
+    def getAttr(self, attr_path):
+        return self.attributes[attr_path]
+
+    def delete(self, names):
+        for name in names:
+            self.object_sets.pop(name)
+            for attr_path in [path for path in self.attributes if path.startswith(f"{name}.")]:
+                del self.attributes[attr_path]
+
+@pytest.fixture
+def scene(monkeypatch, cmds):
+    scene = FakeSetCmds(["ctrl_a", "ctrl_b", "ctrl_c"])
+    for name in ("objExists", "ls", "sets", "select", "addAttr", "setAttr", "getAttr", "delete"):
+        monkeypatch.setattr(cmds, name, getattr(scene, name), raising=False)
+    return scene
+
+def test_set_is_created_once_and_reused(scene):
+    manager = SelectionSetManager()
+    button = SelectButton(id="arm", target_nodes=["ctrl_a", "ctrl_b"], use_selection_set=True)
+
+    for _ in range(3):
+        manager.select(button, "body")
+    assert scene.created == 1
+    assert scene.selection == ["ctrl_a", "ctrl_b"]
+    assert scene.getAttr(f"{button.selection_set}.{OWNER_ATTR}") == "body"
+
+    # Retargeting rebuilds the same set
+    button.target_nodes = ["ctrl_c"]
+    manager.select(button, "body")
+    assert scene.created == 1
+    assert scene.selection == ["ctrl_c"]
+
+def test_deleted_set_is_rebuilt(scene):
+    manager = SelectionSetManager()
+    button = SelectButton(id="arm", target_nodes=["ctrl_a"], use_selection_set=True)
+    manager.select(button, "body")
+
+    scene.delete([button.selection_set])
+    manager.select(button, "body")
+    assert scene.created == 2
+    assert scene.selection == ["ctrl_a"]
+
+def test_garbage_collection_only_touches_own_pickers(scene):
+    manager = SelectionSetManager()
+    kept = SelectButton(id="kept", target_nodes=["ctrl_a"], use_selection_set=True)
+    dropped = SelectButton(id="dropped", target_nodes=["ctrl_b"], use_selection_set=True)
+    other = SelectButton(id="other", target_nodes=["ctrl_c"], use_selection_set=True)
+    manager.select(kept, "body")
+    manager.select(dropped, "body")
+    manager.select(other, "face")  # Owned by a picker file that is not loaded
+    scene.sets(name="pickerSelect_untagged")  # Not made by this tool
+
+    deleted = manager.collect_garbage(["body"], [kept.selection_set])
+    assert deleted == [dropped.selection_set]
+    assert set(scene.object_sets) == {kept.selection_set, other.selection_set, "pickerSelect_untagged"}
+
+    # The dropped button gets a fresh set if it is used again
+    manager.select(dropped, "body")
+    assert scene.selection == ["ctrl_b"]
+
+def test_files_with_the_same_picker_do_not_share_sets(scene):
+    manager = SelectionSetManager()
+    first, second = picker_owner("body", "/rigs/hero.json"), picker_owner("body", "/rigs/hero_copy.json")
+    assert first != second and first == picker_owner("body", "/rigs/../rigs/hero.json")
+
+    hero = SelectButton(id="arm", target_nodes=["ctrl_a"], use_selection_set=True)
+    copy = SelectButton(id="arm", target_nodes=["ctrl_b"], use_selection_set=True)
+    manager.select(hero, first)
+    manager.select(copy, second)
+    assert hero.selection_set != copy.selection_set
+
+    # Cleaning up the copy's unlinked sets leaves the other file's set alone
+    assert manager.collect_garbage([second], []) == [copy.selection_set]
+    manager.select(hero, first)
+    assert scene.created == 2
+    assert scene.selection == ["ctrl_a"]
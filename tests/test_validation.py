@@ -0,0 +1,66 @@
+# tests/test_validation.py
+import pytest
+
+from core.model import Picker, SelectButton, AttributeButton
+from core.validation import validate_pickers
+
+# Long names of the scene, two nodes share the short name "ctrl"
+SCENE = ["|grp1|ctrl", "|grp2|ctrl", "|grp2|hand_ctrl", "|rig:arm_ctrl"]
+ATTRIBUTES = {"hand_ctrl.ikFk"}
+
+def short_name(node):
+    return node.rsplit("|", 1)[-1]
+
+def matches(name):
+    if name.startswith("|"):
+        return [node for node in SCENE if node == name]
+    if "|" in name:
+        return [node for node in SCENE if node.endswith("|" + name)]
+    return [node for node in SCENE if short_name(node) == name]
+
+@pytest.fixture
+def scene(monkeypatch, cmds):
+    def ls(names, long=False):
+        found = []
+        for name in names:
+            if "." in name:
+                found += [name] if name in ATTRIBUTES else []
+            else:
+                found += matches(name) if long else [short_name(node) for node in matches(name)]
+        return found
+
+    monkeypatch.setattr(cmds, "ls", ls, raising=False)
+    monkeypatch.setattr(cmds, "objExists", lambda name: name in ATTRIBUTES, raising=False)
+
+def validate(*buttons):
+    picker = Picker(name="body")
+    picker.buttons = list(buttons)
+    return {report.button_id: report for report in validate_pickers([picker]).buttons}
+
+def test_existing_and_missing_nodes(scene):
+    reports = validate(
+        SelectButton(id="ok", target_nodes=["hand_ctrl", "rig:arm_ctrl", "grp1|ctrl", "|grp2|ctrl"]),
+        SelectButton(id="missing", target_nodes=["hand_ctrl", "foot_ctrl"]),
+        AttributeButton(id="attr", target_node="hand_ctrl", attribute="ikFk"),
+    )
+    assert reports["ok"].ok
+    assert reports["missing"].missing_nodes == ["foot_ctrl"]
+    assert reports["attr"].ok
+
+def test_dag_path_must_exist(scene):
+    # "ctrl" exists elsewhere, but not under grp3
+    report = validate(SelectButton(id="path", target_nodes=["grp3|ctrl", "|ctrl"]))["path"]
+    assert report.missing_nodes == ["grp3|ctrl", "|ctrl"]
+    assert report.ambiguous_nodes == []
+
+def test_ambiguous_short_names(scene):
+    reports = validate(
+        SelectButton(id="short", target_nodes=["ctrl", "hand_ctrl"]),
+        AttributeButton(id="attr", target_node="ctrl", attribute="ikFk"),
+    )
+    assert not reports["short"].ok
+    assert reports["short"].ambiguous_nodes == ["ctrl"]
+    assert reports["short"].missing_nodes == []
+    # The attribute is not checked on a node that cannot be told apart
+    assert reports["attr"].ambiguous_nodes == ["ctrl"]
+    assert reports["attr"].missing_attributes == []
@@ -0,0 +1,367 @@
+# ui/background_image.py
+import hashlib
+import json
+import math
+import os
+import shutil
+import tempfile
+import time
+from collections import OrderedDict
+from PySide2 import QtCore, QtGui
+
+TILE_SIZE = 512
+# Pyramids past these limits are deleted, least recently shown first
+CACHE_MAX_BYTES = 1024 * 1024 * 1024
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+def default_cache_dir() -> str:
+    """Per-user folder for tile pyramids, under the temp folder if Qt has none"""
+    base = QtCore.QStandardPaths.writableLocation(QtCore.QStandardPaths.CacheLocation)
+    return os.path.join(base or tempfile.gettempdir(), "maya_picker_tool", "background_tiles")
+
+def prune_cache(cache_dir: str, max_bytes: int = CACHE_MAX_BYTES, max_age: float = CACHE_MAX_AGE, keep=()):
+    """Delete pyramid folders older than max_age, then the oldest until the rest fit in max_bytes.
+
+    A folder's age is the time since its manifest was last touched, which
+    load() does every time it shows the image. Folders in `keep` stay.
+    Returns the deleted folder names.
+    """
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return []
+    keep = {os.path.basename(os.path.normpath(folder)) for folder in keep}
+    folders = []  # (last used, bytes, name)
+    for name in names:
+        folder = os.path.join(cache_dir, name)
+        if name in keep or not os.path.isdir(folder):
+            continue
+        manifest_path = os.path.join(folder, "manifest.json")
+        try:
+            used = os.path.getmtime(manifest_path if os.path.exists(manifest_path) else folder)
+            size = sum(entry.stat().st_size for entry in os.scandir(folder) if entry.is_file())
+        except OSError:
+            continue
+        folders.append((used, size, name))
+
+    folders.sort()
+    total = sum(size for _, size, _ in folders)
+    oldest_kept = time.time() - max_age
+    deleted = []
+    for used, size, name in folders:
+        if used >= oldest_kept and total <= max_bytes:
+            break
+        shutil.rmtree(os.path.join(cache_dir, name), ignore_errors=True)
+        total -= size
+        deleted.append(name)
+    return deleted
+
+def pyramid_key(path: str) -> str:
+    """Cache folder name of an image, changes when the file does"""
+    stat = os.stat(path)
+    source = f"{os.path.abspath(path)}|{stat.st_mtime_ns}|{stat.st_size}"
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+def tile_path(folder: str, level: int, column: int, row: int, extension: str = "jpg") -> str:
+    return os.path.join(folder, f"L{level}_{column}_{row}.{extension}")
+
+def level_sizes(width: int, height: int, tile_size: int = TILE_SIZE):
+    """(width, height) of each pyramid level, halving until one tile holds the image"""
+    sizes = [(width, height)]
+    while width > tile_size or height > tile_size:
+        width, height = max(1, (width + 1) // 2), max(1, (height + 1) // 2)
+        sizes.append((width, height))
+    return sizes
+
+class _Signals(QtCore.QObject):
+    """Signals of the workers, delivered on the thread that created them"""
+    finished = QtCore.Signal(str, object)
+    failed = QtCore.Signal(str, str)
+    tile_loaded = QtCore.Signal(str, object, object)
+
+class PyramidBuilder(QtCore.QRunnable):
+    """Decodes an image with QImageReader and writes its tile pyramid to disk.
+
+    The source is read as horizontal strips of whole tile rows. Each strip is
+    cut into tiles and handed down, halved, to the next level, so every level
+    only buffers less than a tile row. Formats whose reader can clip while
+    decoding (JPEG) are decoded strip by strip and never held in full. The
+    manifest is written last, a folder without one is an unfinished build.
+    Once it is written, old pyramids beside it are pruned to the cache limits.
+    """
+    # Bytes of decoded source a strip may hold
+    STRIP_BYTES = 64 * 1024 * 1024
+
+    def __init__(self, path, folder, signals, tile_size=TILE_SIZE, cache_limits=(CACHE_MAX_BYTES, CACHE_MAX_AGE)):
+        super().__init__()
+        self.path = path
+        self.folder = folder
+        self.signals = signals
+        self.tile_size = tile_size
+        self.cache_limits = cache_limits  # (max bytes, max age in seconds) of the cache folder
+
+    def run(self):
+        try:
+            manifest = self.build()
+        except Exception as e:
+            self.signals.failed.emit(self.path, str(e))
+            return
+        self.signals.finished.emit(self.path, manifest)
+        prune_cache(os.path.dirname(self.folder), *self.cache_limits, keep=[self.folder])
+
+    def _reader(self):
+        reader = QtGui.QImageReader(self.path)
+        reader.setAutoTransform(True)
+        return reader
+
+    def build(self):
+        reader = self._reader()
+        size = reader.size()
+        if not size.isValid():
+            raise IOError(reader.errorString() or "Unreadable image")
+        os.makedirs(self.folder, exist_ok=True)
+
+        self.sizes = level_sizes(size.width(), size.height(), self.tile_size)
+        self.buffers = [None] * len(self.sizes)
+        self.next_rows = [0] * len(self.sizes)
+        self.extension = None
+        for strip, last in self._source_strips(reader, size):
+            self._add_strip(0, strip, last)
+
+        manifest = {"width": size.width(), "height": size.height(), "tile_size": self.tile_size,
+                    "format": self.extension, "levels": [list(level_size) for level_size in self.sizes]}
+        with open(os.path.join(self.folder, "manifest.json"), "w") as f:
+            json.dump(manifest, f)
+        return manifest
+
+    def _source_strips(self, reader, size):
+        """(strip, is last) pairs covering the source top to bottom"""
+        rows_per_strip = max(1, self.STRIP_BYTES // (size.width() * 4 * self.tile_size)) * self.tile_size
+        if reader.supportsOption(QtGui.QImageIOHandler.ClipRect):
+            for top in range(0, size.height(), rows_per_strip):
+                strip_reader = self._reader()
+                strip_reader.setClipRect(QtCore.QRect(0, top, size.width(), min(rows_per_strip, size.height() - top)))
+                strip = strip_reader.read()
+                if strip.isNull():
+                    raise IOError(strip_reader.errorString())
+                yield strip, top + rows_per_strip >= size.height()
+        else:
+            image = reader.read()
+            if image.isNull():
+                raise IOError(reader.errorString())
+            for top in range(0, size.height(), rows_per_strip):
+                yield image.copy(0, top, size.width(), min(rows_per_strip, size.height() - top)), top + rows_per_strip >= size.height()
+
+    def _add_strip(self, level, strip, last):
+        """Write the complete tile rows of a strip and pass it down a level"""
+        if self.extension is None:
+            # Opaque sheets compress and decode far faster as JPEG tiles
+            self.extension = "png" if strip.hasAlphaChannel() else "jpg"
+        width, height = self.sizes[level]
+        rows = strip
+        if self.buffers[level] is not None:
+            rows = QtGui.QImage(width, self.buffers[level].height() + strip.height(), strip.format())
+            painter = QtGui.QPainter(rows)
+            painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+            painter.drawImage(0, 0, self.buffers[level])
+            painter.drawImage(0, self.buffers[level].height(), strip)
+            painter.end()
+
+        complete = rows.height() if last else rows.height() // self.tile_size * self.tile_size
+        for top in range(0, complete, self.tile_size):
+            self._write_row(rows.copy(0, top, width, min(self.tile_size, complete - top)), level)
+        self.buffers[level] = rows.copy(0, complete, width, rows.height() - complete) if complete < rows.height() else None
+
+        if level + 1 < len(self.sizes):
+            next_width = self.sizes[level + 1][0]
+            half = strip.scaled(next_width, max(1, (strip.height() + 1) // 2),
+                                QtCore.Qt.IgnoreAspectRatio, QtCore.Qt.SmoothTransformation)
+            self._add_strip(level + 1, half, last)
+
+    def _write_row(self, row_image, level):
+        row = self.next_rows[level]
+        self.next_rows[level] += 1
+        width = row_image.width()
+        for column in range(math.ceil(width / self.tile_size)):
+            tile = row_image.copy(column * self.tile_size, 0, min(self.tile_size, width - column * self.tile_size), row_image.height())
+            path = tile_path(self.folder, level, column, row, self.extension)
+            if not tile.save(path, self.extension.upper(), 90):
+                raise IOError(f"Could not write tile {path}")
+
+class TileLoader(QtCore.QRunnable):
+    """Reads one cached tile off the main thread"""
+    def __init__(self, folder, key, path, signals):
+        super().__init__()
+        self.folder = folder
+        self.key = key
+        self.path = path
+        self.signals = signals
+
+    def run(self):
+        self.signals.tile_loaded.emit(self.folder, self.key, QtGui.QImage(self.path))
+
+class BackgroundImage(QtCore.QObject):
+    """Picker background image painted from an on-disk tile pyramid.
+
+    Only the tiles under the exposed rect are painted, from the pyramid level
+    closest to the view scale. Missing tiles load in the thread pool while
+    the coarsest level, which is always in memory, stands in for them.
+    Loaded tiles live in an LRU sized from the viewport, so memory depends
+    on the view and not on the image. Pyramids are kept in the per-user
+    cache folder, within `cache_limits`.
+    """
+    changed = QtCore.Signal(QtCore.QRectF)  # Scene rect to repaint
+
+    def __init__(self, cache_dir=None, pool=None, parent=None):
+        super().__init__(parent)
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.cache_limits = (CACHE_MAX_BYTES, CACHE_MAX_AGE)
+        self.pool = pool or QtCore.QThreadPool.globalInstance()
+        self.signals = _Signals()
+        self.signals.finished.connect(self._pyramid_finished)
+        self.signals.failed.connect(self._pyramid_failed)
+        self.signals.tile_loaded.connect(self._tile_loaded)
+        self.path = None
+        self.folder = None
+        self.manifest = None
+        self.preview = None
+        self.tiles = OrderedDict()
+        self.pending = set()
+        self.max_tiles = 32
+
+    def load(self, path):
+        """Show an image, building its pyramid in the background if needed"""
+        if path == self.path:
+            return
+        self.clear()
+        if not path:
+            return
+        if not os.path.exists(path):
+            print(f"Background image not found: {path}")
+            return
+        self.path = path
+        self.folder = os.path.join(self.cache_dir, pyramid_key(path))
+        manifest_path = os.path.join(self.folder, "manifest.json")
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self._set_manifest(json.load(f))
+            os.utime(manifest_path)  # Most recently used, pruned last
+        else:
+            self.pool.start(PyramidBuilder(path, self.folder, self.signals, cache_limits=self.cache_limits))
+
+    def clear(self):
+        self.path = self.folder = self.manifest = self.preview = None
+        self.tiles.clear()
+        self.pending.clear()
+        self.changed.emit(QtCore.QRectF())
+
+    def bounds(self) -> QtCore.QRectF:
+        """Scene rect of the image, one scene unit per source pixel"""
+        if not self.manifest:
+            return QtCore.QRectF()
+        return QtCore.QRectF(0, 0, self.manifest["width"], self.manifest["height"])
+
+    def set_viewport_size(self, size):
+        """Keep about two screens of tiles, whatever the image size"""
+        tile_size = self.manifest["tile_size"] if self.manifest else TILE_SIZE
+        columns = math.ceil(size.width() / tile_size) + 1
+        rows = math.ceil(size.height() / tile_size) + 1
+        self.max_tiles = columns * rows * 2
+        self._trim()
+
+    def level_for_scale(self, scale: float) -> int:
+        """Coarsest level that still has a source pixel per device pixel"""
+        top = len(self.manifest["levels"]) - 1
+        if scale >= 1:
+            return 0
+        return min(top, int(math.floor(math.log2(1 / scale))))
+
+    def paint(self, painter, exposed_rect, scale: float):
+        if not self.manifest:
+            return
+        bounds = self.bounds()
+        visible = exposed_rect.intersected(bounds)
+        if visible.isEmpty():
+            return
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        # Antialiased tile edges would let the background show through the seams
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+
+        level = self.level_for_scale(scale)
+        tile_size = self.manifest["tile_size"]
+        level_width, level_height = self.manifest["levels"][level]
+        # Level sizes round up, so map tiles with the exact ratio of this level
+        ratio_x, ratio_y = bounds.width() / level_width, bounds.height() / level_height
+
+        first_column = max(0, int(visible.left() // (tile_size * ratio_x)))
+        last_column = min(math.ceil(level_width / tile_size) - 1, int(visible.right() // (tile_size * ratio_x)))
+        first_row = max(0, int(visible.top() // (tile_size * ratio_y)))
+        last_row = min(math.ceil(level_height / tile_size) - 1, int(visible.bottom() // (tile_size * ratio_y)))
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                key = (level, column, row)
+                pixmap = self.tiles.get(key)
+                width = min(tile_size, level_width - column * tile_size)
+                height = min(tile_size, level_height - row * tile_size)
+                target = QtCore.QRectF(column * tile_size * ratio_x, row * tile_size * ratio_y, width * ratio_x, height * ratio_y)
+                if pixmap is not None:
+                    self.tiles.move_to_end(key)
+                    painter.drawPixmap(target, pixmap, QtCore.QRectF(pixmap.rect()))
+                else:
+                    self._request(key)
+                    self._paint_preview(painter, target)
+        painter.restore()
+
+    def _paint_preview(self, painter, target):
+        """Stand in for a missing tile with the matching part of the coarsest level"""
+        if self.preview is None:
+            return
+        bounds = self.bounds()
+        scale_x = self.preview.width() / bounds.width()
+        scale_y = self.preview.height() / bounds.height()
+        source = QtCore.QRectF(target.left() * scale_x, target.top() * scale_y,
+                               target.width() * scale_x, target.height() * scale_y)
+        painter.drawPixmap(target, self.preview, source)
+
+    def _request(self, key):
+        if key in self.pending:
+            return
+        self.pending.add(key)
+        self.pool.start(TileLoader(self.folder, key, tile_path(self.folder, *key, self.manifest["format"]), self.signals))
+
+    def _trim(self):
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+
+    def _set_manifest(self, manifest):
+        self.manifest = manifest
+        top = len(manifest["levels"]) - 1
+        self.preview = QtGui.QPixmap(tile_path(self.folder, top, 0, 0, manifest["format"]))
+        self.changed.emit(self.bounds())
+
+    def _pyramid_finished(self, path, manifest):
+        if path == self.path:
+            self._set_manifest(manifest)
+
+    def _pyramid_failed(self, path, error):
+        if path == self.path:
+            print(f"Could not load background image {path}: {error}")
+
+    def _tile_loaded(self, folder, key, image):
+        if folder != self.folder or key not in self.pending or not self.manifest:
+            return
+        self.pending.discard(key)
+        if image.isNull():
+            return
+        self.tiles[key] = QtGui.QPixmap.fromImage(image)
+        self._trim()
+
+        level, column, row = key
+        tile_size = self.manifest["tile_size"]
+        level_width, level_height = self.manifest["levels"][level]
+        bounds = self.bounds()
+        ratio_x, ratio_y = bounds.width() / level_width, bounds.height() / level_height
+        self.changed.emit(QtCore.QRectF(column * tile_size * ratio_x, row * tile_size * ratio_y,
+                                        tile_size * ratio_x, tile_size * ratio_y))
@@ -1,7 +1,14 @@
 # ui/canvas.py - Fix panning to move items exactly with mouse
 from PySide2 import QtWidgets, QtCore, QtGui
-from core.model import ButtonType, Vector2
-import math
+from core.model import ButtonType, ShapeType, Vector2, Slider, PoseBlendSlider
+from ui.shape_cache import ShapePathCache
+from ui.style_pool import StylePool, rgba
+from ui.label_renderer import LabelRenderer
+from ui.level_of_detail import LevelOfDetail, LOD_OVERVIEW
+from ui.render_profile import profile_for_count
+from ui.layers import ButtonLayer
+from ui.background_image import BackgroundImage
+from items.button_item import ButtonGraphicsItem
 
 class PickerCanvas(QtWidgets.QGraphicsView):
     # Tool types
@@ -17,6 +24,9 @@ class PickerCanvas(QtWidgets.QGraphicsView):
     RADIUS_TOOL = "radius"
     TEXT_TOOL = "text"
     
+    # Smallest scene rect, the picker bounds grow it
+    DEFAULT_SCENE_RECT = QtCore.QRectF(-5000, -5000, 10000, 10000)
+    
     selectionChanged = QtCore.Signal(str)
     
     def __init__(self, controller, parent=None):
@@ -28,11 +38,21 @@ class PickerCanvas(QtWidgets.QGraphicsView):
         self.scene.selectionChanged.connect(self.handle_selection_changed)
     
     def setup_canvas(self):
-        # Create scene with reasonable bounds
+        # Create scene, its rect follows the picker bounds
         self.scene = QtWidgets.QGraphicsScene()
-        self.scene.setSceneRect(-5000, -5000, 10000, 10000)
+        self.scene.setSceneRect(self.DEFAULT_SCENE_RECT)
+        self.scene_margin = 2000
         self.setScene(self.scene)
         
+        # Button art cached in tiles under the items, which paint only
+        # decorations such as selection, hover and slider values
+        self.use_layers = True
+        self.button_layer = ButtonLayer(self.scene)
+        
+        # Index and viewport settings, picked from the button count unless set
+        self.render_profile = None
+        self.auto_render_profile = True
+        
         # Set up view properties
         self.setRenderHint(QtGui.QPainter.Antialiasing)
         self.setDragMode(QtWidgets.QGraphicsView.RubberBandDrag)
@@ -43,8 +63,13 @@ class PickerCanvas(QtWidgets.QGraphicsView):
         self.setVerticalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         self.setHorizontalScrollBarPolicy(QtCore.Qt.ScrollBarAlwaysOff)
         
+        # Colours, brushes, pens and fonts shared by all items
+        self.styles = StylePool()
+        
         # Background
         self.setBackgroundBrush(QtGui.QBrush(QtGui.QColor(50, 50, 50)))
+        self.background_image = BackgroundImage(parent=self)
+        self.background_image.changed.connect(self._background_image_changed)
         
         # Zoom factors
         self.zoom_factor = 1.15
@@ -56,6 +81,37 @@ class PickerCanvas(QtWidgets.QGraphicsView):
         self.panning = False
         self.pan_start = QtCore.QPoint()
         self.pan_origin = QtCore.QPointF()
+        
+        # Slider being dragged with Ctrl held
+        self.dragged_slider = None
+        
+        # Graphics item of each drawn button
+        self.button_items = {}
+        
+        # Shape paths shared by buttons of the same shape and size
+        self.shape_cache = ShapePathCache()
+        self.label_font = self.styles.font(9)
+        self.label_renderer = LabelRenderer()
+        # Rendered SVG skins, shared with the rest of the tool when it has SVG support
+        self.svg_utils = getattr(self.controller, "svg_utils", None)
+        
+        # Detail tier shared by all button items, follows the view scale
+        self.lod = LevelOfDetail()
+        # Button footprints grouped by colour, drawn while items are hidden
+        self._overview = None
+        # Selection kept while the overview hides the items
+        self.overview_selection = []
+        
+        # Buttons repaint from a pixmap cache while panning and zooming
+        self.item_cache_mode = QtWidgets.QGraphicsItem.DeviceCoordinateCache
+        
+        # Buttons whose targets are selected in Maya
+        self.highlighted_ids = set()
+        self.highlight_pen = self.styles.pen((255, 210, 0, 255), 3)
+        
+        # Buttons whose targets are missing from the scene
+        self.broken_ids = set()
+        self.broken_pen = self.styles.pen((230, 40, 40, 255), 3, QtCore.Qt.DashLine)
     
     def set_current_tool(self, tool):
         """Set the current tool"""
@@ -77,9 +133,20 @@ class PickerCanvas(QtWidgets.QGraphicsView):
             self.selectionChanged.emit(button_id)
         else:
             self.selectionChanged.emit(None)
-    
+
+    def get_selected_button_ids(self):
+        """Get the IDs of all selected buttons"""
+        if self.lod.tier == LOD_OVERVIEW:
+            return list(self.overview_selection)
+        return [item.data(0) for item in self.scene.selectedItems() if item.data(0)]
+
     def mousePressEvent(self, event):
         if event.button() == QtCore.Qt.LeftButton:
+            if self.current_tool == self.SELECT_TOOL and event.modifiers() & QtCore.Qt.ControlModifier:
+                if self._begin_slider_drag(event.pos()):
+                    event.accept()
+                    return
+                    
             if self.current_tool != self.SELECT_TOOL:
                 # Create a new button if we're in a creation tool
                 scene_pos = self.mapToScene(event.pos())
@@ -99,7 +166,10 @@ class PickerCanvas(QtWidgets.QGraphicsView):
             super().mousePressEvent(event)
     
     def mouseMoveEvent(self, event):
-        if self.panning:
+        if self.dragged_slider:
+            self._drag_slider(event.pos())
+            event.accept()
+        elif self.panning:
             # Get current mouse position in scene coordinates
             current_pos = event.pos()
             current_scene_pos = self.mapToScene(current_pos)
@@ -117,15 +187,168 @@ class PickerCanvas(QtWidgets.QGraphicsView):
             event.accept()
         else:
             super().mouseMoveEvent(event)
+            if self.scene.mouseGrabberItem() and self.controller.symmetry_enabled:
+                self._mirror_dragged_items()
     
     def mouseReleaseEvent(self, event):
-        if self.panning and event.button() == QtCore.Qt.MiddleButton:
+        if self.dragged_slider and event.button() == QtCore.Qt.LeftButton:
+            self._end_slider_drag()
+            event.accept()
+        elif self.panning and event.button() == QtCore.Qt.MiddleButton:
             # Stop panning
             self.panning = False
             self.setCursor(QtCore.Qt.ArrowCursor)
             event.accept()
         else:
             super().mouseReleaseEvent(event)
+            if event.button() == QtCore.Qt.LeftButton and self.current_tool == self.SELECT_TOOL:
+                self._commit_item_moves()
+    
+    def _begin_slider_drag(self, pos):
+        """Start driving the slider under the mouse, if any"""
+        item = self.itemAt(pos)
+        while item and item.parentItem():
+            item = item.parentItem()
+        button = self.controller.get_button_by_id(item.data(0)) if item else None
+        
+        if isinstance(button, Slider):
+            started = self.controller.begin_slider_drag(button.id)
+        elif isinstance(button, PoseBlendSlider):
+            started = self.controller.begin_pose_blend(button.id)
+        else:
+            return False
+            
+        if started:
+            self.dragged_slider = button
+            self._drag_slider(pos)
+        return bool(started)
+    
+    def _slider_fraction(self, button, scene_pos):
+        """Position of the mouse along the slider track, from 0 to 1"""
+        track_x = (scene_pos.x() - button.position.x - 5) / max(button.size.x - 10, 1)
+        track_y = (scene_pos.y() - button.position.y - 5) / max(button.size.y - 10, 1)
+        return min(max(track_x, 0.0), 1.0), min(max(track_y, 0.0), 1.0)
+    
+    def _drag_slider(self, pos):
+        """Update the dragged slider from the mouse position"""
+        button = self.dragged_slider
+        fraction_x, fraction_y = self._slider_fraction(button, self.mapToScene(pos))
+        
+        if isinstance(button, PoseBlendSlider):
+            self.controller.update_pose_blend(button.id, fraction_x)
+        else:
+            value = button.range_min + fraction_x * (button.range_max - button.range_min)
+            second_value = None
+            if button.is_2d:
+                second_value = button.second_range_min + fraction_y * (button.second_range_max - button.second_range_min)
+            self.controller.drag_slider(button.id, value, second_value)
+        self._update_slider_item(button.id)
+    
+    def _end_slider_drag(self):
+        """Commit the dragged slider value"""
+        button, self.dragged_slider = self.dragged_slider, None
+        if isinstance(button, PoseBlendSlider):
+            self.controller.end_pose_blend(button.id)
+        else:
+            self.controller.end_slider_drag(button.id)
+        self._update_slider_item(button.id)
+    
+    def _update_slider_item(self, button_id):
+        """Repaint a slider's item in place, its value is read from the button"""
+        item = self.button_items.get(button_id)
+        if item:
+            item.update()
+    
+    def _mirror_dragged_items(self):
+        """Move counterparts of dragged buttons live while symmetry is on"""
+        selected = self.scene.selectedItems()
+        selected_ids = {item.data(0) for item in selected}
+        axis = self.controller.symmetry.axis
+        
+        for item in selected:
+            button = self.controller.get_button_by_id(item.data(0))
+            counterpart = self.controller.get_counterpart(item.data(0))
+            if not button or not counterpart or counterpart.id in selected_ids:
+                continue
+            counterpart_item = self.button_items.get(counterpart.id)
+            if counterpart_item:
+                offset = item.pos() - QtCore.QPointF(button.position.x, button.position.y)
+                counterpart_item.setPos(
+                    counterpart.position.x + (-offset.x() if axis in ("X", "XY") else offset.x()),
+                    counterpart.position.y + (-offset.y() if axis in ("Y", "XY") else offset.y())
+                )
+    
+    def _commit_item_moves(self):
+        """Write dragged item positions back to the model in one edit"""
+        if not self.controller.model.current_picker:
+            return
+            
+        buttons = {button.id: button for button in self.controller.model.current_picker.buttons}
+        moves = {}
+        for item in self.scene.selectedItems():
+            button = buttons.get(item.data(0))
+            position = item.pos()
+            if button and (position.x() != button.position.x or position.y() != button.position.y):
+                moves[button.id] = {"position": Vector2(position.x(), position.y())}
+                
+        if moves:
+            changed_ids = self.controller.edit_buttons(moves, "Move Buttons")
+            self.refresh_buttons(changed_ids)
+    
+    def refresh_buttons(self, button_ids):
+        """Redraw only the given buttons, keeping their selection state"""
+        self._overview = None
+        scene_rect = self.scene.sceneRect()
+        for button_id in button_ids:
+            old_item = self.button_items.pop(button_id, None)
+            was_selected = old_item.isSelected() if old_item else False
+            if old_item:
+                self.scene.removeItem(old_item)
+                
+            button = self.controller.get_button_by_id(button_id)
+            if button:
+                self.draw_button(button)
+                new_item = self.button_items.get(button_id)
+                if new_item and was_selected:
+                    new_item.setSelected(True)
+                if not scene_rect.contains(self._button_rect(button)):
+                    self.update_scene_rect()
+                    scene_rect = self.scene.sceneRect()
+                # Cached tiles are kept unless the shape, colour, label or position changed
+                self.button_layer.update_button(button)
+            else:
+                self.button_layer.remove_button(button_id)
+    
+    def highlight_buttons(self, added, removed):
+        """Update the Maya selection highlight of only the given buttons"""
+        self.highlighted_ids |= set(added)
+        self.highlighted_ids -= set(removed)
+        
+        for button_id in removed:
+            self._apply_highlight(button_id, False)
+        for button_id in added:
+            self._apply_highlight(button_id, True)
+    
+    def mark_broken_buttons(self, button_ids):
+        """Outline the buttons with missing targets, clearing previous marks"""
+        previous, self.broken_ids = self.broken_ids, set(button_ids)
+        for button_id in previous | self.broken_ids:
+            self._apply_highlight(button_id, button_id in self.highlighted_ids)
+    
+    def _apply_highlight(self, button_id, highlighted):
+        """Set the outline of a button item for its highlight state"""
+        item = self.button_items.get(button_id)
+        if isinstance(item, (ButtonGraphicsItem, QtWidgets.QAbstractGraphicsShapeItem)):
+            if button_id in self.broken_ids:
+                item.setPen(self.broken_pen)
+            else:
+                item.setPen(self.highlight_pen if highlighted else self.styles.pen())
+    
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.background_image.set_viewport_size(self.viewport().size())
+        if self.controller.debug_overlay:
+            self.controller.debug_overlay.resize(self.viewport().size())
     
     def wheelEvent(self, event):
         # Zoom in/out with mouse wheel (Maya style)
@@ -158,6 +381,83 @@ class PickerCanvas(QtWidgets.QGraphicsView):
         
         # Adjust the view to compensate for the displacement
         self.centerOn(old_center)
+        self._update_level_of_detail()
+    
+    def _update_level_of_detail(self):
+        """Switch the item detail tier when the view scale crosses a threshold"""
+        was_overview = self.lod.tier == LOD_OVERVIEW
+        if self.lod.update(self.transform().m11()):
+            is_overview = self.lod.tier == LOD_OVERVIEW
+            if is_overview != was_overview:
+                self._show_button_items(not is_overview)
+            # Scaling already drops device-coordinate item caches, repaint with the new tier
+            self.scene.update()
+    
+    def _show_button_items(self, shown):
+        """Hide button items for the overview, or bring them back with their selection"""
+        # Hiding deselects items, keep the selection signal quiet while swapping
+        self.scene.blockSignals(True)
+        if not shown:
+            self.overview_selection = [item.data(0) for item in self.scene.selectedItems() if item.data(0)]
+        for item in self.button_items.values():
+            item.setVisible(shown)
+        if shown:
+            for button_id in self.overview_selection:
+                item = self.button_items.get(button_id)
+                if item:
+                    item.setSelected(True)
+            self.overview_selection = []
+        self.scene.blockSignals(False)
+    
+    def drawBackground(self, painter, rect):
+        super().drawBackground(painter, rect)
+        self.background_image.paint(painter, rect, self.transform().m11())
+        if self.use_layers and self.lod.tier != LOD_OVERVIEW:
+            # Bucket per view scale and detail tier, rounded so zooming out and
+            # back in lands on the same tiles
+            bucket = (self.lod.tier, round(self.transform().m11(), 6))
+            self.button_layer.paint(painter, rect, bucket)
+    
+    def drawForeground(self, painter, rect):
+        super().drawForeground(painter, rect)
+        if self.lod.tier == LOD_OVERVIEW:
+            self._draw_overview(painter)
+    
+    def _draw_overview(self, painter):
+        """Fill every button footprint with one drawRects call per colour"""
+        picker = self.controller.model.current_picker
+        if not picker:
+            return
+        if self._overview is None:
+            groups = {}
+            for button in picker.buttons:
+                rect = QtCore.QRectF(button.position.x, button.position.y, button.size.x, button.size.y)
+                groups.setdefault(rgba(button.color), []).append(rect)
+            self._overview = [(self.styles.brush(color), rects) for color, rects in groups.items()]
+        
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, False)
+        painter.setPen(QtCore.Qt.NoPen)
+        for brush, rects in self._overview:
+            painter.setBrush(brush)
+            painter.drawRects(rects)
+        
+        # Keep highlighted, broken and selected buttons visible at any zoom
+        outlined = (
+            (self.highlighted_ids, self.highlight_pen),
+            (self.broken_ids, self.broken_pen),
+            (self.overview_selection, self.styles.pen((255, 255, 255, 255), 0, QtCore.Qt.DashLine)),
+        )
+        painter.setBrush(QtCore.Qt.NoBrush)
+        for button_ids, pen in outlined:
+            if not button_ids:
+                continue
+            pen = QtGui.QPen(pen)
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            for button_id in button_ids:
+                button = self.controller.get_button_by_id(button_id)
+                if button:
+                    painter.drawRect(QtCore.QRectF(button.position.x, button.position.y, button.size.x, button.size.y))
     
     def create_button(self, position):
         """Create a button at the specified position"""
@@ -196,458 +496,119 @@ class PickerCanvas(QtWidgets.QGraphicsView):
     def update_from_model(self):
         """Update the canvas based on the current model state"""
         self.scene.clear()
+        self.button_items.clear()
+        self.button_layer.set_buttons([])
+        self._overview = None
+        self.update_background_image()
+        if self.svg_utils:
+            self.svg_utils.reload_changed()
         
         if not self.controller.model.current_picker:
             return
             
         picker = self.controller.model.current_picker
+        if self.auto_render_profile:
+            self.apply_render_profile(profile_for_count(len(picker.buttons)))
+        self.update_scene_rect()
         
         # Draw all buttons
         for button in picker.buttons:
             self.draw_button(button)
+        self.button_layer.set_buttons(picker.buttons)
     
-    def draw_button(self, button):
-        """Draw a button based on its shape type"""
-        if button.shape == ShapeType.RECTANGLE:
-            self.draw_rectangle_button(button)
-        elif button.shape == ShapeType.ROUND_RECTANGLE:
-            self.draw_round_rectangle_button(button)
-        elif button.shape == ShapeType.CIRCLE:
-            self.draw_circle_button(button)
-        elif button.shape == ShapeType.TRIANGLE:
-            self.draw_triangle_button(button)
-        elif button.shape == ShapeType.DIAMOND:
-            self.draw_diamond_button(button)
-        elif button.shape == ShapeType.HEXAGON:
-            self.draw_hexagon_button(button)
-        elif button.shape == ShapeType.POLYGON:
-            self.draw_polygon_button(button)
-    
-    def draw_select_button(self, button):
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        # Make the item selectable and movable
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
-        item.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
-        
-        # Add text label
-        if button.label:
-            text = QtWidgets.QGraphicsTextItem(button.label, item)
-            text.setPos(button.position.x + 5, button.position.y + 5)
-            text.setDefaultTextColor(QtGui.QColor(255, 255, 255))
-            
-        # Store button ID for interaction
-        item.setData(0, button.id)
-        
-        self.scene.addItem(item)
-
-    def draw_rectangle_button(self, button):
-        """Draw a rectangular button"""
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        self._setup_button_item(item, button)
-        self._add_button_label(item, button)
-    
-    def draw_round_rectangle_button(self, button):
-        """Draw a round rectangle button"""
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        # Make it round
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        self._setup_button_item(item, button)
-        self._add_button_label(item, button)
-
-    def draw_circle_button(self, button):
-        """Draw a circular button"""
-        radius = min(button.size.x, button.size.y) / 2
-        center_x = button.position.x + button.size.x / 2
-        center_y = button.position.y + button.size.y / 2
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsEllipseItem(
-            center_x - radius,
-            center_y - radius,
-            radius * 2,
-            radius * 2
-        )
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        self._setup_button_item(item, button)
-        self._add_button_label(item, button)
-    
-    def draw_triangle_button(self, button):
-        """Draw a triangular button"""
-        path = QtGui.QPainterPath()
-        path.moveTo(button.position.x + button.size.x / 2, button.position.y)
-        path.lineTo(button.position.x + button.size.x, button.position.y + button.size.y)
-        path.lineTo(button.position.x, button.position.y + button.size.y)
-        path.closeSubpath()
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsPathItem(path)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        self._setup_button_item(item, button)
-        self._add_button_label(item, button)
-    
-    def draw_diamond_button(self, button):
-        """Draw a diamond-shaped button"""
-        path = QtGui.QPainterPath()
-        path.moveTo(button.position.x + button.size.x / 2, button.position.y)
-        path.lineTo(button.position.x + button.size.x, button.position.y + button.size.y / 2)
-        path.lineTo(button.position.x + button.size.x / 2, button.position.y + button.size.y)
-        path.lineTo(button.position.x, button.position.y + button.size.y / 2)
-        path.closeSubpath()
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsPathItem(path)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        self._setup_button_item(item, button)
-        self._add_button_label(item, button)
-    
-    def draw_hexagon_button(self, button):
-        """Draw a hexagonal button"""
-        path = QtGui.QPainterPath()
-        center_x = button.position.x + button.size.x / 2
-        center_y = button.position.y + button.size.y / 2
-        radius = min(button.size.x, button.size.y) / 2
-        
-        for i in range(6):
-            angle = 2 * math.pi * i / 6
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-            if i == 0:
-                path.moveTo(x, y)
-            else:
-                path.lineTo(x, y)
-        path.closeSubpath()
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsPathItem(path)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        self._setup_button_item(item, button)
-        self._add_button_label(item, button)
-    
-    def draw_text_button(self, button):
-        """Draw text button"""
-        item = QtWidgets.QGraphicsTextItem(button.label)
-        
-        # Set font properties
-        font = QtGui.QFont()
-        font.setPointSize(button.font_size)
-        font.setBold(button.is_bold)
-        font.setItalic(button.is_italic)
-        item.setFont(font)
-        
-        # Set text color
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        item.setDefaultTextColor(color)
-        
-        item.setPos(button.position.x, button.position.y)
-        
-        # Make text item selectable and movable
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
-        item.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
-        
-        # Store button ID for interaction
-        item.setData(0, button.id)
-        
-        self.scene.addItem(item)
-
-    # Update all other drawing methods similarly
-    def draw_script_button(self, button):
-        # Similar to select button but with different visual style
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-    
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
+    def update_background_image(self):
+        """Show the background image of the current picker"""
+        picker = self.controller.model.current_picker
+        self.background_image.load(getattr(picker, "background_image", None))
     
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.blue, 2))
+    def _background_image_changed(self, rect):
+        """Repaint where background tiles arrived, or everything for a new image"""
+        if rect.isNull():
+            self.scene.invalidate(self.scene.sceneRect(), QtWidgets.QGraphicsScene.BackgroundLayer)
+        else:
+            if not self.scene.sceneRect().contains(self.background_image.bounds()):
+                self.update_scene_rect()
+            self.scene.invalidate(rect, QtWidgets.QGraphicsScene.BackgroundLayer)
     
-        # Make the item selectable
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
+    def _button_rect(self, button):
+        return QtCore.QRectF(button.position.x, button.position.y, button.size.x, button.size.y)
     
-        # Add script icon or indicator
-        if button.label:
-            text = QtWidgets.QGraphicsTextItem(button.label, item)
-            text.setPos(button.position.x + 5, button.position.y + 5)
-        
-        # Store button ID for interaction
-        item.setData(0, button.id)
-    
-        self.scene.addItem(item)
-
-    # Update other drawing methods similarly...
-    
-    def draw_pose_button(self, button):
-        # Draw with a special style, maybe a star icon
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.yellow, 2))
-        
-        # Add pose icon (star)
-        path = QtGui.QPainterPath()
-        path.moveTo(button.position.x + button.size.x / 2, button.position.y + 5)
-        for i in range(5):
-            angle = 2 * 3.14159 * i / 5 - 3.14159 / 2
-            x = button.position.x + button.size.x / 2 + 0.4 * button.size.x * math.cos(angle)
-            y = button.position.y + button.size.y / 2 + 0.4 * button.size.y * math.sin(angle)
-            path.lineTo(x, y)
-        path.closeSubpath()
-        
-        star_item = QtWidgets.QGraphicsPathItem(path, item)
-        star_item.setBrush(QtGui.QBrush(QtCore.Qt.white))
-        star_item.setPen(QtGui.QPen(QtCore.Qt.black))
-        
-        if button.label:
-            text = QtWidgets.QGraphicsTextItem(button.label, item)
-            text.setPos(button.position.x + 5, button.position.y + 5)
-        
-        # Make the item selectable
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
-        item.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
-
-        item.setData(0, button.id)
-
-        self.scene.addItem(item)
-
-    def draw_attribute_button(self, button):
-        # Draw with a special style, maybe a gear icon
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
+    def update_scene_rect(self):
+        """Fit the scene rect to the picker bounds plus a margin to pan and draw in"""
+        picker = self.controller.model.current_picker
+        rect = QtCore.QRectF(self.DEFAULT_SCENE_RECT)
+        if picker and picker.buttons:
+            left = min(button.position.x for button in picker.buttons)
+            top = min(button.position.y for button in picker.buttons)
+            right = max(button.position.x + button.size.x for button in picker.buttons)
+            bottom = max(button.position.y + button.size.y for button in picker.buttons)
+            margin = self.scene_margin
+            rect = rect.united(QtCore.QRectF(left, top, right - left, bottom - top).adjusted(-margin, -margin, margin, margin))
+        if not self.background_image.bounds().isNull():
+            rect = rect.united(self.background_image.bounds())
+        if rect != self.scene.sceneRect():
+            self.scene.setSceneRect(rect)
+    
+    def apply_render_profile(self, profile):
+        """Set the scene index and view options of a render profile"""
+        picker = self.controller.model.current_picker
+        depth = profile.bsp_depth(len(picker.buttons) if picker else 0)
+        if profile == self.render_profile and (not profile.use_index or depth == self.scene.bspTreeDepth()):
+            return
+        self.render_profile = profile
         
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.cyan, 2))
-        
-        # Add gear icon
-        if button.operation == "toggle":
-            # Draw toggle icon
-            pass
-        elif button.operation == "nudge":
-            # Draw nudge icon
-            pass
+        if profile.use_index:
+            self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.BspTreeIndex)
+            self.scene.setBspTreeDepth(depth)
         else:
-            # Draw set icon
-            pass
-            
-        if button.label:
-            text = QtWidgets.QGraphicsTextItem(button.label, item)
-            text.setPos(button.position.x + 5, button.position.y + 5)
-            
-        item.setData(0, button.id)
-        self.scene.addItem(item)
-
-    def draw_slider(self, button):
-        # Draw a slider UI
-        rect = QtCore.QRectF(
-            button.position.x, 
-            button.position.y, 
-            button.size.x, 
-            button.size.y
-        )
-        
-        color = QtGui.QColor(
-            int(button.color.r * 255),
-            int(button.color.g * 255),
-            int(button.color.b * 255),
-            int(button.color.a * 255)
-        )
-        
-        item = QtWidgets.QGraphicsRectItem(rect)
-        item.setBrush(QtGui.QBrush(color))
-        item.setPen(QtGui.QPen(QtCore.Qt.darkGreen, 2))
-        
-        # Draw slider track
-        track_rect = QtCore.QRectF(
-            button.position.x + 5,
-            button.position.y + button.size.y / 2 - 2,
-            button.size.x - 10,
-            4
+            self.scene.setItemIndexMethod(QtWidgets.QGraphicsScene.NoIndex)
+        
+        self.setViewportUpdateMode(profile.viewport_update)
+        self.setCacheMode(QtWidgets.QGraphicsView.CacheBackground if profile.cache_background
+                          else QtWidgets.QGraphicsView.CacheNone)
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.DontSavePainterState, profile.dont_save_painter_state)
+        self.setOptimizationFlag(QtWidgets.QGraphicsView.DontAdjustForAntialiasing, profile.dont_adjust_for_antialiasing)
+        self.resetCachedContent()
+    
+    def set_render_profile(self, profile):
+        """Use a fixed render profile, or None to pick one from the button count"""
+        self.auto_render_profile = profile is None
+        if profile is not None:
+            self.apply_render_profile(profile)
+        self.update_from_model()
+    
+    def draw_button(self, button):
+        """Draw a button as one item painting its shape and label"""
+        item = ButtonGraphicsItem(
+            button,
+            self.shape_cache.path(button),
+            self.styles.brush(rgba(button.color)),
+            self.styles.pen(),
+            self.styles.pen((255, 255, 255, 255)),
+            self.label_font,
+            self.label_renderer,
+            self.shape_cache.simple_path(button),
+            self.lod,
+            self.button_layer if self.use_layers else None,
+            self.svg_utils
         )
-        track_item = QtWidgets.QGraphicsRectItem(track_rect, item)
-        track_item.setBrush(QtGui.QBrush(QtCore.Qt.gray))
-        track_item.setPen(QtGui.QPen(QtCore.Qt.NoPen))
-        
-        # Draw slider thumb
-        if button.is_2d:
-            # Draw 2D slider thumb
-            thumb_x = button.position.x + 5 + (button.current_value - button.range_min) / (button.range_max - button.range_min) * (button.size.x - 10)
-            thumb_y = button.position.y + 5 + (button.second_current_value - button.second_range_min) / (button.second_range_max - button.second_range_min) * (button.size.y - 10)
-            
-            thumb_rect = QtCore.QRectF(
-                thumb_x - 5,
-                thumb_y - 5,
-                10,
-                10
-            )
-            thumb_item = QtWidgets.QGraphicsEllipseItem(thumb_rect, item)
-            thumb_item.setBrush(QtGui.QBrush(QtCore.Qt.red))
-            thumb_item.setPen(QtGui.QPen(QtCore.Qt.black))
-        else:
-            # Draw 1D slider thumb
-            thumb_pos = button.position.x + 5 + (button.current_value - button.range_min) / (button.range_max - button.range_min) * (button.size.x - 10)
-            
-            thumb_rect = QtCore.QRectF(
-                thumb_pos - 5,
-                button.position.y + 5,
-                10,
-                button.size.y - 10
-            )
-            thumb_item = QtWidgets.QGraphicsRectItem(thumb_rect, item)
-            thumb_item.setBrush(QtGui.QBrush(QtCore.Qt.red))
-            thumb_item.setPen(QtGui.QPen(QtCore.Qt.black))
-            
-        if button.label:
-            text = QtWidgets.QGraphicsTextItem(button.label, item)
-            text.setPos(button.position.x + 5, button.position.y + 5)
-            
-        item.setData(0, button.id)
-        self.scene.addItem(item)
-
+        item.setCacheMode(self.item_cache_mode)
+        self._setup_button_item(item, button)
+    
     def _setup_button_item(self, item, button):
         """Common setup for all button items"""
         item.setFlag(QtWidgets.QGraphicsItem.ItemIsSelectable, True)
         item.setFlag(QtWidgets.QGraphicsItem.ItemIsMovable, True)
         item.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
         item.setData(0, button.id)
+        # Geometry is local to the button, the item sits at the button position
+        item.setPos(button.position.x, button.position.y)
+        if self.lod.tier == LOD_OVERVIEW:
+            item.setVisible(False)
         self.scene.addItem(item)
-    
-    def _add_button_label(self, item, button):
-        """Add label to button"""
-        if button.label:
-            text = QtWidgets.QGraphicsTextItem(button.label, item)
-            text.setDefaultTextColor(QtGui.QColor(255, 255, 255))
-            
-            # Center the text
-            text_rect = text.boundingRect()
-            text.setPos(
-                button.position.x + (button.size.x - text_rect.width()) / 2,
-                button.position.y + (button.size.y - text_rect.height()) / 2
-            )
+        self.button_items[button.id] = item
+        if button.id in self.highlighted_ids or button.id in self.broken_ids:
+            self._apply_highlight(button.id, button.id in self.highlighted_ids)
     
     def zoom_in(self):
         """Zoom in programmatically"""
@@ -661,6 +622,7 @@ class PickerCanvas(QtWidgets.QGraphicsView):
         """Reset zoom to default"""
         self.resetTransform()
         self.zoom_level = 0
+        self._update_level_of_detail()
     
     def start_rectangle(self, pos):
         """Start drawing a rectangle"""
@@ -12,6 +12,7 @@ class DebugOverlay(QtWidgets.QWidget):
         self.connections = []
         self.highlighted_nodes = []
         self.debug_text = []
+        self.stats = {}  # name: latest stats line
         
     def paintEvent(self, event):
         painter = QtGui.QPainter(self)
@@ -33,7 +34,7 @@ class DebugOverlay(QtWidgets.QWidget):
             
         # Draw debug text
         painter.setPen(QtGui.QPen(QtCore.Qt.white))
-        for i, text in enumerate(self.debug_text):
+        for i, text in enumerate(self.debug_text + list(self.stats.values())):
             painter.drawText(10, 20 + i * 15, text)
             
     def draw_arrowhead(self, painter, start, end):
@@ -72,8 +73,17 @@ class DebugOverlay(QtWidgets.QWidget):
         self.debug_text.append(text)
         self.update()
         
+    def report_drag_stats(self, name, stats):
+        """Show the Maya write count of the last drag of a slider"""
+        self.stats[name] = (
+            f"{name}: {stats['writes']} writes / {stats['updates']} moves "
+            f"in {stats['duration'] * 1000:.0f} ms"
+        )
+        self.update()
+        
     def clear(self):
         self.connections = []
         self.highlighted_nodes = []
         self.debug_text = []
+        self.stats = {}
         self.update()
\ No newline at end of file
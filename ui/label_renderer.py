@@ -0,0 +1,46 @@
+# ui/label_renderer.py
+from collections import OrderedDict
+from PySide2 import QtCore, QtGui
+
+class LabelRenderer:
+    """Button labels laid out once with QStaticText and shared between buttons.
+
+    Layouts are keyed by (text, font, available width, zoom bucket) in a
+    bounded LRU. The zoom bucket is the view scale rounded, so a layout is
+    prepared for the exact transform it is drawn with and Qt never has to
+    lay it out again while the zoom level stays the same.
+    """
+    def __init__(self, max_entries: int = 4096):
+        self.max_entries = max_entries
+        self.layouts = OrderedDict()
+        self.layout_count = 0
+
+    @staticmethod
+    def zoom_bucket(painter) -> float:
+        """View scale of a painter, rounded so each zoom level is one bucket"""
+        return round(painter.worldTransform().m11(), 3)
+
+    def layout(self, text: str, font, width: float, bucket: float):
+        """(QStaticText, size) of a label, elided to fit the width"""
+        key = (text, font.key(), int(width), bucket)
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.layouts.move_to_end(key)
+            return layout
+
+        metrics = QtGui.QFontMetricsF(font)
+        static_text = QtGui.QStaticText(metrics.elidedText(text, QtCore.Qt.ElideRight, width))
+        static_text.setTextFormat(QtCore.Qt.PlainText)
+        static_text.prepare(QtGui.QTransform.fromScale(bucket, bucket), font)
+        layout = (static_text, static_text.size())
+
+        self.layout_count += 1
+        self.layouts[key] = layout
+        if len(self.layouts) > self.max_entries:
+            self.layouts.popitem(last=False)
+        return layout
+
+    def position(self, rect, layout):
+        """Top-left point that centres a label layout in rect"""
+        size = layout[1]
+        return QtCore.QPointF(rect.center().x() - size.width() / 2, rect.center().y() - size.height() / 2)
@@ -0,0 +1,162 @@
+# ui/layers.py
+import math
+from collections import OrderedDict
+from PySide2 import QtCore, QtGui, QtWidgets
+
+class TileCache:
+    """Pixmap tiles of a layer, keyed by (zoom bucket, column, row).
+
+    Tiles are `tile_size` device pixels square and aligned to the scene
+    origin at the bucket's scale, so panning only renders newly revealed
+    tiles. Least recently used tiles are dropped past `max_tiles`.
+    """
+    def __init__(self, tile_size: int = 256, max_tiles: int = 160):
+        self.tile_size = tile_size
+        self.max_tiles = max_tiles
+        self.tiles = OrderedDict()
+        self.rendered = 0
+
+    def get(self, key):
+        pixmap = self.tiles.get(key)
+        if pixmap is not None:
+            self.tiles.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap):
+        self.tiles[key] = pixmap
+        self.rendered += 1
+        while len(self.tiles) > self.max_tiles:
+            self.tiles.popitem(last=False)
+
+    def invalidate(self, scene_rect):
+        """Drop the tiles of every bucket that overlap a scene rect"""
+        size = self.tile_size
+        for key in list(self.tiles):
+            bucket, column, row = key
+            scale = bucket[-1]
+            tile = QtCore.QRectF(column * size / scale, row * size / scale, size / scale, size / scale)
+            if tile.intersects(scene_rect):
+                del self.tiles[key]
+
+    def clear(self):
+        self.tiles.clear()
+
+class StaticLayer:
+    """Canvas content that only changes on edits, drawn from cached tiles.
+
+    Subclasses implement render(painter, scene_rect, bucket) to draw the
+    content of one tile. The bucket identifies the zoom level and anything
+    else the content depends on, and always ends with the view scale.
+    """
+    def __init__(self, cache=None):
+        self.cache = cache or TileCache()
+
+    def render(self, painter, scene_rect, bucket):
+        raise NotImplementedError
+
+    def paint(self, painter, exposed_rect, bucket):
+        """Draw the tiles covering an exposed scene rect, rendering missing ones"""
+        scale = bucket[-1]
+        size = self.cache.tile_size
+        tile_span = size / scale
+        first_column = math.floor(exposed_rect.left() / tile_span)
+        last_column = math.floor(exposed_rect.right() / tile_span)
+        first_row = math.floor(exposed_rect.top() / tile_span)
+        last_row = math.floor(exposed_rect.bottom() / tile_span)
+
+        for row in range(first_row, last_row + 1):
+            for column in range(first_column, last_column + 1):
+                key = (bucket, column, row)
+                tile_rect = QtCore.QRectF(column * tile_span, row * tile_span, tile_span, tile_span)
+                pixmap = self.cache.get(key)
+                if pixmap is None:
+                    pixmap = self._render_tile(tile_rect, bucket)
+                    self.cache.put(key, pixmap)
+                painter.drawPixmap(tile_rect, pixmap, QtCore.QRectF(pixmap.rect()))
+
+    def _render_tile(self, tile_rect, bucket):
+        scale = bucket[-1]
+        pixmap = QtGui.QPixmap(self.cache.tile_size, self.cache.tile_size)
+        pixmap.fill(QtCore.Qt.transparent)
+        painter = QtGui.QPainter(pixmap)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.scale(scale, scale)
+        painter.translate(-tile_rect.topLeft())
+        self.render(painter, tile_rect, bucket)
+        painter.end()
+        return pixmap
+
+    def invalidate(self, scene_rect=None):
+        """Drop cached tiles over a scene rect, or all of them"""
+        if scene_rect is None:
+            self.cache.clear()
+        else:
+            self.cache.invalidate(scene_rect)
+
+def button_signature(button):
+    """Everything about a button that shows in its static art"""
+    points = tuple((p.x, p.y) for p in button.points) if button.points else ()
+    color = button.color
+    return (button.position.x, button.position.y, button.size.x, button.size.y, button.shape,
+            button.sides, button.corner_radius, points, (color.r, color.g, color.b, color.a), button.label,
+            getattr(button, "svg_path", None))
+
+def signature_rect(signature, margin: float = 8):
+    """Scene rect a button's art can cover, with room for outline and label overhang"""
+    x, y, width, height = signature[:4]
+    return QtCore.QRectF(x - margin, y - margin, width + margin * 2, height + margin * 2)
+
+class ButtonLayer(StaticLayer):
+    """Shapes and labels of the picker buttons that are not being dragged.
+
+    Items keep handling selection, hover and hit testing but only paint their
+    dynamic decorations; their art comes from this layer. `signatures` tells
+    a real art change apart from a redraw that only touched decorations.
+    """
+    def __init__(self, scene, cache=None):
+        super().__init__(cache)
+        self.scene = scene
+        self.signatures = {}
+
+    def render(self, painter, scene_rect, bucket):
+        tier = bucket[0]
+        # Labels may overhang their item a little
+        query_rect = scene_rect.adjusted(-8, -8, 8, 8)
+        for item in self.scene.items(query_rect, QtCore.Qt.IntersectsItemBoundingRect, QtCore.Qt.AscendingOrder):
+            if getattr(item, "layer", None) is self and not item.lifted:
+                painter.save()
+                painter.translate(item.pos())
+                item.paint_art(painter, tier)
+                painter.restore()
+
+    def invalidate(self, scene_rect=None):
+        """Drop cached tiles over a scene rect, or all of them, and repaint it"""
+        super().invalidate(scene_rect)
+        self.scene.invalidate(scene_rect or QtCore.QRectF(), QtWidgets.QGraphicsScene.BackgroundLayer)
+
+    def set_buttons(self, buttons):
+        """Start over with a freshly drawn set of buttons"""
+        self.signatures = {button.id: button_signature(button) for button in buttons}
+        self.invalidate()
+
+    def update_button(self, button):
+        """Repaint the tiles under a redrawn button, only if its art changed"""
+        signature = button_signature(button)
+        old = self.signatures.get(button.id)
+        if old == signature:
+            return
+        self.signatures[button.id] = signature
+        self.invalidate(signature_rect(signature))
+        if old:
+            self.invalidate(signature_rect(old))
+
+    def remove_button(self, button_id):
+        old = self.signatures.pop(button_id, None)
+        if old:
+            self.invalidate(signature_rect(old))
+
+    def lift(self, item):
+        """Take a dragged item out of the layer, it paints its own art until redrawn"""
+        item.lifted = True
+        item.update_contents_flag()
+        self.invalidate(item.sceneBoundingRect().adjusted(-8, -8, 8, 8))
@@ -0,0 +1,48 @@
+# ui/level_of_detail.py
+
+# Detail tiers, from cheapest to full
+LOD_OVERVIEW = 0  # Items hidden, the canvas fills all button footprints in one pass
+LOD_FAR = 1       # Flat fills only: no outlines, labels or slider internals
+LOD_MID = 2       # Simplified shapes, labels, slider value bar
+LOD_FULL = 3      # Everything
+
+TIER_NAMES = {LOD_OVERVIEW: "overview", LOD_FAR: "far", LOD_MID: "mid", LOD_FULL: "full"}
+
+class LevelOfDetail:
+    """Detail tier of the canvas, picked from the view scale.
+
+    `thresholds` are the scales below which the view drops to the next lower
+    tier. Going back up needs the scale to pass threshold * hysteresis, so
+    zooming one wheel step back and forth around a threshold does not flip
+    the tier, and item caches are not rebuilt on every step.
+    """
+    def __init__(self, overview_below: float = 0.1, far_below: float = 0.4, mid_below: float = 0.75,
+                 hysteresis: float = 1.2):
+        self.thresholds = {LOD_OVERVIEW: overview_below, LOD_FAR: far_below, LOD_MID: mid_below}
+        self.hysteresis = hysteresis
+        self.tier = LOD_FULL
+
+    def tier_for_scale(self, scale: float) -> int:
+        """Tier for a view scale, given the current tier"""
+        tier = self.tier
+        # Drop while below the threshold of the next lower tier
+        while tier > LOD_OVERVIEW and scale < self.thresholds[tier - 1]:
+            tier -= 1
+        if tier != self.tier:
+            return tier
+        # Rise only once clearly past the threshold of the current tier
+        while tier < LOD_FULL and scale >= self.thresholds[tier] * self.hysteresis:
+            tier += 1
+        return tier
+
+    def update(self, scale: float) -> bool:
+        """Set the tier for a view scale, True if it changed"""
+        tier = self.tier_for_scale(scale)
+        if tier == self.tier:
+            return False
+        self.tier = tier
+        return True
+
+    @property
+    def name(self) -> str:
+        return TIER_NAMES[self.tier]
@@ -3,6 +3,8 @@ from PySide2 import QtWidgets, QtCore, QtGui
 from core.controller import PickerController
 from ui.canvas import PickerCanvas
 from ui.properties import PropertiesPanel
+from ui.debug_overlay import DebugOverlay
+from ui.render_profile import PROFILES, profile_named
 
 class PickerMainWindow(QtWidgets.QMainWindow):
     def __init__(self, controller, parent=None):
@@ -94,6 +96,88 @@ class PickerMainWindow(QtWidgets.QMainWindow):
         self.redo_action.triggered.connect(self.redo)
         edit_menu.addAction(self.redo_action)
         
+        # View menu
+        view_menu = menubar.addMenu("View")
+        
+        debug_action = QtWidgets.QAction("Debug Overlay", self)
+        debug_action.setCheckable(True)
+        debug_action.toggled.connect(self.toggle_debug_overlay)
+        view_menu.addAction(debug_action)
+        
+        background_action = QtWidgets.QAction("Set Background Image...", self)
+        background_action.triggered.connect(self.set_background_image)
+        view_menu.addAction(background_action)
+        
+        clear_background_action = QtWidgets.QAction("Clear Background Image", self)
+        clear_background_action.triggered.connect(lambda: self.set_background_image(clear=True))
+        view_menu.addAction(clear_background_action)
+        
+        profile_menu = view_menu.addMenu("Render Profile")
+        profile_group = QtWidgets.QActionGroup(self)
+        for name in ["auto"] + [profile.name for profile in PROFILES]:
+            profile_action = QtWidgets.QAction(name.capitalize(), self)
+            profile_action.setCheckable(True)
+            profile_action.setChecked(name == "auto")
+            profile_action.triggered.connect(lambda checked=False, name=name: self.canvas.set_render_profile(profile_named(name)))
+            profile_group.addAction(profile_action)
+            profile_menu.addAction(profile_action)
+        
+        # Tools menu
+        tools_menu = menubar.addMenu("Tools")
+        
+        validate_action = QtWidgets.QAction("Validate Targets", self)
+        validate_action.triggered.connect(self.validate_targets)
+        tools_menu.addAction(validate_action)
+        
+        collect_sets_action = QtWidgets.QAction("Clean Up Selection Sets", self)
+        collect_sets_action.triggered.connect(self.collect_selection_sets)
+        tools_menu.addAction(collect_sets_action)
+        
+    def validate_targets(self):
+        """Outline buttons with missing targets and summarize the report"""
+        report = self.controller.validate_targets()
+        picker = self.controller.model.current_picker
+        self.canvas.mark_broken_buttons(report.broken_ids(picker.name) if picker else [])
+        QtWidgets.QMessageBox.information(
+            self, "Validate Targets",
+            f"{len(report.broken)} of {len(report.buttons)} buttons have missing targets."
+        )
+        
+    def collect_selection_sets(self):
+        """Delete this tool's objectSets that no button of the loaded pickers uses"""
+        deleted = self.controller.collect_selection_sets()
+        QtWidgets.QMessageBox.information(
+            self, "Clean Up Selection Sets",
+            f"Deleted {len(deleted)} unused selection sets."
+        )
+        
+    def set_background_image(self, clear=False):
+        """Pick or clear the background image of the current picker"""
+        picker = self.controller.model.current_picker
+        if not picker:
+            return
+        if clear:
+            file_path = None
+        else:
+            file_path, _ = QtWidgets.QFileDialog.getOpenFileName(
+                self, "Background Image", "", "Images (*.png *.jpg *.jpeg *.tif *.tiff *.bmp)"
+            )
+            if not file_path:
+                return
+        picker.background_image = file_path
+        self.canvas.update_background_image()
+        
+    def toggle_debug_overlay(self, enabled):
+        """Show or hide the debug overlay on the canvas"""
+        if enabled:
+            overlay = DebugOverlay(self.canvas, self.canvas.viewport())
+            overlay.resize(self.canvas.viewport().size())
+            overlay.show()
+            self.controller.debug_overlay = overlay
+        elif self.controller.debug_overlay:
+            self.controller.debug_overlay.deleteLater()
+            self.controller.debug_overlay = None
+            
     def new_picker(self):
         name, ok = QtWidgets.QInputDialog.getText(
             self, "New Picker", "Enter picker name:"
@@ -139,6 +223,18 @@ class PickerMainWindow(QtWidgets.QMainWindow):
             self.undo_action.setText(self.controller.undo_manager.get_undo_label())
             self.redo_action.setText(self.controller.undo_manager.get_redo_label())
         
+    def closeEvent(self, event):
+        """Stop listening to Maya when the window closes"""
+        if self.controller.selection_sync:
+            self.controller.selection_sync.stop()
+        if self.controller.attribute_sync:
+            self.controller.attribute_sync.stop()
+        self.controller.descendant_cache.stop()
+        self.controller.pose_capture.stop()
+        if self.controller.rename_tracker:
+            self.controller.rename_tracker.stop()
+        super().closeEvent(event)
+        
     def update_from_model(self):
         """Update the UI based on the current model state"""
         self.canvas.update_from_model()
@@ -1,4 +1,5 @@
 # ui/mirror_panel.py
+import copy
 from PySide2 import QtWidgets, QtCore, QtGui
 from utils.mirror_tools import MirrorTools
 
@@ -6,7 +7,7 @@ class MirrorPanel(QtWidgets.QDockWidget):
     def __init__(self, controller, parent=None):
         super().__init__("Mirror Tools", parent)
         self.controller = controller
-        self.mirror_tools = MirrorTools()
+        self.mirror_tools = controller.mirror_tools or MirrorTools()
         self.setup_ui()
         
     def setup_ui(self):
@@ -114,49 +115,47 @@ class MirrorPanel(QtWidgets.QDockWidget):
             return
             
         axis = self.get_axis()
-        center_x, center_y = self.get_center()
+        center = self.get_center()
+        
+        # Work on a copy, the controller swaps it in as one undoable edit
+        buttons = copy.deepcopy(self.controller.model.current_picker.buttons)
         
         # Get selected buttons
-        selected_ids = self.controller.view.canvas.get_selected_button_ids()
+        selected_ids = set(self.controller.view.canvas.get_selected_button_ids())
         selected_buttons = [
-            button for button in self.controller.model.current_picker.buttons
+            button for button in buttons
             if button.id in selected_ids
         ]
         
         if not selected_buttons:
             # If nothing selected, mirror all buttons
-            selected_buttons = self.controller.model.current_picker.buttons
+            selected_buttons = list(buttons)
             
-        # Begin undo action
-        self.controller.undo_manager.begin_action("Mirror Buttons")
-        
-        # Store original state for undo
-        original_buttons = self.controller.model.current_picker.buttons.copy()
-        
-        # Mirror buttons
-        new_buttons = []
-        for button in selected_buttons:
-            mirrored = self.mirror_tools.mirror_button(
-                button, axis, (center_x, center_y))
-            new_buttons.append(mirrored)
+        # Mirror all buttons in one batch
+        updates, created = self.mirror_tools.mirror_buttons(
+            selected_buttons, buttons, axis, center,
+            mirror_position=self.mirror_position.isChecked(),
+            mirror_nodes=self.mirror_nodes.isChecked()
+        )
+        
+        # Existing counterparts are updated in place rather than duplicated
+        for counterpart, mirrored in updates:
+            # Without position mirroring the counterpart stays where it is
+            if self.mirror_position.isChecked():
+                counterpart.position = mirrored.position
+            counterpart.size = mirrored.size
+            counterpart.color = mirrored.color
+            counterpart.shape = mirrored.shape
             
-            if self.replace_existing.isChecked():
-                # Replace original button
-                index = self.controller.model.current_picker.buttons.index(button)
-                self.controller.model.current_picker.buttons[index] = mirrored
-                
-        if self.create_new.isChecked() and not self.replace_existing.isChecked():
+        if self.replace_existing.isChecked():
+            # Replace original buttons, keeping their ids and list order
+            index_by_id = {button.id: i for i, button in enumerate(buttons)}
+            for source, mirrored in created:
+                mirrored.id = source.id
+                buttons[index_by_id[source.id]] = mirrored
+        elif self.create_new.isChecked():
             # Add new mirrored buttons
-            self.controller.model.current_picker.buttons.extend(new_buttons)
+            buttons.extend(mirrored for _, mirrored in created)
             
-        # Add to undo stack
-        self.controller.undo_manager.add_operation(
-            lambda: setattr(self.controller.model.current_picker, 'buttons', original_buttons),
-            lambda: setattr(self.controller.model.current_picker, 'buttons', 
-                           self.controller.model.current_picker.buttons)
-        )
-        self.controller.undo_manager.end_action()
-        
-        # Update view
-        if self.controller.view:
-            self.controller.view.update_from_model()
\ No newline at end of file
+        # One undo entry; the node index and symmetry pairs are rebuilt and the view redrawn
+        self.controller.replace_buttons(buttons, "Mirror Buttons")
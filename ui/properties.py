@@ -7,6 +7,7 @@ class PropertiesPanel(QtWidgets.QWidget):
         super().__init__(parent)
         self.controller = controller
         self.current_button = None
+        self.loaded_values = {}  # Editor field values when the current button was loaded
         self.setup_ui()
         
     def setup_ui(self):
@@ -17,6 +18,11 @@ class PropertiesPanel(QtWidgets.QWidget):
         layout.addWidget(QtWidgets.QLabel("Picker Name:"))
         layout.addWidget(self.picker_name)
         
+        # Symmetric editing mirrors edits onto the counterpart button
+        self.symmetry_check = QtWidgets.QCheckBox("Symmetric Editing")
+        self.symmetry_check.toggled.connect(self.toggle_symmetry)
+        layout.addWidget(self.symmetry_check)
+        
         # Button properties (initially hidden)
         self.button_properties = QtWidgets.QGroupBox("Button Properties")
         button_layout = QtWidgets.QFormLayout(self.button_properties)
@@ -51,6 +57,14 @@ class PropertiesPanel(QtWidgets.QWidget):
         self.target_nodes = QtWidgets.QTextEdit()
         button_layout.addRow("Target Nodes:", self.target_nodes)
         
+        # Select through a Maya objectSet built from the targets
+        self.use_selection_set = QtWidgets.QCheckBox("Use Selection Set")
+        button_layout.addRow("", self.use_selection_set)
+        
+        # Also select the controls below the targets
+        self.hierarchical = QtWidgets.QCheckBox("Select Hierarchy")
+        button_layout.addRow("", self.hierarchical)
+        
         # Script for script buttons
         self.script_text = QtWidgets.QTextEdit()
         button_layout.addRow("Script:", self.script_text)
@@ -109,9 +123,19 @@ class PropertiesPanel(QtWidgets.QWidget):
         if hasattr(self.current_button, 'target_nodes'):
             self.target_nodes.setPlainText("\n".join(self.current_button.target_nodes))
             
+        self.use_selection_set.setVisible(hasattr(self.current_button, 'use_selection_set'))
+        if hasattr(self.current_button, 'use_selection_set'):
+            self.use_selection_set.setChecked(self.current_button.use_selection_set)
+        self.hierarchical.setVisible(hasattr(self.current_button, 'hierarchical'))
+        if hasattr(self.current_button, 'hierarchical'):
+            self.hierarchical.setChecked(self.current_button.hierarchical)
+            
         if hasattr(self.current_button, 'script'):
             self.script_text.setPlainText(self.current_button.script)
             
+        # Apply only sends what was edited since the button was loaded
+        self.loaded_values = self.form_values()
+            
         # Show the properties panel
         self.button_properties.setVisible(True)
         
@@ -125,33 +149,60 @@ class PropertiesPanel(QtWidgets.QWidget):
         if color.isValid():
             self.color_button.setStyleSheet(f"background-color: {color.name()}")
             
-    def update_properties(self):
-        if not self.current_button:
-            return
+    def toggle_symmetry(self, enabled):
+        """Turn symmetric editing on or off"""
+        self.controller.set_symmetry(enabled)
             
-        # Update button properties from UI
-        self.current_button.label = self.button_label.text()
-        self.current_button.position.x = self.button_position_x.value()
-        self.current_button.position.y = self.button_position_y.value()
-        self.current_button.size.x = self.button_size_x.value()
-        self.current_button.size.y = self.button_size_y.value()
+    def form_values(self):
+        """Current values of the editor fields that apply to the current button"""
+        values = {
+            "label": self.button_label.text(),
+            "position": Vector2(self.button_position_x.value(), self.button_position_y.value()),
+            "size": Vector2(self.button_size_x.value(), self.button_size_y.value())
+        }
         
-        # Update color from button style
-        style = self.color_button.styleSheet()
         # Parse color from style - this is a simplified approach
+        style = self.color_button.styleSheet()
         if "background-color:" in style:
-            color_str = style.split("background-color:")[1].split(";")[0].strip()
-            color = QtGui.QColor(color_str)
-            self.current_button.color.r = color.red() / 255.0
-            self.current_button.color.g = color.green() / 255.0
-            self.current_button.color.b = color.blue() / 255.0
+            values["color"] = style.split("background-color:")[1].split(";")[0].strip()
             
         if hasattr(self.current_button, 'target_nodes'):
-            self.current_button.target_nodes = self.target_nodes.toPlainText().split("\n")
+            values["target_nodes"] = [node for node in self.target_nodes.toPlainText().split("\n") if node.strip()]
+            
+        if hasattr(self.current_button, 'use_selection_set'):
+            values["use_selection_set"] = self.use_selection_set.isChecked()
+        if hasattr(self.current_button, 'hierarchical'):
+            values["hierarchical"] = self.hierarchical.isChecked()
             
         if hasattr(self.current_button, 'script'):
-            self.current_button.script = self.script_text.toPlainText()
+            values["script"] = self.script_text.toPlainText()
+        return values
+            
+    def update_properties(self):
+        if not self.current_button:
+            return
+            
+        # Only fields edited since the button was loaded, so untouched ones
+        # are not reapplied or mirrored onto the counterpart
+        changes = {
+            name: value for name, value in self.form_values().items()
+            if value != self.loaded_values.get(name)
+        }
+        if "color" in changes:
+            color = QtGui.QColor(changes["color"])
+            changes["color"] = Color(
+                color.red() / 255.0,
+                color.green() / 255.0,
+                color.blue() / 255.0,
+                self.current_button.color.a
+            )
+        if not changes:
+            return
+            
+        # Apply as one edit, mirrored onto the counterpart when symmetry is on
+        changed_ids = self.controller.edit_buttons({self.current_button.id: changes})
+        self.loaded_values = self.form_values()
             
-        # Update the view
+        # Redraw only the edited buttons
         if self.controller.view:
-            self.controller.view.update_from_model()
\ No newline at end of file
+            self.controller.view.canvas.refresh_buttons(changed_ids)
\ No newline at end of file
@@ -0,0 +1,50 @@
+# ui/render_profile.py
+import math
+from dataclasses import dataclass
+from PySide2 import QtWidgets
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """Scene index and view settings for pickers up to `max_items` buttons.
+
+    Small pickers skip the BSP index, which only pays off once there are
+    enough items to cull. Larger ones use the index with a depth chosen from
+    the item count, cache the background and let items manage painter state.
+    """
+    name: str
+    max_items: float
+    use_index: bool = True
+    viewport_update: QtWidgets.QGraphicsView.ViewportUpdateMode = QtWidgets.QGraphicsView.MinimalViewportUpdate
+    cache_background: bool = False
+    dont_save_painter_state: bool = False
+    dont_adjust_for_antialiasing: bool = False
+
+    def bsp_depth(self, item_count: int) -> int:
+        """BSP tree depth for an item count, a few items per leaf"""
+        return max(5, min(16, math.ceil(math.log2(max(item_count, 1))) - 2))
+
+PROFILES = (
+    RenderProfile("small", 500, use_index=False),
+    RenderProfile(
+        "large", 20000,
+        viewport_update=QtWidgets.QGraphicsView.SmartViewportUpdate,
+        cache_background=True,
+        dont_save_painter_state=True,
+        dont_adjust_for_antialiasing=True,
+    ),
+    RenderProfile(
+        "huge", math.inf,
+        viewport_update=QtWidgets.QGraphicsView.FullViewportUpdate,
+        cache_background=True,
+        dont_save_painter_state=True,
+        dont_adjust_for_antialiasing=True,
+    ),
+)
+
+def profile_named(name: str):
+    """Render profile with the given name, or None"""
+    return next((profile for profile in PROFILES if profile.name == name), None)
+
+def profile_for_count(item_count: int) -> RenderProfile:
+    """Smallest render profile that covers an item count"""
+    return next(profile for profile in PROFILES if item_count <= profile.max_items)
@@ -0,0 +1,117 @@
+# ui/shape_cache.py
+import functools
+import math
+from PySide2 import QtGui
+from core.model import ShapeType
+
+@functools.lru_cache(maxsize=None)
+def unit_polygon(sides: int):
+    """Vertices of a regular polygon of radius 1, first vertex at angle 0"""
+    return tuple(
+        (math.cos(2 * math.pi * i / sides), math.sin(2 * math.pi * i / sides))
+        for i in range(sides)
+    )
+
+class ShapePathCache:
+    """Shared QPainterPaths for button shapes.
+
+    Paths are built once per (shape, sides, corner radius, size, points) in
+    button-local coordinates, with the top-left corner at the origin. Items
+    are placed with setPos, so every button of the same shape and size shares
+    one path. `simple_path` gives a cheaper outline of the same footprint
+    for zoomed out views.
+    """
+    # Most vertices a simplified outline keeps
+    SIMPLE_VERTICES = 8
+
+    def __init__(self):
+        self.paths = {}
+        self.simple_paths = {}
+        self.hits = 0
+        self.misses = 0
+
+    def key(self, button):
+        points = tuple((p.x, p.y) for p in button.points) if button.points else ()
+        return (button.shape, button.sides, button.corner_radius, button.size.x, button.size.y, points)
+
+    def path(self, button) -> QtGui.QPainterPath:
+        """Local-space path of a button's shape"""
+        key = self.key(button)
+        path = self.paths.get(key)
+        if path is None:
+            self.misses += 1
+            path = self.paths[key] = self._build(*key)
+        else:
+            self.hits += 1
+        return path
+
+    def simple_path(self, button) -> QtGui.QPainterPath:
+        """Local-space path of a button's shape with curves and dense polygons reduced"""
+        key = self.key(button)
+        path = self.simple_paths.get(key)
+        if path is None:
+            path = self.simple_paths[key] = self._build_simple(*key)
+        return path
+
+    def clear(self):
+        self.paths.clear()
+        self.simple_paths.clear()
+
+    def _build(self, shape, sides, corner_radius, width, height, points):
+        path = QtGui.QPainterPath()
+        if shape == ShapeType.ROUND_RECTANGLE:
+            path.addRoundedRect(0, 0, width, height, corner_radius, corner_radius)
+        elif shape == ShapeType.CIRCLE:
+            radius = min(width, height) / 2
+            path.addEllipse(width / 2 - radius, height / 2 - radius, radius * 2, radius * 2)
+        elif shape == ShapeType.TRIANGLE:
+            path.moveTo(width / 2, 0)
+            path.lineTo(width, height)
+            path.lineTo(0, height)
+            path.closeSubpath()
+        elif shape == ShapeType.DIAMOND:
+            path.moveTo(width / 2, 0)
+            path.lineTo(width, height / 2)
+            path.lineTo(width / 2, height)
+            path.lineTo(0, height / 2)
+            path.closeSubpath()
+        elif shape == ShapeType.HEXAGON:
+            self._add_regular_polygon(path, 6, width, height)
+        elif shape == ShapeType.POLYGON:
+            if points:
+                path.moveTo(*points[0])
+                for point in points[1:]:
+                    path.lineTo(*point)
+                path.closeSubpath()
+            else:
+                self._add_regular_polygon(path, max(sides, 3), width, height)
+        else:
+            path.addRect(0, 0, width, height)
+        return path
+
+    def _build_simple(self, shape, sides, corner_radius, width, height, points):
+        if shape in (ShapeType.RECTANGLE, ShapeType.ROUND_RECTANGLE):
+            path = QtGui.QPainterPath()
+            path.addRect(0, 0, width, height)
+            return path
+        if shape == ShapeType.CIRCLE:
+            path = QtGui.QPainterPath()
+            self._add_regular_polygon(path, self.SIMPLE_VERTICES, width, height)
+            return path
+        if shape == ShapeType.POLYGON:
+            if len(points) > self.SIMPLE_VERTICES:
+                step = len(points) / self.SIMPLE_VERTICES
+                points = tuple(points[int(i * step)] for i in range(self.SIMPLE_VERTICES))
+            elif not points:
+                sides = min(max(sides, 3), self.SIMPLE_VERTICES)
+        # Triangles, diamonds and hexagons are already cheap
+        return self._build(shape, sides, corner_radius, width, height, points)
+
+    def _add_regular_polygon(self, path, sides, width, height):
+        radius = min(width, height) / 2
+        center_x, center_y = width / 2, height / 2
+        vertices = unit_polygon(sides)
+        path.moveTo(center_x + radius * vertices[0][0], center_y + radius * vertices[0][1])
+        for cos_a, sin_a in vertices[1:]:
+            path.lineTo(center_x + radius * cos_a, center_y + radius * sin_a)
+        path.closeSubpath()
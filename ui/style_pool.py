@@ -0,0 +1,49 @@
+# ui/style_pool.py
+from PySide2 import QtCore, QtGui
+
+def rgba(color):
+    """8-bit RGBA tuple of a model Color"""
+    return (int(color.r * 255), int(color.g * 255), int(color.b * 255), int(color.a * 255))
+
+class StylePool:
+    """Interned QColor, QBrush, QPen and QFont objects for canvas items.
+
+    Qt copies these by value but shares the underlying data, so handing the
+    same pooled object to thousands of items keeps one brush per colour
+    instead of one per button. `created` counts the objects actually built.
+    """
+    def __init__(self):
+        self.objects = {}
+        self.created = 0
+
+    def _get(self, key, factory):
+        obj = self.objects.get(key)
+        if obj is None:
+            obj = self.objects[key] = factory()
+            self.created += 1
+        return obj
+
+    def color(self, rgba_value):
+        """QColor for an (r, g, b, a) tuple of 0-255 ints"""
+        return self._get(("color", rgba_value), lambda: QtGui.QColor(*rgba_value))
+
+    def brush(self, rgba_value):
+        """Solid QBrush for an (r, g, b, a) tuple"""
+        return self._get(("brush", rgba_value), lambda: QtGui.QBrush(self.color(rgba_value)))
+
+    def pen(self, rgba_value=(0, 0, 0, 255), width: float = 1, style=QtCore.Qt.SolidLine):
+        """QPen for an (r, g, b, a) tuple, width and line style"""
+        return self._get(("pen", rgba_value, width, style), lambda: QtGui.QPen(self.color(rgba_value), width, style))
+
+    def font(self, size: int, bold: bool = False, italic: bool = False):
+        """QFont for a point size and weight/slant"""
+        def build():
+            font = QtGui.QFont()
+            font.setPointSize(size)
+            font.setBold(bold)
+            font.setItalic(italic)
+            return font
+        return self._get(("font", size, bold, italic), build)
+
+    def clear(self):
+        self.objects.clear()
@@ -0,0 +1,292 @@
+# utils/attribute_sync.py
+from typing import Dict, List, Set, Tuple, Callable, Iterable, Optional
+
+class MayaAttributeSource:
+    """Attribute reads and change notifications from the Maya scene.
+
+    Attribute paths are canonical "node.longName" paths, so a binding typed
+    as "ctrl.tx" and a change reported for "ctrl.translateX" meet. Plugs are
+    resolved once and read through the API, not with one getAttr command
+    per attribute.
+    """
+    def __init__(self):
+        self.node_callbacks = {}  # node: callback id
+        self.time_callback = None
+        self.plugs = {}  # canonical attr path: MPlug
+
+    def canonical_path(self, attr_path: str) -> str:
+        """The node.longName path of an attribute, unchanged if it does not exist"""
+        plug = self._find_plug(attr_path)
+        if plug is None:
+            return attr_path
+        path = f"{attr_path.split('.', 1)[0]}.{plug.partialName(useLongNames=True)}"
+        self.plugs[path] = plug
+        return path
+
+    def _find_plug(self, attr_path: str):
+        import maya.api.OpenMaya as om
+        plug = self.plugs.get(attr_path)
+        if plug is not None:
+            return plug
+        selection = om.MSelectionList()
+        try:
+            selection.add(attr_path)
+            return selection.getPlug(0)
+        except (RuntimeError, TypeError):
+            return None
+
+    def read(self, attr_paths: Iterable[str]) -> Dict[str, float]:
+        """Read the current value of each existing attribute, in UI units"""
+        import maya.api.OpenMaya as om
+        values = {}
+        for attr_path in attr_paths:
+            plug = self._find_plug(attr_path)
+            if plug is None:
+                continue
+            try:
+                values[attr_path] = plug_value(om, plug)
+            except RuntimeError:
+                # The node was deleted since the plug was resolved
+                self.plugs.pop(attr_path, None)
+        return values
+
+    def watch(self, nodes: Set[str], on_change: Callable[[str], None], on_time_change: Callable[[], None]):
+        """Call on_change(attr_path) when an attribute of the nodes is set"""
+        import maya.api.OpenMaya as om
+
+        # Only add or remove callbacks for nodes that changed
+        for node in set(self.node_callbacks) - nodes:
+            om.MMessage.removeCallback(self.node_callbacks.pop(node))
+
+        for node in nodes - set(self.node_callbacks):
+            selection = om.MSelectionList()
+            try:
+                selection.add(node)
+            except RuntimeError:
+                continue
+
+            def attribute_changed(message, plug, other_plug, client_data, node=node):
+                if message & om.MNodeMessage.kAttributeSet:
+                    # Setting a compound such as translate sets each of its children
+                    plugs = [plug.child(i) for i in range(plug.numChildren())] if plug.isCompound else [plug]
+                    for changed in plugs:
+                        on_change(f"{node}.{changed.partialName(useLongNames=True)}")
+
+            self.node_callbacks[node] = om.MNodeMessage.addAttributeChangedCallback(
+                selection.getDependNode(0), attribute_changed
+            )
+
+        # Animated values change with the timeline without attribute set messages
+        if self.time_callback is None:
+            self.time_callback = om.MEventMessage.addEventCallback("timeChanged", lambda *args: on_time_change())
+
+    def unwatch(self):
+        """Remove all callbacks"""
+        import maya.api.OpenMaya as om
+        for callback_id in self.node_callbacks.values():
+            om.MMessage.removeCallback(callback_id)
+        self.node_callbacks.clear()
+        if self.time_callback is not None:
+            om.MMessage.removeCallback(self.time_callback)
+            self.time_callback = None
+        self.plugs.clear()
+
+def plug_value(om, plug) -> float:
+    """Numeric value of a plug in the units getAttr would report"""
+    attribute = plug.attribute()
+    if attribute.hasFn(om.MFn.kUnitAttribute):
+        unit_type = om.MFnUnitAttribute(attribute).unitType()
+        if unit_type == om.MFnUnitAttribute.kAngle:
+            return plug.asMAngle().asUnits(om.MAngle.uiUnit())
+        if unit_type == om.MFnUnitAttribute.kDistance:
+            return plug.asMDistance().asUnits(om.MDistance.uiUnit())
+        if unit_type == om.MFnUnitAttribute.kTime:
+            return plug.asMTime().asUnits(om.MTime.uiUnit())
+    return plug.asDouble()
+
+class LocalAttributeSource:
+    """In-memory stand-in for the Maya scene, for running the sync headlessly.
+
+    `long_names` maps short attribute names to long ones, like Maya resolves
+    "tx" to "translateX"; values are stored under long names.
+    """
+    def __init__(self, values: Optional[Dict[str, float]] = None, long_names: Optional[Dict[str, str]] = None):
+        self.long_names = dict(long_names or {})
+        self.values = {self.canonical_path(path): value for path, value in (values or {}).items()}
+        self.read_count = 0
+        self.on_change = None
+        self.on_time_change = None
+        self.nodes: Set[str] = set()
+
+    def canonical_path(self, attr_path: str) -> str:
+        node, _, attr = attr_path.partition(".")
+        return f"{node}.{self.long_names.get(attr, attr)}"
+
+    def read(self, attr_paths: Iterable[str]) -> Dict[str, float]:
+        self.read_count += 1
+        return {path: self.values[path] for path in attr_paths if path in self.values}
+
+    def watch(self, nodes: Set[str], on_change: Callable[[str], None], on_time_change: Callable[[], None]):
+        self.nodes = set(nodes)
+        self.on_change = on_change
+        self.on_time_change = on_time_change
+
+    def unwatch(self):
+        self.nodes = set()
+        self.on_change = None
+        self.on_time_change = None
+
+    def set_value(self, attr_path: str, value: float):
+        """Change a value and notify like Maya would"""
+        attr_path = self.canonical_path(attr_path)
+        self.values[attr_path] = value
+        if self.on_change and attr_path.split(".", 1)[0] in self.nodes:
+            self.on_change(attr_path)
+
+    def change_time(self, values: Dict[str, float]):
+        """Change many values at once, like scrubbing the timeline"""
+        self.values.update({self.canonical_path(path): value for path, value in values.items()})
+        if self.on_time_change:
+            self.on_time_change()
+
+def widget_bindings(button) -> List[Tuple[str, str]]:
+    """(attribute path, button field) pairs a widget button displays"""
+    from core.model import Slider, Checkbox, RadiusButton
+
+    bindings = []
+    if isinstance(button, (Slider, Checkbox, RadiusButton)) and button.target_node and button.attribute:
+        field = "is_checked" if isinstance(button, Checkbox) else "current_value"
+        bindings.append((f"{button.target_node}.{button.attribute}", field))
+    if isinstance(button, Slider) and button.is_2d and button.target_node and button.second_attribute:
+        bindings.append((f"{button.target_node}.{button.second_attribute}", "second_current_value"))
+    return bindings
+
+class AttributeSyncService:
+    """Keep Slider, Checkbox and RadiusButton values in sync with the scene.
+
+    Change notifications only mark attributes dirty. Dirty attributes are
+    read in one batch at most once per frame, and on_refresh receives the
+    ids of the buttons whose value actually changed so only those repaint.
+    When callbacks are not available, poll() reads every subscribed
+    attribute in bulk at poll_interval instead.
+    """
+    def __init__(self, source, on_refresh: Callable[[Set[str]], None], schedule=None,
+                 frame_interval: float = 1.0 / 60.0, poll_interval: Optional[float] = None):
+        self.source = source
+        self.on_refresh = on_refresh
+        self.schedule = schedule or self._schedule_timer
+        self.frame_interval = frame_interval
+        self.poll_interval = poll_interval
+        self.bindings: Dict[str, List[Tuple[object, str]]] = {}  # attr path: [(button, field)]
+        self.button_paths: Dict[str, List[str]] = {}  # button id: attr paths
+        self.dirty: Set[str] = set()
+        self._pending = False
+        self._poll_timer = None
+
+    def _schedule_timer(self, func, delay):
+        from PySide2 import QtCore
+        QtCore.QTimer.singleShot(int(delay * 1000), func)
+
+    def set_buttons(self, buttons: Iterable):
+        """Subscribe to the attributes of all widget buttons of a picker and read them once"""
+        self.bindings.clear()
+        self.button_paths.clear()
+        for button in buttons:
+            self._bind(button)
+        self._watch()
+        # Saved values may be stale, the first flush shows the scene's
+        if self.bindings:
+            self.time_changed()
+
+    def update_button(self, button):
+        """Subscribe a new or retargeted button"""
+        self.remove_button(button.id, watch=False)
+        self._bind(button)
+        self._watch()
+
+    def remove_button(self, button_id: str, watch: bool = True):
+        """Unsubscribe a button"""
+        for attr_path in self.button_paths.pop(button_id, []):
+            bound = [b for b in self.bindings.get(attr_path, []) if b[0].id != button_id]
+            if bound:
+                self.bindings[attr_path] = bound
+            else:
+                self.bindings.pop(attr_path, None)
+        if watch:
+            self._watch()
+
+    def _bind(self, button):
+        for attr_path, field in widget_bindings(button):
+            # Notifications and reads use long names, whatever the button was given
+            attr_path = self.source.canonical_path(attr_path)
+            self.bindings.setdefault(attr_path, []).append((button, field))
+            self.button_paths.setdefault(button.id, []).append(attr_path)
+
+    def _watch(self):
+        if self.poll_interval:
+            self._start_polling()
+            return
+        nodes = {attr_path.split(".", 1)[0] for attr_path in self.bindings}
+        try:
+            self.source.watch(nodes, self.attribute_changed, self.time_changed)
+        except Exception as e:
+            # Fall back to bulk polling when callbacks cannot be registered
+            print(f"Attribute callbacks unavailable, polling instead: {e}")
+            self.poll_interval = 0.1
+            self._start_polling()
+
+    def stop(self):
+        """Stop all notifications and polling"""
+        self.source.unwatch()
+        if self._poll_timer:
+            self._poll_timer.stop()
+            self._poll_timer = None
+
+    def attribute_changed(self, attr_path: str):
+        """Mark one attribute dirty and schedule a refresh"""
+        if attr_path in self.bindings:
+            self.dirty.add(attr_path)
+            self._request_flush()
+
+    def time_changed(self):
+        """Mark everything dirty, animated values may have changed"""
+        self.dirty.update(self.bindings)
+        self._request_flush()
+
+    def _request_flush(self):
+        if not self._pending:
+            self._pending = True
+            self.schedule(self.flush, self.frame_interval)
+
+    def flush(self):
+        """Read all dirty attributes in one batch and refresh changed buttons"""
+        self._pending = False
+        dirty, self.dirty = self.dirty, set()
+        if dirty:
+            self._apply(self.source.read(dirty))
+
+    def poll(self):
+        """Read every subscribed attribute in bulk"""
+        self._apply(self.source.read(list(self.bindings)))
+
+    def _start_polling(self):
+        if self._poll_timer is None:
+            from PySide2 import QtCore
+            self._poll_timer = QtCore.QTimer()
+            self._poll_timer.timeout.connect(self.poll)
+            self._poll_timer.start(int(self.poll_interval * 1000))
+
+    def _apply(self, values: Dict[str, float]):
+        changed = set()
+        for attr_path, value in values.items():
+            for button, field in self.bindings.get(attr_path, ()):
+                display = value
+                if field == "is_checked":
+                    # Checked when the value is closer to the checked value
+                    display = abs(value - button.checked_value) < abs(value - button.unchecked_value)
+                if getattr(button, field) != display:
+                    setattr(button, field, display)
+                    changed.add(button.id)
+
+        if changed:
+            self.on_refresh(changed)
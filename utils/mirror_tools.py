@@ -1,71 +1,291 @@
 # utils/mirror_tools.py
-import maya.cmds as cmds
+import copy
+import functools
+import json
 import re
+import numpy as np
+from core.pose_mirror import MirrorTable, split_namespace
+
+# Studio default naming convention, (token regex, replacement) pairs
+DEFAULT_MIRROR_PATTERNS = [
+    (r'^L_', 'R_'),
+    (r'^R_', 'L_'),
+    (r'_L$', '_R'),
+    (r'_R$', '_L'),
+    (r'Left', 'Right'),
+    (r'Right', 'Left'),
+    (r'left', 'right'),
+    (r'right', 'left'),
+]
 
 class MirrorTools:
-    def __init__(self):
-        self.mirror_patterns = [
-            (r'^L_', 'R_'),
-            (r'^R_', 'L_'),
-            (r'_L$', '_R'),
-            (r'_R$', '_L'),
-            (r'Left', 'Right'),
-            (r'Right', 'Left'),
-            (r'left', 'right'),
-            (r'right', 'left'),
-        ]
+    def __init__(self, mirror_patterns=None, cache_size=100000):
+        self.cache_size = cache_size
+        self.set_mirror_patterns(mirror_patterns or DEFAULT_MIRROR_PATTERNS)
+        
+    def set_mirror_patterns(self, mirror_patterns):
+        """Compile all token patterns into a single alternation.
+        
+        Every token in a name is swapped in one pass, so names containing
+        both sides (e.g. "Left_to_Right") are swapped instead of collapsing
+        onto one side. Earlier patterns win when two match at one position.
+        Group references in replacements (\\1, \\g<1>) refer to the groups of
+        their own pattern.
+        """
+        self.mirror_patterns = [tuple(pair) for pair in mirror_patterns]
+        self._replacements = {}
+        parts = []
+        group_offset = 0
+        for i, (pattern, replacement) in enumerate(self.mirror_patterns):
+            parts.append(f"(?P<p{i}>{pattern})")
+            # The pattern's own groups follow its wrapping group in the alternation
+            groups = re.compile(pattern).groups
+            self._replacements[f"p{i}"] = shift_group_references(replacement, group_offset + 1, groups)
+            group_offset += groups + 1
+        self._mirror_regex = re.compile("|".join(parts))
+        
+        # New patterns invalidate every memoized name
+        self._mirror_name = functools.lru_cache(maxsize=self.cache_size)(self._mirror_name_uncached)
+        
+    def load_mirror_patterns(self, file_path):
+        """Load a studio naming convention from a JSON list of [pattern, replacement]"""
+        with open(file_path, 'r') as f:
+            data = json.load(f)
+            
+        if isinstance(data, dict):
+            data = data.get("patterns", [])
+        self.set_mirror_patterns(data)
+        
+    def _swap_token(self, match):
+        replacement = self._replacements[match.lastgroup]
+        return match.expand(replacement) if "\\" in replacement else replacement
+        
+    def _mirror_name_uncached(self, node_name):
+        # Namespaces are shared by both sides, only the short name is mirrored
+        namespace, short_name = split_namespace(node_name)
+        mirrored = self._mirror_regex.sub(self._swap_token, short_name)
+        return f"{namespace}:{mirrored}" if namespace else mirrored
         
     def mirror_node_name(self, node_name, axis='X'):
         """Mirror a node name based on naming conventions"""
-        for pattern, replacement in self.mirror_patterns:
-            if re.search(pattern, node_name):
-                return re.sub(pattern, replacement, node_name)
-                
-        # If no pattern matched, try to add/remove L/R prefix
-        if node_name.startswith('L_'):
-            return 'R_' + node_name[2:]
-        elif node_name.startswith('R_'):
-            return 'L_' + node_name[2:]
-        elif node_name.startswith('Left'):
-            return 'Right' + node_name[4:]
-        elif node_name.startswith('Right'):
-            return 'Left' + node_name[5:]
-        elif node_name.startswith('left'):
-            return 'right' + node_name[4:]
-        elif node_name.startswith('right'):
-            return 'left' + node_name[5:]
-            
-        return node_name
-        
-    def mirror_position(self, position, axis='X', center=0.0):
-        """Mirror a position across an axis"""
-        if axis == 'X':
-            return Vector2(2 * center - position.x, position.y)
-        elif axis == 'Y':
-            return Vector2(position.x, 2 * center - position.y)
-        elif axis == 'XY':
-            return Vector2(2 * center - position.x, 2 * center - position.y)
-        return position
+        return self._mirror_name(node_name)
+        
+    def mirror_names(self, node_names, axis='X'):
+        """Mirror a list of node names"""
+        mirror_name = self._mirror_name
+        return [mirror_name(node_name) for node_name in node_names]
+        
+    def _split_center(self, center):
+        """Accept a scalar center or an (x, y) center point"""
+        if isinstance(center, (tuple, list)):
+            return float(center[0]), float(center[1])
+        return float(center), float(center)
+        
+    def mirror_position(self, position, axis='X', center=0.0, size=None):
+        """Mirror the top-left corner of a rectangle of the given size across an axis.
+        
+        Same convention as mirror_rects; without a size the position is
+        mirrored as a point.
+        """
+        from core.model import Vector2
+        
+        center_x, center_y = self._split_center(center)
+        width, height = (size.x, size.y) if size is not None else (0.0, 0.0)
+        x, y = position.x, position.y
+        if axis in ('X', 'XY'):
+            x = 2 * center_x - position.x - width
+        if axis in ('Y', 'XY'):
+            y = 2 * center_y - position.y - height
+        return Vector2(x, y)
         
     def mirror_button(self, button, axis='X', center=0.0):
         """Create a mirrored version of a button"""
-        from core.model import SelectButton, PoseButton, AttributeButton
+        from core.model import SelectButton, PoseButton, AttributeButton, Checkbox, RadiusButton
         
         # Create a copy of the button
         mirrored = button.__class__.__new__(button.__class__)
         mirrored.__dict__ = button.__dict__.copy()
         
         # Mirror position
-        mirrored.position = self.mirror_position(button.position, axis, center)
+        mirrored.position = self.mirror_position(button.position, axis, center, button.size)
         
-        # Mirror target nodes for select and pose buttons
-        if isinstance(button, (SelectButton, PoseButton)):
-            mirrored.target_nodes = [
-                self.mirror_node_name(node, axis) for node in button.target_nodes
-            ]
+        # Mirror target nodes, attribute targets and poses
+        if isinstance(button, (SelectButton, PoseButton, AttributeButton, Checkbox, RadiusButton)):
+            self.mirror_targets(button, mirrored, axis)
             
-        # Mirror attribute targets for attribute buttons
-        if isinstance(button, AttributeButton):
+        return mirrored
+        
+    def mirror_rects(self, buttons, axis='X', center=0.0):
+        """Mirror the rectangles of many buttons at once.
+        
+        Returns an (n, 2) array of mirrored top-left corners. Sizes are taken
+        into account so the mirrored rectangle covers the mirrored area.
+        """
+        center_x, center_y = self._split_center(center)
+        rects = np.array(
+            [(b.position.x, b.position.y, b.size.x, b.size.y) for b in buttons], dtype=float
+        ).reshape(-1, 4)
+        
+        positions = rects[:, :2].copy()
+        if axis in ('X', 'XY'):
+            positions[:, 0] = 2 * center_x - rects[:, 0] - rects[:, 2]
+        if axis in ('Y', 'XY'):
+            positions[:, 1] = 2 * center_y - rects[:, 1] - rects[:, 3]
+        return positions
+        
+    def mirror_targets(self, button, mirrored, axis='X'):
+        """Map the target nodes and pose of a button copy through the mirrored name table"""
+        if getattr(button, 'target_nodes', None):
+            mirrored.target_nodes = self.mirror_names(button.target_nodes, axis)
+        if getattr(button, 'target_node', None):
             mirrored.target_node = self.mirror_node_name(button.target_node, axis)
+        if getattr(button, 'pose_data', None):
+            mirrored.pose_data = self.mirror_pose_data(button.pose_data, axis)
             
-        return mirrored
\ No newline at end of file
+    def mirror_pose_data(self, pose_data, axis='X'):
+        """Mirror image of a pose, keyed by the mirrored nodes with flipped values"""
+        node_attrs = {}
+        for node, attrs in pose_data.items():
+            node_attrs.setdefault(node, {}).update(dict.fromkeys(attrs))
+            node_attrs.setdefault(self.mirror_node_name(node, axis), {}).update(dict.fromkeys(attrs))
+        table = MirrorTable(node_attrs, self._mirror_name, axis)
+        return table.to_pose(table.flip(table.to_array(pose_data)))
+        
+    def mirror_buttons(self, buttons, existing_buttons, axis='X', center=0.0,
+                       mirror_position=True, mirror_nodes=True):
+        """Mirror many buttons in one batch.
+        
+        Returns (updates, created): updates pairs each existing counterpart
+        with its freshly mirrored state, created pairs each source that has
+        no counterpart yet with a new mirrored button.
+        """
+        from core.model import Vector2
+        
+        pair_index = MirrorPairIndex(existing_buttons)
+        used_ids = set(pair_index.buttons)
+        positions = self.mirror_rects(buttons, axis, center) if mirror_position else None
+        
+        updates = []
+        created = []
+        for i, button in enumerate(buttons):
+            mirrored = copy.deepcopy(button)
+            if positions is not None:
+                mirrored.position = Vector2(float(positions[i, 0]), float(positions[i, 1]))
+            if mirror_nodes:
+                self.mirror_targets(button, mirrored, axis)
+                
+            counterpart = pair_index.find(mirrored, exclude=button.id)
+            if counterpart:
+                updates.append((counterpart, mirrored))
+                continue
+                
+            mirrored.id = unique_button_id(f"{button.id}_mirror", used_ids)
+            used_ids.add(mirrored.id)
+            created.append((button, mirrored))
+            
+        return updates, created
+
+    def mirrored_pair_key(self, button, axis='X', center=0.0):
+        """Pair key the mirror counterpart of a button would have"""
+        target_nodes = getattr(button, 'target_nodes', None)
+        target_node = getattr(button, 'target_node', None)
+        if target_node:
+            nodes = self.mirror_names([target_node] + list(target_nodes or []), axis)
+            return (button.type, nodes[0], tuple(sorted(nodes[1:])), getattr(button, 'attribute', ''))
+        if target_nodes:
+            return (button.type, tuple(sorted(self.mirror_names(target_nodes, axis))))
+        position = self.mirror_rects([button], axis, center)[0]
+        return (button.type, round(position[0]), round(position[1]))
+
+def shift_group_references(replacement, shift, groups):
+    """Renumber the \\N and \\g<N> group references of a replacement string by shift"""
+    def shifted(match):
+        if match.group(1):
+            # Escaped backslash, not a reference
+            return match.group(1)
+        number = int(match.group(2) or match.group(3))
+        if number > groups:
+            raise ValueError(f"Mirror replacement '{replacement}' refers to group {number}, "
+                             f"its pattern has {groups}")
+        return f"\\g<{number + shift if number else 0}>"
+    return re.sub(r"(\\\\)|\\(\d{1,2})|\\g<(\d+)>", shifted, replacement)
+
+def unique_button_id(base_id, used_ids):
+    """Return base_id, or base_id with a numeric suffix if it is already used"""
+    button_id = base_id
+    counter = 1
+    while button_id in used_ids:
+        counter += 1
+        button_id = f"{base_id}_{counter}"
+    return button_id
+
+def button_pair_key(button):
+    """Key identifying what a button drives, shared by a button and its duplicate"""
+    target_nodes = getattr(button, 'target_nodes', None)
+    target_node = getattr(button, 'target_node', None)
+    if target_node:
+        # Multi-target attribute buttons also pair by their extra targets
+        return (button.type, target_node, tuple(sorted(target_nodes or [])), getattr(button, 'attribute', ''))
+    if target_nodes:
+        return (button.type, tuple(sorted(target_nodes)))
+    # Buttons without targets pair up by where they sit
+    return (button.type, round(button.position.x), round(button.position.y))
+
+class MirrorPairIndex:
+    """Index of buttons by pair key for O(1) counterpart lookups"""
+    def __init__(self, buttons=()):
+        self.buttons = {}
+        self.by_key = {}
+        for button in buttons:
+            self.add(button)
+            
+    def add(self, button):
+        self.buttons[button.id] = button
+        self.by_key.setdefault(button_pair_key(button), []).append(button.id)
+        
+    def find(self, button, exclude=None):
+        """Find an existing button with the same pair key as the given one"""
+        for button_id in self.by_key.get(button_pair_key(button), ()):
+            if button_id != exclude:
+                return self.buttons[button_id]
+        return None
+
+class SymmetryPairs:
+    """Persistent left/right pairing of the buttons of a picker.
+    
+    Pairs come from the naming rules for buttons with targets and from
+    mirrored positions for the rest, and are kept in a dict so finding the
+    counterpart of an edited button is a single lookup.
+    """
+    def __init__(self, mirror_tools, axis='X', center=0.0):
+        self.mirror_tools = mirror_tools
+        self.axis = axis
+        self.center = center
+        self.pairs = {}
+        self.buttons = {}
+        
+    def build(self, buttons):
+        """Pair every button with its mirror counterpart"""
+        index = MirrorPairIndex(buttons)
+        self.buttons = index.buttons
+        self.pairs = {}
+        for button in buttons:
+            if button.id in self.pairs:
+                continue
+            key = self.mirror_tools.mirrored_pair_key(button, self.axis, self.center)
+            for counterpart_id in index.by_key.get(key, ()):
+                if counterpart_id != button.id and counterpart_id not in self.pairs:
+                    self.pairs[button.id] = counterpart_id
+                    self.pairs[counterpart_id] = button.id
+                    break
+                    
+    def counterpart(self, button_id):
+        """Get the counterpart button of a button, or None"""
+        return self.buttons.get(self.pairs.get(button_id))
+        
+    def mirrored_position(self, button):
+        """Position the counterpart of a button should have"""
+        from core.model import Vector2
+        
+        position = self.mirror_tools.mirror_rects([button], self.axis, self.center)[0]
+        return Vector2(float(position[0]), float(position[1]))
@@ -0,0 +1,62 @@
+# utils/rename_tracker.py
+
+class RenameTracker:
+    """Follow node renames so button targets keep pointing at the right nodes.
+
+    Maya reports each rename separately, so renames are queued and applied
+    together once per event-loop turn through controller.apply_rename_map.
+    node_renamed() can be called directly to feed renames without Maya.
+    """
+    def __init__(self, controller, on_renamed=None, schedule=None):
+        self.controller = controller
+        self.on_renamed = on_renamed  # Called with the ids of the changed buttons
+        self.schedule = schedule or self._schedule_next_turn
+        self.pending = {}  # old name: new name
+        self.callback_id = None
+        self._flush_pending = False
+
+    def _schedule_next_turn(self, func):
+        from PySide2 import QtCore
+        QtCore.QTimer.singleShot(0, func)
+
+    def start(self):
+        """Listen to Maya node renames"""
+        if self.callback_id is not None:
+            return
+        import maya.api.OpenMaya as om
+
+        def name_changed(node, previous_name, client_data):
+            # New nodes report an empty or temporary previous name
+            if previous_name and not previous_name.startswith("__"):
+                self.node_renamed(previous_name, om.MFnDependencyNode(node).name())
+
+        self.callback_id = om.MNodeMessage.addNameChangedCallback(om.MObject.kNullObj, name_changed)
+
+    def stop(self):
+        """Stop listening to renames"""
+        if self.callback_id is not None:
+            import maya.api.OpenMaya as om
+            om.MMessage.removeCallback(self.callback_id)
+            self.callback_id = None
+
+    def node_renamed(self, old_name: str, new_name: str):
+        """Queue one rename"""
+        if old_name == new_name:
+            return
+        # Chained renames (a -> b -> c) collapse into a -> c
+        for source, target in self.pending.items():
+            if target == old_name:
+                self.pending[source] = new_name
+        self.pending.setdefault(old_name, new_name)
+
+        if not self._flush_pending:
+            self._flush_pending = True
+            self.schedule(self.flush)
+
+    def flush(self):
+        """Apply all queued renames as one edit"""
+        self._flush_pending = False
+        rename_map, self.pending = self.pending, {}
+        changed = self.controller.apply_rename_map(rename_map)
+        if changed and self.on_renamed:
+            self.on_renamed(changed)
@@ -0,0 +1,61 @@
+# utils/selection_sync.py
+import maya.cmds as cmds
+
+class SelectionSync:
+    """Highlight picker buttons whose targets are selected in the viewport.
+
+    Maya can fire SelectionChanged many times for one user action, so the
+    callback only schedules a flush, and the flush runs once per event-loop
+    turn. The flush reads the selection once and resolves it through the
+    controller's node index, then reports only the buttons whose highlight
+    state changed.
+    """
+    def __init__(self, controller, on_highlight, schedule=None):
+        self.controller = controller
+        self.on_highlight = on_highlight  # Called with (added_ids, removed_ids)
+        self.schedule = schedule or self._schedule_next_turn
+        self.highlighted = set()
+        self.callback_id = None
+        self._pending = False
+
+    def _schedule_next_turn(self, func):
+        from PySide2 import QtCore
+        QtCore.QTimer.singleShot(0, func)
+
+    def start(self):
+        """Listen to Maya selection changes"""
+        if self.callback_id is not None:
+            return
+        import maya.api.OpenMaya as om
+        self.callback_id = om.MEventMessage.addEventCallback("SelectionChanged", self.selection_changed)
+        self.flush()
+
+    def stop(self):
+        """Stop listening and clear all highlights"""
+        if self.callback_id is not None:
+            import maya.api.OpenMaya as om
+            om.MMessage.removeCallback(self.callback_id)
+            self.callback_id = None
+        if self.highlighted:
+            self.on_highlight(set(), self.highlighted)
+            self.highlighted = set()
+
+    def selection_changed(self, *args):
+        """Maya callback, coalesces bursts into one flush"""
+        if not self._pending:
+            self._pending = True
+            self.schedule(self.flush)
+
+    def flush(self, selection=None):
+        """Update highlights from the current (or given) selection"""
+        self._pending = False
+        if selection is None:
+            selection = cmds.ls(selection=True) or []
+
+        button_ids = self.controller.get_node_index().buttons_for_nodes(selection)
+        added = button_ids - self.highlighted
+        removed = self.highlighted - button_ids
+        self.highlighted = button_ids
+
+        if added or removed:
+            self.on_highlight(added, removed)
@@ -1,53 +1,178 @@
 # utils/svg_utils.py
+import base64
+import hashlib
+import math
 import os
 import tempfile
+from collections import OrderedDict
 from PySide2 import QtWidgets, QtCore, QtGui, QtSvg
 
+EMBEDDED_PREFIX = "svg:"
+
+def content_key(data: bytes) -> str:
+    """Source key of an embedded SVG payload, the same for identical content"""
+    return EMBEDDED_PREFIX + hashlib.sha1(data).hexdigest()[:16]
+
 class SVGUtils:
-    def __init__(self):
-        self.svg_renderer = QtSvg.QSvgRenderer()
-        
+    """SVG loading and rendering with shared caches.
+
+    Parsed renderers are kept per file and reparsed only when the file's
+    mtime changes; embedded payloads are registered once per content hash.
+    Rendered pixmaps are kept in an LRU of at most `max_bytes`, keyed by
+    source, pixel size and device pixel ratio, so repainting an SVG button is
+    a pixmap blit. With a `cache_dir` rendered pixmaps are also saved as PNGs
+    and reused across sessions.
+    """
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, cache_dir=None):
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self.renderers = {}  # path -> (mtime_ns, QSvgRenderer)
+        self.embedded = {}  # content key -> QSvgRenderer
+        self.pixmaps = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def renderer(self, source):
+        """Parsed renderer of an SVG file or embedded key, None if it cannot be loaded"""
+        if source.startswith(EMBEDDED_PREFIX):
+            return self.embedded.get(source)
+        try:
+            mtime = os.stat(source).st_mtime_ns
+        except OSError:
+            return None
+        cached = self.renderers.get(source)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        if cached:
+            self._drop_pixmaps(source)
+        renderer = QtSvg.QSvgRenderer()
+        if not renderer.load(source):
+            self.renderers.pop(source, None)
+            return None
+        self.renderers[source] = (mtime, renderer)
+        return renderer
+
+    def add_svg_data(self, data) -> str:
+        """Register an embedded SVG payload and return its source key"""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        key = content_key(data)
+        if key not in self.embedded:
+            renderer = QtSvg.QSvgRenderer(QtCore.QByteArray(data))
+            if not renderer.isValid():
+                return None
+            self.embedded[key] = renderer
+        return key
+
     def load_svg(self, file_path):
         """Load an SVG file"""
-        return self.svg_renderer.load(file_path)
-        
-    def render_svg(self, file_path, size):
-        """Render SVG to a pixmap at the given size"""
-        if not self.svg_renderer.load(file_path):
-            return None
-            
-        pixmap = QtGui.QPixmap(size)
-        pixmap.fill(QtCore.Qt.transparent)
-        
-        painter = QtGui.QPainter(pixmap)
-        self.svg_renderer.render(painter)
-        painter.end()
-        
+        return self.renderer(file_path) is not None
+
+    @staticmethod
+    def pixel_ratio(scale: float) -> float:
+        """Device pixel ratio to render at for a view scale, a power of two so zooming reuses pixmaps"""
+        return 2.0 ** max(-4, min(4, math.ceil(math.log2(max(scale, 1e-6)))))
+
+    def render_svg(self, file_path, size, device_pixel_ratio: float = 1.0):
+        """Render SVG to a pixmap at the given size, served from the cache when possible"""
+        pixel_width = max(1, math.ceil(size.width() * device_pixel_ratio))
+        pixel_height = max(1, math.ceil(size.height() * device_pixel_ratio))
+        key = (file_path, pixel_width, pixel_height, device_pixel_ratio)
+        pixmap = self.pixmaps.get(key)
+        if pixmap is not None:
+            self.pixmaps.move_to_end(key)
+            self.hits += 1
+            return pixmap
+        self.misses += 1
+
+        disk_path = self._disk_path(key)
+        if disk_path and os.path.exists(disk_path):
+            pixmap = QtGui.QPixmap(disk_path)
+        if pixmap is None or pixmap.isNull():
+            renderer = self.renderer(file_path)
+            if renderer is None:
+                return None
+            pixmap = QtGui.QPixmap(pixel_width, pixel_height)
+            pixmap.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            renderer.render(painter)
+            painter.end()
+            if disk_path:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                pixmap.save(disk_path, "PNG")
+        pixmap.setDevicePixelRatio(device_pixel_ratio)
+
+        self.pixmaps[key] = pixmap
+        self.bytes += pixel_width * pixel_height * 4
+        while self.bytes > self.max_bytes and len(self.pixmaps) > 1:
+            self._pop_pixmap(next(iter(self.pixmaps)))
         return pixmap
+
+    def reload_changed(self):
+        """Drop renderers and pixmaps of SVG files changed on disk since they were parsed"""
+        for path, (mtime, _renderer) in list(self.renderers.items()):
+            try:
+                current = os.stat(path).st_mtime_ns
+            except OSError:
+                current = None
+            if current != mtime:
+                del self.renderers[path]
+                self._drop_pixmaps(path)
+
+    def clear(self):
+        self.renderers.clear()
+        self.embedded.clear()
+        self.pixmaps.clear()
+        self.bytes = 0
+
+    def _pop_pixmap(self, key):
+        self.pixmaps.pop(key)
+        self.bytes -= key[1] * key[2] * 4
+
+    def _drop_pixmaps(self, source):
+        for key in [key for key in self.pixmaps if key[0] == source]:
+            self._pop_pixmap(key)
+
+    def _disk_path(self, key):
+        if not self.cache_dir:
+            return None
+        source, pixel_width, pixel_height, ratio = key
+        if not source.startswith(EMBEDDED_PREFIX):
+            try:
+                stat = os.stat(source)
+            except OSError:
+                return None
+            # Changes to the file give new cache entries
+            source = f"{os.path.abspath(source)}|{stat.st_mtime_ns}|{stat.st_size}"
+        name = hashlib.sha1(f"{source}|{pixel_width}x{pixel_height}@{ratio}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, name + ".png")
         
     def svg_to_base64(self, file_path):
         """Convert SVG file to base64 string for embedding"""
         with open(file_path, 'rb') as f:
-            return f.read().encode('base64')
+            return base64.b64encode(f.read()).decode('ascii')
             
     def base64_to_svg(self, base64_str, file_path=None):
         """Convert base64 string to SVG file"""
-        svg_data = base64_str.decode('base64')
+        svg_data = base64.b64decode(base64_str)
         
         if file_path:
             with open(file_path, 'wb') as f:
                 f.write(svg_data)
             return file_path
         else:
-            # Create temporary file
-            fd, temp_path = tempfile.mkstemp(suffix='.svg')
-            with os.fdopen(fd, 'wb') as f:
-                f.write(svg_data)
+            # One temporary file per distinct payload
+            temp_path = os.path.join(tempfile.gettempdir(), f"picker_{content_key(svg_data)[len(EMBEDDED_PREFIX):]}.svg")
+            if not os.path.exists(temp_path):
+                with open(temp_path, 'wb') as f:
+                    f.write(svg_data)
             return temp_path
             
     def create_svg_button(self, svg_path, position, size):
         """Create a button from an SVG file"""
-        from ..core.model import BaseButton, ButtonType
+        from core.model import BaseButton, ButtonType
         
         button = BaseButton(
             id=f"svg_button_{hash(svg_path)}_{position.x}_{position.y}",
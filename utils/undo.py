@@ -11,6 +11,18 @@ class MayaUndoChunk:
     def __exit__(self, exc_type, exc_val, exc_tb):
         cmds.undoInfo(closeChunk=True)
 
+class MayaUndoSuspended:
+    """Context manager that keeps Maya commands out of the undo queue"""
+    def __enter__(self):
+        self.was_enabled = cmds.undoInfo(query=True, state=True)
+        if self.was_enabled:
+            cmds.undoInfo(stateWithoutFlush=False)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if self.was_enabled:
+            cmds.undoInfo(stateWithoutFlush=True)
+
 class UndoRedoManager:
     def __init__(self, max_history=50):
         self.undo_stack = []